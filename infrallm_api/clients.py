@@ -0,0 +1,36 @@
+"""
+Shared InfraLLM core clients for the API service.
+
+Clients are built once per process and reused across requests.
+"""
+
+from functools import lru_cache
+
+from src.llm.client import ClaudeClient
+from src.terraform.generator import TerraformGenerator
+from src.git.github import GitHubClient
+
+
+@lru_cache(maxsize=1)
+def get_claude_client() -> ClaudeClient:
+    """Return the shared ClaudeClient, constructed on first use."""
+    return ClaudeClient()
+
+
+@lru_cache(maxsize=1)
+def get_github_client() -> GitHubClient:
+    """Return the shared GitHubClient, constructed on first use."""
+    return GitHubClient()
+
+
+@lru_cache(maxsize=1)
+def get_terraform_generator() -> TerraformGenerator:
+    """Return the shared TerraformGenerator, constructed on first use."""
+    return TerraformGenerator()
+
+
+def close_github_client() -> None:
+    """Close the shared GitHubClient if it was constructed."""
+    if get_github_client.cache_info().currsize:
+        get_github_client().close()
+        get_github_client.cache_clear()
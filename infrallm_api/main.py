@@ -4,12 +4,20 @@ InfraLLM FastAPI Application.
 REST API wrapper for InfraLLM core functionality.
 """
 
+import asyncio
+import base64
 import logging
-import uuid
+import logging.handlers
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, BackgroundTasks, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from .models.requests import (
     ProvisionRequest,
@@ -18,10 +26,25 @@ from .models.requests import (
     DryRunResponse,
     RequestStatus,
     StatusResponse,
+    StatusResponseAdapter,
     HealthResponse,
 )
+from src.config.loader import load_policies
+
+from .clients import (
+    close_github_client,
+    get_claude_client,
+    get_github_client,
+    get_terraform_generator,
+)
+from .middleware import AllowlistCORSMiddleware, cors_origins_from_env
+from .semantic_cache import dry_run_cache
 from .store import request_store
-from .worker import process_provision_request
+from .worker import (
+    consume_provision_requests,
+    fail_pending_requests,
+    sweep_request_store,
+)
 from . import __version__
 
 # Configure logging
@@ -31,13 +54,131 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Healthy check results are reused for this many seconds so that frequent
+# polling (load balancers, Backstage) doesn't rebuild SDK clients each time.
+# Degraded results are never reused, so recovery shows up on the next poll.
+HEALTH_CACHE_TTL_SECONDS = 15.0
+HEALTH_PROBE_TIMEOUT_SECONDS = 1.0
+
+# How often completed requests past their TTL are swept from the store
+STORE_SWEEP_INTERVAL_SECONDS = 300.0
+
+# Upper bound on threads used for blocking SDK calls (asyncio.to_thread)
+BLOCKING_IO_MAX_WORKERS = 16
+_health_cache = {"ts": 0.0, "result": None}
+
+# The root document never changes for a given build, so serialize it once
+_ROOT_BODY = orjson.dumps({
+    "name": "InfraLLM API",
+    "version": __version__,
+    "docs": "/docs",
+    "health": "/api/v1/health",
+})
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+def _probe_claude() -> tuple:
+    """Verify the Claude client can be instantiated."""
+    try:
+        get_claude_client()
+        return "claude", "connected"
+    except Exception as e:
+        logger.warning("Claude API check failed: %s", e)
+        return "claude", f"error: {str(e)}"
+
+
+def _probe_github() -> tuple:
+    """Verify the GitHub client can be instantiated."""
+    try:
+        get_github_client()
+        return "github", "connected"
+    except Exception as e:
+        logger.warning("GitHub API check failed: %s", e)
+        return "github", f"error: {str(e)}"
+
+
+async def _run_probe(name: str, probe) -> tuple:
+    """Run a blocking probe off the event loop, bounded by a timeout."""
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(probe), timeout=HEALTH_PROBE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.warning("%s health check timed out", name)
+        return name, "error: timed out"
+
+
+async def _new_request_id() -> str:
+    """Generate an unused request ID from 80 random bits, base32-encoded."""
+    while True:
+        request_id = "req-" + base64.b32encode(os.urandom(10)).decode("ascii").lower()
+        if not await request_store.exists(request_id):
+            return request_id
+
+
+def _health_cache_control(result: HealthResponse) -> str:
+    """Let clients briefly reuse healthy results; never cache degraded ones."""
+    return "max-age=5" if result.status == "healthy" else "no-store"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    # Route log records through a queue so handler I/O happens on a
+    # background thread instead of the event loop
+    root_logger = logging.getLogger()
+    log_handlers = root_logger.handlers[:]
+    log_listener = logging.handlers.QueueListener(
+        queue.SimpleQueue(), *log_handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [logging.handlers.QueueHandler(log_listener.queue)]
+    log_listener.start()
+
     logger.info("Starting InfraLLM API service")
-    yield
-    logger.info("Shutting down InfraLLM API service")
+
+    # Cap the threads used when offloading blocking SDK calls
+    executor = ThreadPoolExecutor(
+        max_workers=BLOCKING_IO_MAX_WORKERS, thread_name_prefix="infrallm-io"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    # Load organizational policies now so the first request doesn't pay for it
+    try:
+        load_policies()
+    except Exception as e:
+        logger.error("Failed to load policies: %s", e)
+
+    # Opens the Redis connection pool when REDIS_URL is set
+    await request_store.connect()
+
+    # Provision requests are processed by a fixed pool of queue consumers
+    app.state.queue = asyncio.Queue()
+    worker_count = os.cpu_count() or 1
+    app.state.workers = [
+        asyncio.create_task(consume_provision_requests(app.state.queue))
+        for _ in range(worker_count)
+    ]
+    logger.info("Started %s provision workers", worker_count)
+
+    sweeper = asyncio.create_task(sweep_request_store(STORE_SWEEP_INTERVAL_SECONDS))
+
+    try:
+        yield
+    finally:
+        logger.info("Shutting down InfraLLM API service")
+        for task in (*app.state.workers, sweeper):
+            task.cancel()
+        await asyncio.gather(*app.state.workers, sweeper, return_exceptions=True)
+        drained = await fail_pending_requests(app.state.queue)
+        if drained:
+            logger.warning("Marked %s unprocessed requests as failed", drained)
+        await request_store.close()
+        # Lets in-flight label requests finish before the threads stop
+        await asyncio.to_thread(close_github_client)
+        executor.shutdown(wait=False)
+
+        log_listener.stop()
+        root_logger.handlers = log_handlers
 
 
 # Create FastAPI app
@@ -46,71 +187,72 @@ app = FastAPI(
     description="AI-powered infrastructure provisioning API for Backstage integration",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware for Backstage
+# CORS middleware for Backstage (set CORS_ORIGINS to restrict origins)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately in production
+    AllowlistCORSMiddleware,
+    allow_origins=cors_origins_from_env(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
 @app.get("/", tags=["root"])
 async def root():
     """Root endpoint with API info."""
-    return {
-        "name": "InfraLLM API",
-        "version": __version__,
-        "docs": "/docs",
-        "health": "/api/v1/health",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 @app.get("/api/v1/health", response_model=HealthResponse, tags=["health"])
-async def health_check():
+async def health_check(response: Response):
     """
     Health check endpoint.
 
     Returns service health status and component checks.
     """
-    checks = {"api": "healthy"}
+    cached = _health_cache["result"]
+    if cached is not None and time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL_SECONDS:
+        response.headers["Cache-Control"] = _health_cache_control(cached)
+        return cached
 
-    # Check Claude API configuration
-    try:
-        from src.llm.client import ClaudeClient
-        ClaudeClient()  # Just verify it can be instantiated
-        checks["claude"] = "connected"
-    except Exception as e:
-        logger.warning(f"Claude API check failed: {str(e)}")
-        checks["claude"] = f"error: {str(e)}"
+    checks = {"api": "healthy"}
 
-    # Check GitHub configuration
-    try:
-        from src.git.github import GitHubClient
-        GitHubClient()  # Just verify it can be instantiated
-        checks["github"] = "connected"
-    except Exception as e:
-        logger.warning(f"GitHub API check failed: {str(e)}")
-        checks["github"] = f"error: {str(e)}"
+    # Check Claude and GitHub configuration concurrently
+    results = await asyncio.gather(
+        _run_probe("claude", _probe_claude),
+        _run_probe("github", _probe_github),
+        return_exceptions=True,
+    )
+    for name, result in zip(("claude", "github"), results):
+        if isinstance(result, BaseException):
+            checks[name] = f"error: {str(result)}"
+        else:
+            checks[result[0]] = result[1]
 
     # Determine overall status
     status = "healthy" if all(v == "healthy" or v == "connected" for v in checks.values()) else "degraded"
 
-    return HealthResponse(
+    result = HealthResponse(
         status=status,
         version=__version__,
         checks=checks,
     )
+    if status == "healthy":
+        _health_cache["ts"] = time.monotonic()
+        _health_cache["result"] = result
+    else:
+        _health_cache["result"] = None
+
+    response.headers["Cache-Control"] = _health_cache_control(result)
+    return result
 
 
 @app.post("/api/v1/provision", response_model=ProvisionResponse, tags=["provision"])
-async def provision_infrastructure(
-    request: ProvisionRequest,
-    background_tasks: BackgroundTasks,
-):
+async def provision_infrastructure(request: ProvisionRequest, http_request: Request):
     """
     Provision infrastructure from natural language request.
 
@@ -123,30 +265,38 @@ async def provision_infrastructure(
     Use the `/api/v1/requests/{request_id}/status` endpoint to poll for completion.
     """
     # Generate unique request ID
-    request_id = f"req-{uuid.uuid4().hex[:12]}"
-
-    logger.info(
-        f"Received provision request {request_id} from {request.requester}: {request.request}"
-    )
+    request_id = await _new_request_id()
 
-    # Store request
-    request_store.create(
+    # Store request, unless an identical request from the same user is
+    # still in flight: don't run it twice
+    duplicate_id = await request_store.create_or_get_duplicate(
         request_id=request_id,
         request_text=request.request,
         requester=request.requester,
         team=request.team,
         service=request.service,
     )
+    if duplicate_id is not None:
+        logger.info("Duplicate provision request from %s, returning %s", request.requester, duplicate_id)
+        return ProvisionResponse(
+            request_id=duplicate_id,
+            status=(await request_store.get(duplicate_id))["status"],
+            message="Identical request already in progress",
+        )
 
-    # Process in background
-    background_tasks.add_task(
-        process_provision_request,
-        request_id=request_id,
-        request_text=request.request,
-        requester=request.requester,
-        environment=request.environment,
+    logger.info(
+        "Received provision request %s from %s: %s",
+        request_id, request.requester, request.request,
     )
 
+    # Hand off to the worker pool
+    await http_request.app.state.queue.put({
+        "request_id": request_id,
+        "request_text": request.request,
+        "requester": request.requester,
+        "environment": request.environment,
+    })
+
     return ProvisionResponse(
         request_id=request_id,
         status=RequestStatus.QUEUED,
@@ -154,8 +304,12 @@ async def provision_infrastructure(
     )
 
 
-@app.get("/api/v1/requests/{request_id}/status", response_model=StatusResponse, tags=["status"])
-async def get_request_status(request_id: str):
+@app.get(
+    "/api/v1/requests/{request_id}/status",
+    responses={200: {"model": StatusResponse}},
+    tags=["status"],
+)
+async def get_request_status(request_id: str, http_request: Request) -> Response:
     """
     Get status of a provision request.
 
@@ -164,13 +318,27 @@ async def get_request_status(request_id: str):
     - PR URL when completed
     - Error message if failed
     - Timestamps
+
+    Responses carry an `ETag`; send it back in `If-None-Match` to get a
+    `304 Not Modified` while the request is unchanged.
     """
-    status_response = request_store.get_status_response(request_id)
+    version = await request_store.get_version(request_id)
 
-    if status_response is None:
+    if version is None:
         raise HTTPException(status_code=404, detail=f"Request {request_id} not found")
 
-    return status_response
+    etag = f'W/"{request_id}-{version}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=1"}
+
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    content = await request_store.get_status_response(request_id)
+    if app.debug:
+        # Stored records skip model validation; check the contract in debug runs
+        StatusResponseAdapter.validate_python(content)
+
+    return ORJSONResponse(content=content, headers=cache_headers)
 
 
 @app.get("/api/v1/requests", tags=["status"])
@@ -183,7 +351,7 @@ async def list_requests(
 
     Returns a list of requests filtered by user, sorted by creation time (newest first).
     """
-    requests = request_store.list_by_user(user, limit=limit)
+    requests = await request_store.list_by_user(user, limit=limit)
 
     return {
         "requests": requests,
@@ -193,7 +361,7 @@ async def list_requests(
 
 
 @app.post("/api/v1/dry-run", response_model=DryRunResponse, tags=["dry-run"])
-async def dry_run(request: DryRunRequest):
+async def dry_run(request: DryRunRequest, response: Response):
     """
     Preview generated Terraform code without creating a PR.
 
@@ -204,53 +372,65 @@ async def dry_run(request: DryRunRequest):
     - Does NOT create any GitHub PR
 
     Use this for testing and previewing before actual provisioning.
+
+    Previews are cached by request text (exact, then near-duplicate match);
+    the `X-Cache` response header reports `HIT` or `MISS`.
     """
-    from src.llm.client import ClaudeClient
     from src.llm.exceptions import (
         ConfigurationError,
         APIError,
         ValidationError as PolicyValidationError,
         ParsingError,
     )
-    from src.terraform.generator import TerraformGenerator
     from src.terraform.exceptions import TerraformGenerationError
 
     try:
-        logger.info(f"Dry-run request: {request.request}")
-
-        # Parse with Claude
-        claude_client = ClaudeClient()
-        requirements = claude_client.parse_infrastructure_request(request.request)
+        logger.info("Dry-run request: %s", request.request)
+
+        cached, tier = dry_run_cache.get(request.request)
+        if cached is not None:
+            logger.info("Dry-run cache hit (%s)", tier)
+            response.headers["X-Cache"] = "HIT"
+            return cached
+
+        # Parse with Claude and render off the event loop, as the worker does
+        claude_client = get_claude_client()
+        requirements = await asyncio.to_thread(
+            claude_client.parse_infrastructure_request, request.request
+        )
 
         # Generate Terraform
-        generator = TerraformGenerator()
-        terraform = generator.generate(requirements)
+        generator = get_terraform_generator()
+        terraform = await asyncio.to_thread(generator.generate, requirements)
 
-        return DryRunResponse(
+        result = DryRunResponse(
             parsed_requirements=requirements,
             terraform_files=terraform.files,
             directory=terraform.get_directory_name(),
         )
+        dry_run_cache.put(request.request, result)
+        response.headers["X-Cache"] = "MISS"
+        return result
 
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {str(e)}")
+        logger.error("Configuration error: %s", e)
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
     except PolicyValidationError as e:
-        logger.error(f"Policy validation failed: {str(e)}")
+        logger.error("Policy validation failed: %s", e)
         violations_str = "; ".join(e.violations) if hasattr(e, "violations") else str(e)
         raise HTTPException(status_code=400, detail=f"Policy validation failed: {violations_str}")
 
     except ParsingError as e:
-        logger.error(f"Parsing error: {str(e)}")
+        logger.error("Parsing error: %s", e)
         raise HTTPException(status_code=400, detail=f"Failed to parse request: {str(e)}")
 
     except TerraformGenerationError as e:
-        logger.error(f"Terraform generation error: {str(e)}")
+        logger.error("Terraform generation error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate Terraform: {str(e)}")
 
     except APIError as e:
-        logger.error(f"API error: {str(e)}")
+        logger.error("API error: %s", e)
         raise HTTPException(status_code=502, detail=f"External API error: {str(e)}")
 
     except Exception as e:
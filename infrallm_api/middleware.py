@@ -0,0 +1,40 @@
+"""
+HTTP middleware for the InfraLLM API.
+"""
+
+import os
+from typing import FrozenSet, Sequence
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+def cors_origins_from_env() -> Sequence[str]:
+    """
+    Read allowed CORS origins from the comma-separated CORS_ORIGINS variable.
+
+    Returns:
+        List of origins, or ["*"] when CORS_ORIGINS is not set
+    """
+    raw = os.getenv("CORS_ORIGINS", "").strip()
+    if not raw:
+        return ["*"]
+    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+
+
+class AllowlistCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware with a frozenset origin lookup.
+
+    Exact origins are matched against the frozenset first; anything else
+    falls back to the stock check, so allow_origin_regex keeps working.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._allowed_origins: FrozenSet[str] = frozenset(allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if origin in self._allowed_origins:
+            return True
+        return super().is_allowed_origin(origin)
@@ -9,6 +9,7 @@ from .requests import (
     DryRunResponse,
     RequestStatus,
     StatusResponse,
+    StatusResponseAdapter,
     HealthResponse,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     "DryRunResponse",
     "RequestStatus",
     "StatusResponse",
+    "StatusResponseAdapter",
     "HealthResponse",
 ]
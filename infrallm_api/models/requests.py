@@ -5,7 +5,7 @@ Request and response models for the InfraLLM API.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RequestStatus(str, Enum):
@@ -86,6 +86,10 @@ class StatusResponse(BaseModel):
     completed_at: Optional[datetime] = Field(None, description="Request completion timestamp")
 
 
+# Prebuilt validator for StatusResponse-shaped dicts, resolved once at import
+StatusResponseAdapter = TypeAdapter(StatusResponse)
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str = Field(..., description="Service health status")
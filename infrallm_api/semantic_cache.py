@@ -0,0 +1,114 @@
+"""
+Response cache for dry-run previews.
+
+Dry-run output depends only on the request text, so repeated or lightly
+reworded requests can be answered without another Claude round-trip.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words that may differ between two requests without changing their meaning
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "for", "with", "and", "of", "to", "in", "on", "our",
+    "my", "me", "i", "we", "need", "want", "please", "some", "new", "create",
+    "set", "up", "provision",
+})
+
+
+def _content_tokens(text: str) -> Tuple[str, ...]:
+    """Split text into its lowercase word/number tokens, in order, minus filler words."""
+    return tuple(
+        token for token in _TOKEN_RE.findall(text.lower())
+        if token not in _FILLER_WORDS
+    )
+
+
+class SemanticCache:
+    """
+    Two-tier cache keyed by request text.
+
+    Tier 1 is an exact match on the normalized text. Tier 2 matches a
+    request whose tokens, in order, are the same once filler words are
+    dropped, so "5 nodes" never matches "6 nodes", and "staging copy of
+    prod" never matches "prod copy of staging".
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        # key -> (value, content tokens, stored_at)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # content tokens -> key of the most recent entry with them
+        self._by_content: Dict[Tuple[str, ...], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def get(self, text: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached value for the request text.
+
+        Returns:
+            Tuple of (value, tier) where tier is "exact" or "similar",
+            or (None, None) on a miss
+        """
+        key = self._key(text)
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0], "exact"
+
+            similar_key = self._by_content.get(_content_tokens(text))
+            if similar_key is None:
+                return None, None
+            self._entries.move_to_end(similar_key)
+            return self._entries[similar_key][0], "similar"
+
+    def put(self, text: str, value: Any) -> None:
+        """Store a value for the request text."""
+        content = _content_tokens(text)
+
+        with self._lock:
+            key = self._key(text)
+            self._entries[key] = (value, content, time.monotonic())
+            self._entries.move_to_end(key)
+            self._by_content[content] = key
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._by_content.clear()
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its content index (caller holds the lock)."""
+        _, content, _ = self._entries.pop(key)
+        if self._by_content.get(content) == key:
+            del self._by_content[content]
+
+    def _expire(self, now: float) -> None:
+        """Drop entries older than the TTL (caller holds the lock)."""
+        expired = [k for k, entry in self._entries.items() if now - entry[2] > self._ttl]
+        for k in expired:
+            self._remove(k)
+
+
+# Shared cache for the /dry-run endpoint
+dry_run_cache = SemanticCache()
@@ -1,21 +1,115 @@
 """
 In-memory store for tracking provision requests.
 
-In production, this should be replaced with Redis or PostgreSQL.
+Set REDIS_URL to share requests across API worker processes via Redis
+(see store_redis.py); otherwise requests are kept in this process.
 """
 
-from datetime import datetime
-from typing import Dict, Optional
-from .models.requests import RequestStatus, StatusResponse
+import hashlib
+import os
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from .models.requests import RequestStatus
+
+
+# Maximum number of requests held before the least recently touched completed
+# or failed ones are evicted; requests still in progress are never evicted
+MAX_RECORDS = 10_000
+
+# Completed requests older than this are removed by evict_expired()
+COMPLETED_TTL = timedelta(hours=24)
+
+# Window in which an identical in-flight request from the same requester is
+# treated as a duplicate rather than processed again
+DEDUPE_WINDOW_SECONDS = 60.0
+
+_ACTIVE_STATUSES = frozenset({
+    RequestStatus.QUEUED,
+    RequestStatus.PARSING,
+    RequestStatus.GENERATING,
+    RequestStatus.CREATING_PR,
+})
+
+
+def _dedupe_key(requester: str, request_text: str) -> str:
+    """Hash a requester and normalized request text into a dedupe key."""
+    normalized = f"{requester}\0{request_text.strip().lower()}"
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+# Fields exposed through StatusResponse, in model order
+_STATUS_FIELDS = (
+    "request_id",
+    "request_text",
+    "requester",
+    "team",
+    "service",
+    "status",
+    "pr_url",
+    "pr_number",
+    "branch_name",
+    "error",
+    "requirements",
+    "completed_at",
+)
+
+
+@dataclass
+class RequestRecord:
+    """
+    A single tracked provision request.
+
+    Uses __slots__ so that each record is a compact fixed-layout object
+    rather than a per-request dict.
+    """
+
+    __slots__ = _STATUS_FIELDS + ("created_ns", "version")
+
+    request_id: str
+    request_text: str
+    requester: str
+    team: Optional[str]
+    service: Optional[str]
+    status: RequestStatus
+    pr_url: Optional[str]
+    pr_number: Optional[int]
+    branch_name: Optional[str]
+    error: Optional[str]
+    requirements: Optional[Dict[str, Any]]
+    completed_at: Optional[datetime]
+    # Creation time in integer nanoseconds, converted to datetime on read
+    created_ns: int
+    # Bumped on every update so pollers can detect unchanged records
+    version: int
+
+    def to_dict(self) -> dict:
+        """Convert to a StatusResponse-shaped dictionary."""
+        data = {name: getattr(self, name) for name in _STATUS_FIELDS}
+        data["created_at"] = datetime.fromtimestamp(self.created_ns / 1e9, tz=timezone.utc)
+        return data
 
 
 class RequestStore:
-    """In-memory storage for provision requests."""
+    """
+    In-memory storage for provision requests.
+
+    Methods are async only to share an interface with RedisRequestStore;
+    none of them actually wait on anything.
+    """
 
-    def __init__(self):
-        self._store: Dict[str, dict] = {}
+    def __init__(self, max_records: int = MAX_RECORDS):
+        # Ordered least to most recently created/updated
+        self._store: "OrderedDict[str, RequestRecord]" = OrderedDict()
+        # Request IDs per requester in creation order (oldest first)
+        self._by_user: Dict[str, List[str]] = defaultdict(list)
+        self._max_records = max_records
+        self.evictions: Dict[str, int] = {"capacity": 0, "expired": 0}
+        # Dedupe key -> (request_id, monotonic creation time)
+        self._dedupe: Dict[str, Tuple[str, float]] = {}
 
-    def create(
+    async def create(
         self,
         request_id: str,
         request_text: str,
@@ -24,53 +118,195 @@ class RequestStore:
         service: Optional[str] = None,
     ) -> None:
         """Create a new request entry."""
-        self._store[request_id] = {
-            "request_id": request_id,
-            "request_text": request_text,
-            "requester": requester,
-            "team": team,
-            "service": service,
-            "status": RequestStatus.QUEUED,
-            "created_at": datetime.utcnow(),
-            "pr_url": None,
-            "pr_number": None,
-            "branch_name": None,
-            "error": None,
-            "requirements": None,
-            "completed_at": None,
-        }
-
-    def update(self, request_id: str, **fields) -> None:
+        self._insert(request_id, request_text, requester, team, service)
+
+    async def create_or_get_duplicate(
+        self,
+        request_id: str,
+        request_text: str,
+        requester: str,
+        team: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Create a new request entry unless an identical one is in progress.
+
+        The duplicate check and the insert run without suspending, so no
+        other request can slip in between them on the event loop.
+
+        Args:
+            request_id: ID for the new request
+            request_text: Natural language request
+            requester: Email or username of requester
+            team: Requesting team
+            service: Service the request is for
+
+        Returns:
+            Request ID of the in-progress duplicate, or None if the request
+            was created
+        """
+        duplicate_id = self._find_active_duplicate(requester, request_text)
+        if duplicate_id is not None:
+            return duplicate_id
+        self._insert(request_id, request_text, requester, team, service)
+        return None
+
+    def _insert(
+        self,
+        request_id: str,
+        request_text: str,
+        requester: str,
+        team: Optional[str],
+        service: Optional[str],
+    ) -> None:
+        """Add a request entry, evicting finished ones over capacity."""
+        self._store[request_id] = RequestRecord(
+            request_id=request_id,
+            request_text=request_text,
+            requester=requester,
+            team=team,
+            service=service,
+            status=RequestStatus.QUEUED,
+            pr_url=None,
+            pr_number=None,
+            branch_name=None,
+            error=None,
+            requirements=None,
+            completed_at=None,
+            created_ns=time.time_ns(),
+            version=0,
+        )
+        self._store.move_to_end(request_id)
+        self._by_user[requester].append(request_id)
+        self._dedupe[_dedupe_key(requester, request_text)] = (request_id, time.monotonic())
+
+        while len(self._store) > self._max_records:
+            oldest_id = self._oldest_finished()
+            if oldest_id is None:
+                # Everything held is still in progress; evicting any of it
+                # would make the worker's next update fail
+                break
+            self._remove(oldest_id)
+            self.evictions["capacity"] += 1
+
+    async def connect(self) -> None:
+        """Nothing to connect; matches RedisRequestStore."""
+
+    async def close(self) -> None:
+        """Nothing to close; matches RedisRequestStore."""
+
+    def _oldest_finished(self) -> Optional[str]:
+        """Get the least recently touched completed or failed request, if any."""
+        for request_id, record in self._store.items():
+            if record.status not in _ACTIVE_STATUSES:
+                return request_id
+        return None
+
+    def _remove(self, request_id: str) -> None:
+        """Remove a request and its requester index entry."""
+        record = self._store.pop(request_id)
+        user_ids = self._by_user[record.requester]
+        user_ids.remove(request_id)
+        if not user_ids:
+            del self._by_user[record.requester]
+        key = _dedupe_key(record.requester, record.request_text)
+        if self._dedupe.get(key, (None,))[0] == request_id:
+            del self._dedupe[key]
+
+    def _find_active_duplicate(self, requester: str, request_text: str) -> Optional[str]:
+        """
+        Find a recent, still in-progress request with the same text.
+
+        Args:
+            requester: Email or username of requester
+            request_text: Natural language request
+
+        Returns:
+            Request ID of the duplicate, or None if there is none
+        """
+        entry = self._dedupe.get(_dedupe_key(requester, request_text))
+        if entry is None:
+            return None
+        request_id, created = entry
+        if time.monotonic() - created > DEDUPE_WINDOW_SECONDS:
+            return None
+        record = self._store.get(request_id)
+        if record is None or record.status not in _ACTIVE_STATUSES:
+            return None
+        return request_id
+
+    async def evict_expired(self, ttl: timedelta = COMPLETED_TTL) -> int:
+        """
+        Remove completed or failed requests that finished longer than ttl ago.
+
+        Returns:
+            Number of requests evicted
+        """
+        cutoff = datetime.now(timezone.utc) - ttl
+        expired = [
+            request_id for request_id, record in self._store.items()
+            if record.completed_at is not None and record.completed_at < cutoff
+        ]
+        for request_id in expired:
+            self._remove(request_id)
+        self.evictions["expired"] += len(expired)
+        return len(expired)
+
+    async def update(self, request_id: str, **fields) -> None:
         """Update request fields."""
-        if request_id not in self._store:
+        record = self._store.get(request_id)
+        if record is None:
             raise KeyError(f"Request {request_id} not found")
-        self._store[request_id].update(fields)
+        for name, value in fields.items():
+            setattr(record, name, value)
+        record.version += 1
+        self._store.move_to_end(request_id)
 
-    def get(self, request_id: str) -> Optional[dict]:
+    async def get_version(self, request_id: str) -> Optional[int]:
+        """Get the current version counter of a request."""
+        record = self._store.get(request_id)
+        return None if record is None else record.version
+
+    async def get(self, request_id: str) -> Optional[dict]:
         """Get request by ID."""
-        return self._store.get(request_id)
+        record = self._store.get(request_id)
+        if record is None:
+            return None
+        return record.to_dict()
+
+    async def get_status_response(self, request_id: str) -> Optional[dict]:
+        """
+        Get request in StatusResponse shape, ready for JSON serialization.
 
-    def get_status_response(self, request_id: str) -> Optional[StatusResponse]:
-        """Get request as StatusResponse model."""
-        data = self.get(request_id)
-        if data is None:
+        The stored fields are already validated when written, so the dict is
+        returned as-is rather than being re-validated through the model.
+        """
+        record = self._store.get(request_id)
+        if record is None:
             return None
-        return StatusResponse(**data)
+        data = record.to_dict()
+        data["status"] = RequestStatus(record.status).value
+        return data
 
-    def list_by_user(self, requester: str, limit: int = 20) -> list[dict]:
+    async def list_by_user(self, requester: str, limit: int = 20) -> list[dict]:
         """List requests by user."""
-        user_requests = [
-            req for req in self._store.values()
-            if req["requester"] == requester
-        ]
-        # Sort by created_at descending
-        user_requests.sort(key=lambda x: x["created_at"], reverse=True)
-        return user_requests[:limit]
+        # The index is already in creation order, so newest-first is a reversed slice
+        user_ids = self._by_user.get(requester, ())[-limit:][::-1]
+        return [self._store[request_id].to_dict() for request_id in user_ids]
 
-    def exists(self, request_id: str) -> bool:
+    async def exists(self, request_id: str) -> bool:
         """Check if request exists."""
         return request_id in self._store
 
 
+def _create_store():
+    """Use Redis when REDIS_URL is set, otherwise keep requests in memory."""
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        from .store_redis import RedisRequestStore
+        return RedisRequestStore(redis_url)
+    return RequestStore()
+
+
 # Global instance (in production, use dependency injection)
-request_store = RequestStore()
+request_store = _create_store()
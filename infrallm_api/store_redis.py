@@ -0,0 +1,254 @@
+"""
+Redis-backed store for tracking provision requests.
+
+Drop-in replacement for the in-memory RequestStore, shared by every API
+worker process. Enabled by setting REDIS_URL. Uses the redis.asyncio
+client, so store calls never block the event loop; its connection pool is
+created by connect() in the API lifespan.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio
+
+from .models.requests import RequestStatus
+from .store import (
+    COMPLETED_TTL,
+    DEDUPE_WINDOW_SECONDS,
+    _ACTIVE_STATUSES,
+    _STATUS_FIELDS,
+    _dedupe_key,
+)
+
+
+# Returns the ID of an in-progress request holding the dedupe key (KEYS[1]),
+# or else claims the key and creates the request hash (KEYS[2]) and its
+# per-user index entry (KEYS[3]) in the same atomic step.
+# ARGV: request ID, dedupe window, TTL, created_ns, active status count,
+# the encoded active statuses, then the hash's field/value pairs.
+_CREATE_OR_GET_DUPLICATE_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+local active_count = tonumber(ARGV[5])
+if existing then
+    local status = redis.call('HGET', 'req:' .. existing, 'status')
+    for i = 6, 5 + active_count do
+        if status == ARGV[i] then
+            return existing
+        end
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('HSET', KEYS[2], unpack(ARGV, 6 + active_count))
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('ZADD', KEYS[3], ARGV[4], ARGV[1])
+redis.call('EXPIRE', KEYS[3], ARGV[3])
+return false
+"""
+
+
+def _encode(value: Any) -> str:
+    """Encode a field value for storage in a Redis hash."""
+    if isinstance(value, datetime):
+        return json.dumps(value.isoformat())
+    return json.dumps(value)
+
+
+def _new_request_mapping(
+    request_id: str,
+    request_text: str,
+    requester: str,
+    team: Optional[str],
+    service: Optional[str],
+) -> Dict[str, Any]:
+    """Build the Redis hash for a newly queued request."""
+    fields = {name: None for name in _STATUS_FIELDS}
+    fields.update(
+        request_id=request_id,
+        request_text=request_text,
+        requester=requester,
+        team=team,
+        service=service,
+        status=RequestStatus.QUEUED,
+    )
+    mapping = {name: _encode(value) for name, value in fields.items()}
+    mapping["created_ns"] = time.time_ns()
+    mapping["version"] = 0
+    return mapping
+
+
+class RedisRequestStore:
+    """Redis storage for provision requests with the RequestStore interface."""
+
+    def __init__(self, url: str, ttl: timedelta = COMPLETED_TTL):
+        self._url = url
+        # Created by connect(), in the running event loop
+        self._pool: Optional[redis.asyncio.ConnectionPool] = None
+        self._redis: Optional[redis.asyncio.Redis] = None
+        self._create_or_get_duplicate = None
+        self._ttl_seconds = int(ttl.total_seconds())
+        # Redis expires keys itself; kept for interface parity
+        self.evictions: Dict[str, int] = {"capacity": 0, "expired": 0}
+
+    async def connect(self) -> None:
+        """Create the connection pool; called once at application startup."""
+        self._pool = redis.asyncio.ConnectionPool.from_url(self._url, decode_responses=True)
+        self._redis = redis.asyncio.Redis(connection_pool=self._pool)
+        self._create_or_get_duplicate = self._redis.register_script(
+            _CREATE_OR_GET_DUPLICATE_SCRIPT
+        )
+
+    async def close(self) -> None:
+        """Close the client and its connection pool at application shutdown."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            await self._pool.disconnect()
+            self._redis = None
+            self._pool = None
+
+    @staticmethod
+    def _request_key(request_id: str) -> str:
+        return f"req:{request_id}"
+
+    @staticmethod
+    def _user_key(requester: str) -> str:
+        return f"user:{requester}:reqs"
+
+    async def create(
+        self,
+        request_id: str,
+        request_text: str,
+        requester: str,
+        team: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> None:
+        """Create a new request entry."""
+        mapping = _new_request_mapping(request_id, request_text, requester, team, service)
+        key = self._request_key(request_id)
+        user_key = self._user_key(requester)
+        async with self._redis.pipeline() as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._ttl_seconds)
+            pipe.zadd(user_key, {request_id: mapping["created_ns"]})
+            pipe.expire(user_key, self._ttl_seconds)
+            pipe.set(
+                f"dedupe:{_dedupe_key(requester, request_text)}",
+                request_id,
+                ex=int(DEDUPE_WINDOW_SECONDS),
+            )
+            await pipe.execute()
+
+    async def create_or_get_duplicate(
+        self,
+        request_id: str,
+        request_text: str,
+        requester: str,
+        team: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Create a new request entry unless an identical one is in progress.
+
+        The duplicate check and the insert run as one Lua script, so
+        concurrent identical requests from any worker create one entry.
+
+        Returns:
+            Request ID of the in-progress duplicate, or None if the request
+            was created
+        """
+        mapping = _new_request_mapping(request_id, request_text, requester, team, service)
+        active = [_encode(status) for status in _ACTIVE_STATUSES]
+        return await self._create_or_get_duplicate(
+            keys=[
+                f"dedupe:{_dedupe_key(requester, request_text)}",
+                self._request_key(request_id),
+                self._user_key(requester),
+            ],
+            args=[
+                request_id,
+                int(DEDUPE_WINDOW_SECONDS),
+                self._ttl_seconds,
+                mapping["created_ns"],
+                len(active),
+                *active,
+                *(item for pair in mapping.items() for item in pair),
+            ],
+        )
+
+    async def update(self, request_id: str, **fields) -> None:
+        """Update request fields."""
+        key = self._request_key(request_id)
+        if not await self._redis.exists(key):
+            raise KeyError(f"Request {request_id} not found")
+        async with self._redis.pipeline() as pipe:
+            if fields:
+                pipe.hset(key, mapping={name: _encode(value) for name, value in fields.items()})
+            pipe.hincrby(key, "version", 1)
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
+
+    async def get_version(self, request_id: str) -> Optional[int]:
+        """Get the current version counter of a request."""
+        version = await self._redis.hget(self._request_key(request_id), "version")
+        return None if version is None else int(version)
+
+    @staticmethod
+    def _decode(raw: Dict[str, str]) -> dict:
+        """Convert a Redis hash back to a StatusResponse-shaped dictionary."""
+        data = {name: json.loads(raw[name]) for name in _STATUS_FIELDS}
+        data["created_at"] = datetime.fromtimestamp(int(raw["created_ns"]) / 1e9, tz=timezone.utc)
+        return data
+
+    async def get(self, request_id: str) -> Optional[dict]:
+        """Get request by ID."""
+        raw = await self._redis.hgetall(self._request_key(request_id))
+        if not raw:
+            return None
+        return self._decode(raw)
+
+    async def get_status_response(self, request_id: str) -> Optional[dict]:
+        """Get request in StatusResponse shape, ready for JSON serialization."""
+        return await self.get(request_id)
+
+    async def list_by_user(self, requester: str, limit: int = 20) -> List[dict]:
+        """List requests by user, newest first."""
+        user_key = self._user_key(requester)
+        request_ids = await self._redis.zrevrange(user_key, 0, limit - 1)
+        if not request_ids:
+            return []
+
+        async with self._redis.pipeline() as pipe:
+            for request_id in request_ids:
+                pipe.hgetall(self._request_key(request_id))
+            results = await pipe.execute()
+
+        requests = []
+        expired = []
+        for request_id, raw in zip(request_ids, results):
+            if raw:
+                requests.append(self._decode(raw))
+            else:
+                expired.append(request_id)
+        if expired:
+            await self._redis.zrem(user_key, *expired)
+        return requests
+
+    async def evict_expired(self, ttl: timedelta = COMPLETED_TTL) -> int:
+        """
+        Nothing to sweep: expiry is left to Redis key TTLs.
+
+        Every create() and update() resets the request key's TTL, so a
+        request expires that long after its last change, which for a
+        finished request is its completion. Entries in the per-user index
+        that point at expired keys are pruned by list_by_user().
+
+        Returns:
+            Always 0
+        """
+        return 0
+
+    async def exists(self, request_id: str) -> bool:
+        """Check if request exists."""
+        return bool(await self._redis.exists(self._request_key(request_id)))
@@ -2,22 +2,21 @@
 Background worker for processing provision requests.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
-from src.llm.client import ClaudeClient
 from src.llm.exceptions import (
     ConfigurationError,
     APIError,
     ValidationError as PolicyValidationError,
     ParsingError,
 )
-from src.terraform.generator import TerraformGenerator
 from src.terraform.exceptions import TerraformGenerationError
-from src.git.github import GitHubClient
 from src.git.exceptions import GitHubError
 
+from .clients import get_claude_client, get_github_client, get_terraform_generator
 from .models.requests import RequestStatus
 from .store import request_store
 
@@ -41,100 +40,145 @@ async def process_provision_request(
     """
     try:
         # Update status: parsing
-        logger.info(f"Starting provision request {request_id}")
-        request_store.update(request_id, status=RequestStatus.PARSING)
+        logger.info("Starting provision request %s", request_id)
+        await request_store.update(request_id, status=RequestStatus.PARSING)
 
         # Parse with Claude
-        logger.info(f"Parsing request {request_id} with Claude")
-        claude_client = ClaudeClient()
-        requirements = claude_client.parse_infrastructure_request(request_text)
+        logger.info("Parsing request %s with Claude", request_id)
+        claude_client = get_claude_client()
+        requirements = await asyncio.to_thread(
+            claude_client.parse_infrastructure_request, request_text
+        )
 
         # Override environment if provided
         if environment:
             requirements["environment"] = environment
 
         # Update status: generating
-        request_store.update(
+        await request_store.update(
             request_id,
             status=RequestStatus.GENERATING,
             requirements=requirements,
         )
 
         # Generate Terraform
-        logger.info(f"Generating Terraform for request {request_id}")
-        generator = TerraformGenerator()
-        terraform = generator.generate(requirements)
+        logger.info("Generating Terraform for request %s", request_id)
+        generator = get_terraform_generator()
+        terraform = await asyncio.to_thread(generator.generate, requirements)
 
         # Update status: creating PR
-        request_store.update(request_id, status=RequestStatus.CREATING_PR)
+        await request_store.update(request_id, status=RequestStatus.CREATING_PR)
 
         # Create GitHub PR
-        logger.info(f"Creating GitHub PR for request {request_id}")
-        github_client = GitHubClient()
-        pr_result = github_client.create_pr(terraform, requirements)
+        logger.info("Creating GitHub PR for request %s", request_id)
+        github_client = get_github_client()
+        pr_result = await asyncio.to_thread(github_client.create_pr, terraform, requirements)
 
         # Update with results: completed
-        logger.info(f"Request {request_id} completed successfully")
-        request_store.update(
+        logger.info("Request %s completed successfully", request_id)
+        await request_store.update(
             request_id,
             status=RequestStatus.COMPLETED,
             pr_url=pr_result["pr_url"],
-            pr_number=pr_result["pr_number"],
+            pr_number=int(pr_result["pr_number"]),
             branch_name=pr_result["branch_name"],
-            completed_at=datetime.utcnow(),
+            completed_at=datetime.now(timezone.utc),
         )
 
     except ConfigurationError as e:
-        logger.error(f"Configuration error for request {request_id}: {str(e)}")
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"Configuration error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
+        logger.error("Configuration error for request %s: %s", request_id, e)
+        await _mark_failed(request_id, "Configuration error", e)
 
     except PolicyValidationError as e:
-        logger.error(f"Policy validation failed for request {request_id}: {str(e)}")
+        logger.error("Policy validation failed for request %s: %s", request_id, e)
         violations_str = "; ".join(e.violations) if hasattr(e, "violations") else str(e)
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"Policy validation failed: {violations_str}",
-            completed_at=datetime.utcnow(),
-        )
+        await _mark_failed(request_id, "Policy validation failed", violations_str)
 
     except ParsingError as e:
-        logger.error(f"Parsing error for request {request_id}: {str(e)}")
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"Failed to parse request: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
+        logger.error("Parsing error for request %s: %s", request_id, e)
+        await _mark_failed(request_id, "Failed to parse request", e)
+
+    except APIError as e:
+        logger.error("Claude API error for request %s: %s", request_id, e)
+        await _mark_failed(request_id, "Claude API error", e)
 
     except TerraformGenerationError as e:
-        logger.error(f"Terraform generation error for request {request_id}: {str(e)}")
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"Failed to generate Terraform: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
+        logger.error("Terraform generation error for request %s: %s", request_id, e)
+        await _mark_failed(request_id, "Failed to generate Terraform", e)
 
-    except (GitHubError, Exception) as e:
-        logger.error(f"GitHub error for request {request_id}: {str(e)}")
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"GitHub error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
+    except GitHubError as e:
+        logger.error("GitHub error for request %s: %s", request_id, e)
+        await _mark_failed(request_id, "GitHub error", e)
 
     except Exception as e:
-        logger.exception(f"Unexpected error for request {request_id}")
-        request_store.update(
-            request_id,
-            status=RequestStatus.FAILED,
-            error=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
+        logger.exception("Unexpected error for request %s", request_id)
+        await _mark_failed(request_id, "Unexpected error", e)
+
+
+async def _mark_failed(request_id: str, prefix: str, error) -> None:
+    """Record a request as failed with a prefixed error message."""
+    await request_store.update(
+        request_id,
+        status=RequestStatus.FAILED,
+        error=f"{prefix}: {error}",
+        completed_at=datetime.now(timezone.utc),
+    )
+
+
+async def _mark_shut_down(request_id: str, error: str) -> None:
+    """Record a request as failed because the service is shutting down."""
+    await request_store.update(
+        request_id,
+        status=RequestStatus.FAILED,
+        error=error,
+        completed_at=datetime.now(timezone.utc),
+    )
+
+
+async def consume_provision_requests(queue: asyncio.Queue) -> None:
+    """
+    Consume provision jobs from the queue until cancelled.
+
+    Each job is a dict of keyword arguments for process_provision_request.
+    """
+    while True:
+        job = await queue.get()
+        try:
+            await process_provision_request(**job)
+        except asyncio.CancelledError:
+            # Shutdown cancelled the job mid-flight; leave it in a terminal
+            # state so pollers don't wait on it forever
+            logger.warning("Request %s interrupted by shutdown", job["request_id"])
+            await _mark_shut_down(job["request_id"], "Service shut down while the request was being processed")
+            raise
+        except Exception:
+            logger.exception("Worker failed to process job %s", job.get("request_id"))
+        finally:
+            queue.task_done()
+
+
+async def fail_pending_requests(queue: asyncio.Queue) -> int:
+    """
+    Drain jobs that were never picked up and mark them as failed.
+
+    Returns:
+        Number of requests that were drained
+    """
+    drained = 0
+    while True:
+        try:
+            job = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return drained
+        await _mark_shut_down(job["request_id"], "Service shut down before the request was processed")
+        queue.task_done()
+        drained += 1
+
+
+async def sweep_request_store(interval_seconds: float) -> None:
+    """Periodically evict expired requests from the store until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        evicted = await request_store.evict_expired()
+        if evicted:
+            logger.info("Evicted %s expired requests from the store", evicted)
@@ -6,15 +6,23 @@ from the policies.yaml file.
 """
 
 import os
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from src.llm.exceptions import ConfigurationError
 
 
+# Loaded policies, populated on the first call to load_policies()
+_POLICIES: Optional[Dict[str, Any]] = None
+
+
 def _get_policies_path() -> Path:
     """
     Get the path to the policies.yaml file.
@@ -71,14 +79,13 @@ def _validate_policies(policies: Dict[str, Any]) -> None:
         )
 
 
-@lru_cache(maxsize=1)
 def load_policies() -> Dict[str, Any]:
     """
     Load and cache organizational policies from policies.yaml.
 
-    This function uses LRU cache to ensure policies are only loaded once
-    during the application lifetime. The cache can be cleared for testing
-    by calling load_policies.cache_clear().
+    Policies are read from disk on the first call and held in a module-level
+    variable for the rest of the application lifetime. Call reload_policies()
+    to force a fresh read (e.g. in tests).
 
     Returns:
         Dictionary containing organizational policies
@@ -91,11 +98,27 @@ def load_policies() -> Dict[str, Any]:
         >>> print(policies['naming']['pattern'])
         '{environment}-{application}-{resource}'
     """
+    global _POLICIES
+    if _POLICIES is None:
+        _POLICIES = _read_policies()
+    return _POLICIES
+
+
+def _read_policies() -> Dict[str, Any]:
+    """
+    Read, parse and validate policies.yaml from disk.
+
+    Returns:
+        Dictionary containing organizational policies
+
+    Raises:
+        ConfigurationError: If policies file is missing or invalid
+    """
     policies_path = _get_policies_path()
 
     try:
         with open(policies_path, 'r') as f:
-            policies = yaml.safe_load(f)
+            policies = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ConfigurationError(
             f"Failed to parse policies.yaml: {str(e)}\n"
@@ -125,5 +148,6 @@ def reload_policies() -> Dict[str, Any]:
     Returns:
         Freshly loaded policies dictionary
     """
-    load_policies.cache_clear()
+    global _POLICIES
+    _POLICIES = None
     return load_policies()
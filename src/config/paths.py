@@ -0,0 +1,24 @@
+"""
+Filesystem locations used by InfraLLM.
+"""
+
+import os
+from pathlib import Path
+
+
+def user_cache_dir() -> Path:
+    """
+    Get the per-user directory for InfraLLM's caches.
+
+    INFRALLM_CACHE_HOME, if set, is used as is; otherwise the directory is
+    $XDG_CACHE_HOME/infrallm, defaulting to ~/.cache/infrallm. The
+    directory is not created here; callers create it when they first write.
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.getenv("INFRALLM_CACHE_HOME")
+    if override:
+        return Path(override).expanduser()
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home) / "infrallm"
@@ -0,0 +1,121 @@
+"""
+Authentication helpers for the GitHub client.
+
+This module wraps PyGithub's token authentication so that a pool of
+tokens can share the load of API requests.
+"""
+
+import functools
+import itertools
+import logging
+import os
+import threading
+from typing import List
+
+from github import Auth, GithubException, GithubRetry, RateLimitExceededException
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses GitHub uses for rate-limited requests
+_RATE_LIMIT_STATUSES = (403, 429)
+
+
+def github_tokens_from_env() -> List[str]:
+    """
+    Collect GitHub tokens from the environment.
+
+    GITHUB_TOKENS may hold a comma-separated pool of tokens; GITHUB_TOKEN,
+    if set, is used first.
+
+    Returns:
+        List of distinct tokens (empty if none are configured)
+    """
+    tokens = []
+    single = os.getenv("GITHUB_TOKEN")
+    if single:
+        tokens.append(single)
+    for token in os.getenv("GITHUB_TOKENS", "").split(","):
+        token = token.strip()
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+class TokenPoolAuth(Auth.Token):
+    """
+    Token authentication that rotates through a pool of tokens.
+
+    PyGithub builds the Authorization header for every request, so each
+    request uses the next token in turn and calls are spread across the
+    per-token rate limits. Transport-level retries resend the same header,
+    so rate-limited requests are re-issued by rotate_on_rate_limit()
+    instead.
+    """
+
+    def __init__(self, tokens: List[str]):
+        """
+        Initialize the token pool.
+
+        Args:
+            tokens: GitHub tokens to rotate through (at least one)
+        """
+        super().__init__(tokens[0])
+        self._pool = itertools.cycle(tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> str:
+        with self._lock:
+            return next(self._pool)
+
+
+class TokenPoolRetry(GithubRetry):
+    """
+    GithubRetry that leaves rate-limited responses to the token pool.
+
+    403 and 429 responses are handed back to PyGithub rather than retried
+    here, where the retry would reuse the rate-limited token and wait for
+    its reset. rotate_on_rate_limit() re-issues them with the next token.
+    Other statuses are retried as usual.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code in _RATE_LIMIT_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def rotate_on_rate_limit(requester, attempts: int) -> None:
+    """
+    Re-issue rate-limited API requests with the next token in the pool.
+
+    Wraps the requester's requestJsonAndCheck, which every REST call made
+    by GitHubClient goes through. Each attempt builds a fresh Authorization
+    header from TokenPoolAuth, so a request rejected with a rate limit is
+    tried again on another token. Once a request has been rate limited on
+    every attempt, the error is raised.
+
+    Args:
+        requester: PyGithub Requester shared by the client's objects
+        attempts: Maximum attempts per request, normally the pool size
+    """
+    request = requester.requestJsonAndCheck
+
+    @functools.wraps(request)
+    def request_with_rotation(*args, **kwargs):
+        for attempt in range(1, attempts + 1):
+            try:
+                return request(*args, **kwargs)
+            except GithubException as e:
+                rate_limited = (
+                    isinstance(e, RateLimitExceededException) or e.status == 429
+                )
+                if not rate_limited or attempt == attempts:
+                    raise
+                logger.warning(
+                    "GitHub token rate limited (attempt %s of %s), retrying with the next token",
+                    attempt, attempts
+                )
+
+    requester.requestJsonAndCheck = request_with_rotation
@@ -6,15 +6,19 @@ including branch creation, file commits, and PR description generation.
 """
 
 import os
+import time
+import hashlib
+import threading
+import shutil
+import secrets
 import logging
-import tempfile
 import subprocess
-from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
-from github import Github, GithubException
-import anthropic
+import jinja2
 
 from src.git.exceptions import (
     ConfigurationError,
@@ -24,12 +28,119 @@ from src.git.exceptions import (
     RepositoryNotFoundError,
     GitHubError
 )
+from src.llm.client import get_anthropic_client
 from src.terraform.models import GeneratedTerraform
 
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# GitHub REST API root used for raw HTTP/2 requests
+GITHUB_API_URL = "https://api.github.com"
+
+# Maximum number of concurrent blob uploads per commit
+BLOB_UPLOAD_WORKERS = 8
+
+# HTTP connections kept open to the GitHub API; sized above the number of
+# threads that can issue requests at once so connections are reused rather
+# than discarded and re-handshaken
+GITHUB_POOL_SIZE = 16
+
+# How long a base branch SHA is reused before it is fetched again
+BASE_REF_TTL_SECONDS = 30.0
+
+# Labels applied to every PR, ahead of the environment and resource labels
+_BASE_LABELS = ("infrastructure", "terraform")
+
+# Number of uploaded blob SHAs remembered to skip re-uploading identical files
+BLOB_CACHE_SIZE = 1024
+
+# Threads for create_pr steps that run alongside the GitHub round trips
+PR_TASK_WORKERS = 4
+
+# Comment line placed between files when they are formatted in one
+# `terraform fmt -` call; blank lines around it keep fmt from aligning
+# attributes across file boundaries
+_FMT_FILE_SEPARATOR = "\n\n# ---- infrallm fmt file boundary ----\n\n"
+
+
+# Default PR description, compiled once at import
+_PR_DESCRIPTION_TEMPLATE = jinja2.Template(
+    """## Infrastructure Provisioning Request
+
+### Summary
+Provisioning **{{ resource_type | upper }}** resource `{{ resource_name }}` in **{{ environment }}** environment.
+
+### Resources Created
+{% for key, value in parameters.items() %}
+- **{{ key }}**: {{ value }}
+{% endfor %}
+
+### Tags Applied
+{% for key, value in tags.items() %}
+- {{ key }}: {{ value }}
+{% endfor %}
+
+### Files Generated
+{% for filename in files %}
+- `{{ filename }}`
+{% endfor %}
+
+### Security Compliance
+- Encryption at rest enabled
+- Following organizational security policies
+- Required tags applied
+
+### Review Checklist
+- [ ] Resource sizing is appropriate
+- [ ] Environment is correct
+- [ ] Tags are complete
+- [ ] Security settings reviewed
+- [ ] Cost impact acceptable
+
+---
+
+Generated by [InfraLLM](https://github.com/your-org/infrallm)
+""",
+    trim_blocks=True,
+    keep_trailing_newline=True
+)
+
+
+def _create_http2_client():
+    """
+    Create an HTTP/2 client for the GitHub REST API.
+
+    Blob uploads are multiplexed over its single connection. Requires the
+    `http2` extra (h2); returns None when it isn't installed, in which case
+    blobs are uploaded through PyGithub instead.
+    """
+    try:
+        import h2  # noqa: F401
+        import httpx
+    except ImportError:
+        return None
+
+    return httpx.Client(
+        http2=True,
+        base_url=GITHUB_API_URL,
+        headers={"Accept": "application/vnd.github+json"},
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+        timeout=15.0
+    )
+
+
+def _git_blob_sha(content: str) -> str:
+    """Compute the SHA-1 Git assigns to a blob with this UTF-8 content."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _terraform_binary() -> Optional[str]:
+    """Locate the terraform executable once per process."""
+    return shutil.which("terraform")
+
 
 class GitHubClient:
     """
@@ -41,14 +152,25 @@ class GitHubClient:
         Initialize GitHub client.
 
         Args:
-            token: GitHub personal access token
+            token: GitHub personal access token. If not provided, reads
+                GITHUB_TOKEN and/or a comma-separated GITHUB_TOKENS pool.
             org: GitHub organization name
             repo: Repository name
 
         Raises:
             ConfigurationError: If required GitHub credentials are missing
         """
-        self.token = token or os.getenv("GITHUB_TOKEN")
+        # Imported here to keep module import cheap
+        from github import Auth, Github, GithubRetry
+        from src.git.auth import (
+            TokenPoolAuth,
+            TokenPoolRetry,
+            github_tokens_from_env,
+            rotate_on_rate_limit,
+        )
+
+        self.tokens = [token] if token else github_tokens_from_env()
+        self.token = self.tokens[0] if self.tokens else None
         self.org = org or os.getenv("GITHUB_ORG")
         self.repo = repo or os.getenv("GITHUB_REPO")
 
@@ -59,10 +181,59 @@ class GitHubClient:
                 "Check your .env file or set these environment variables."
             )
 
-        # Initialize PyGithub client
-        self.github = Github(self.token)
+        # Initialize PyGithub client. 5xx responses are retried with
+        # backoff. With a single token, rate-limited (403 and 429) responses
+        # are retried with the same token, honoring Retry-After and the rate
+        # limit reset time. With several tokens, requests rotate through them
+        # to spread the per-token rate limit, and a rate-limited request is
+        # re-issued straight away with the next token instead.
+        retry_options = dict(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504]
+        )
+        if len(self.tokens) > 1:
+            self._auth = TokenPoolAuth(self.tokens)
+            retry = TokenPoolRetry(**retry_options)
+        else:
+            self._auth = Auth.Token(self.token)
+            retry = GithubRetry(**retry_options)
+        self.github = Github(
+            auth=self._auth,
+            pool_size=GITHUB_POOL_SIZE,
+            retry=retry
+        )
+        if len(self.tokens) > 1:
+            rotate_on_rate_limit(self.github.requester, attempts=len(self.tokens))
+        # PR descriptions come from a template unless Claude is opted into
+        self.llm_pr_description = os.getenv("INFRALLM_LLM_PR_DESC", "0") == "1"
+        # HTTP/2 client for blob uploads, or None to use PyGithub
+        self._http = _create_http2_client()
+        # SHAs of blobs already uploaded by this client, least recently used first
+        self._uploaded_blobs: "OrderedDict[str, None]" = OrderedDict()
+        self._blob_lock = threading.Lock()
+        # Repository handle and base branch refs, reused across PRs
+        self._repo = None
+        self._base_ref_cache: Dict[str, Tuple[Any, float]] = {}
+        # Runs independent steps of create_pr (formatting, PR description,
+        # labels) alongside the GitHub calls on the critical path
+        self._executor = ThreadPoolExecutor(
+            max_workers=PR_TASK_WORKERS,
+            thread_name_prefix="infrallm-github"
+        )
         logger.info(f"Initialized GitHub client for {self.org}/{self.repo}")
 
+    def close(self) -> None:
+        """
+        Release the HTTP/2 connection and the create_pr worker threads.
+
+        Label requests already submitted are allowed to finish. The client
+        must not be used afterwards.
+        """
+        self._executor.shutdown(wait=True)
+        if self._http is not None:
+            self._http.close()
+
     def create_pr(
         self,
         terraform: GeneratedTerraform,
@@ -97,20 +268,38 @@ class GitHubClient:
             >>> print(result['pr_url'])
             'https://github.com/org/repo/pull/123'
         """
+        from github import GithubException
+
         logger.info("Starting PR creation process")
 
         try:
-            # Step 1: Get repository
+            # Step 1: Get repository. This is the only repository lookup in
+            # create_pr: helpers take `repo` as an argument and must not call
+            # _get_repository() or self.github.get_repo() themselves.
             repo = self._get_repository()
 
+            # Start work that doesn't depend on the branch so it overlaps
+            # with the branch and commit round trips
+            if terraform.formatted:
+                logger.info("Terraform files are already formatted, skipping terraform fmt")
+                format_future = None
+            else:
+                format_future = self._executor.submit(
+                    self._format_terraform_files, terraform.files
+                )
+            description_future = self._executor.submit(
+                self.generate_pr_description, terraform, requirements
+            )
+
             # Step 2: Create branch name
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            branch_name = f"infrallm/{terraform.environment}-{terraform.resource_type}-{terraform.resource_name}-{timestamp}"
+            # Random suffix keeps concurrent PRs for the same resource from
+            # colliding, which a one-second timestamp could not guarantee
+            suffix = secrets.token_hex(4)
+            branch_name = f"infrallm/{terraform.environment}-{terraform.resource_type}-{terraform.resource_name}-{suffix}"
             logger.info(f"Creating branch: {branch_name}")
 
             # Step 3: Get base branch reference
-            base_ref = repo.get_git_ref(f"heads/{base_branch}")
-            base_sha = base_ref.object.sha
+            base_sha = self._get_base_sha(repo, base_branch)
 
             # Step 4: Create new branch
             try:
@@ -121,20 +310,24 @@ class GitHubClient:
                 logger.info(f"Created branch {branch_name} from {base_branch}")
             except GithubException as e:
                 logger.error(f"Failed to create branch: {e}")
+                if e.status in (409, 422):
+                    # The cached base SHA may be stale; fetch it next time
+                    self._base_ref_cache.pop(base_branch, None)
                 raise BranchCreationError(
                     f"Failed to create branch '{branch_name}': {str(e)}"
                 )
 
-            # Step 4.5: Format Terraform files
-            try:
-                formatted_files = self._format_terraform_files(terraform.files)
-                # Update terraform object with formatted files
-                terraform.files = formatted_files
-                logger.info(f"Formatted {len(formatted_files)} Terraform files")
-            except Exception as e:
-                logger.warning(f"Failed to format Terraform files: {e}")
-                logger.info("Continuing with unformatted files")
-                # Continue with original files if formatting fails
+            # Step 4.5: Wait for formatted Terraform files
+            if format_future is not None:
+                try:
+                    formatted_files = format_future.result()
+                    # Update terraform object with formatted files
+                    terraform.files = formatted_files
+                    logger.info(f"Formatted {len(formatted_files)} Terraform files")
+                except Exception as e:
+                    logger.warning(f"Failed to format Terraform files: {e}")
+                    logger.info("Continuing with unformatted files")
+                    # Continue with original files if formatting fails
 
             # Step 5: Commit Terraform files
             directory = terraform.get_directory_name()
@@ -143,7 +336,8 @@ class GitHubClient:
             try:
                 self._commit_files(
                     repo=repo,
-                    branch_name=branch_name,
+                    branch_ref=new_ref,
+                    base_sha=base_sha,
                     files=terraform.files,
                     directory=directory,
                     commit_message=commit_message
@@ -153,8 +347,8 @@ class GitHubClient:
                 logger.error(f"Failed to commit files: {e}")
                 raise CommitError(f"Failed to commit Terraform files: {str(e)}")
 
-            # Step 6: Generate PR description
-            pr_description = self.generate_pr_description(terraform, requirements)
+            # Step 6: Wait for PR description (falls back to the template on error)
+            pr_description = description_future.result()
 
             # Step 7: Create pull request
             pr_title = self._generate_pr_title(terraform, requirements)
@@ -168,14 +362,10 @@ class GitHubClient:
                 )
                 logger.info(f"Created PR #{pr.number}: {pr.html_url}")
 
-                # Step 8: Add labels if available
-                try:
-                    labels = self._get_labels(terraform, requirements)
-                    if labels:
-                        pr.add_to_labels(*labels)
-                        logger.info(f"Added labels: {labels}")
-                except Exception as e:
-                    logger.warning(f"Failed to add labels: {e}")
+                # Step 8: Add labels if available, without holding up the result
+                labels = self._get_labels(terraform, requirements)
+                if labels:
+                    self._executor.submit(self._add_labels, pr, labels)
 
                 return {
                     "pr_url": pr.html_url,
@@ -195,20 +385,58 @@ class GitHubClient:
                 )
             raise GitHubError(f"GitHub API error: {str(e)}")
 
+    def _add_labels(self, pr, labels: list):
+        """
+        Add labels to a pull request, logging rather than raising on failure.
+
+        Args:
+            pr: GitHub pull request object
+            labels: Label names to add
+        """
+        try:
+            pr.add_to_labels(*labels)
+            logger.info(f"Added labels: {labels}")
+        except Exception as e:
+            logger.warning(f"Failed to add labels: {e}")
+
+    def prefetch(self, base_branch: str = "main") -> None:
+        """
+        Look up the repository and base branch ahead of create_pr.
+
+        Both are cached on the client, so calling this while the request is
+        still being parsed takes these round trips off create_pr's critical
+        path.
+
+        Args:
+            base_branch: Base branch the next PR will target
+
+        Raises:
+            RepositoryNotFoundError: If repository not found
+        """
+        self._get_base_sha(self._get_repository(), base_branch)
+
     def _get_repository(self):
         """
         Get the GitHub repository object.
 
+        The repository is fetched once and cached on the client.
+
         Returns:
             GitHub repository object
 
         Raises:
             RepositoryNotFoundError: If repository not found
         """
+        if self._repo is not None:
+            return self._repo
+
+        from github import GithubException
+
         try:
             repo_full_name = f"{self.org}/{self.repo}"
             repo = self.github.get_repo(repo_full_name)
             logger.debug(f"Retrieved repository: {repo_full_name}")
+            self._repo = repo
             return repo
         except GithubException as e:
             if e.status == 404:
@@ -217,10 +445,43 @@ class GitHubClient:
                 )
             raise
 
+    def _get_base_sha(self, repo, base_branch: str) -> str:
+        """
+        Get the head commit SHA of the base branch.
+
+        Refs are cached for BASE_REF_TTL_SECONDS so that PRs created in quick
+        succession don't each re-fetch the same ref. After that the cached
+        ref is revalidated with a conditional request, which returns an
+        empty 304 (not counted against the rate limit) if the branch hasn't
+        moved.
+
+        Args:
+            repo: GitHub repository object
+            base_branch: Name of the base branch
+
+        Returns:
+            Commit SHA the new branch should start from
+        """
+        cached = self._base_ref_cache.get(base_branch)
+        if cached is None:
+            base_ref = repo.get_git_ref(f"heads/{base_branch}")
+        else:
+            base_ref, fetched_at = cached
+            if time.monotonic() - fetched_at < BASE_REF_TTL_SECONDS:
+                return base_ref.object.sha
+            # Sends If-None-Match with the stored ETag
+            base_ref.update()
+
+        self._base_ref_cache[base_branch] = (base_ref, time.monotonic())
+        return base_ref.object.sha
+
     def _format_terraform_files(self, files: Dict[str, str]) -> Dict[str, str]:
         """
         Format Terraform files using terraform fmt.
 
+        All .tf files are piped through a single `terraform fmt -` process,
+        joined with a comment separator and split apart again afterwards.
+
         Args:
             files: Dictionary mapping filenames to contents
 
@@ -230,117 +491,172 @@ class GitHubClient:
         Raises:
             Exception: If terraform fmt fails (non-fatal, will be caught by caller)
         """
-        # Check if terraform is installed
+        terraform_bin = _terraform_binary()
+        if terraform_bin is None:
+            logger.warning("terraform command not available, skipping formatting")
+            return files
+
+        tf_names = [filename for filename in files if filename.endswith('.tf')]
+        if not tf_names:
+            return files
+
+        source = _FMT_FILE_SEPARATOR.join(
+            files[filename].rstrip("\n") for filename in tf_names
+        )
+
         try:
             result = subprocess.run(
-                ["terraform", "version"],
+                [terraform_bin, "fmt", "-no-color", "-"],
+                input=source,
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=10
             )
-            if result.returncode != 0:
-                logger.warning("terraform command not found, skipping formatting")
-                return files
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            logger.warning("terraform command not available, skipping formatting")
+        except subprocess.TimeoutExpired:
+            logger.warning("terraform fmt timed out, using original files")
             return files
 
-        # Create temporary directory for formatting
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            formatted_files = {}
-
-            # Write files to temp directory
-            for filename, content in files.items():
-                if filename.endswith('.tf'):
-                    file_path = temp_path / filename
-                    file_path.write_text(content)
-                    logger.debug(f"Wrote {filename} to temp directory")
-                else:
-                    # Non-.tf files don't need formatting
-                    formatted_files[filename] = content
-
-            # Run terraform fmt on all .tf files
-            try:
-                result = subprocess.run(
-                    ["terraform", "fmt"],
-                    cwd=temp_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+        if result.returncode != 0:
+            logger.warning(f"terraform fmt returned non-zero exit code: {result.returncode}")
+            logger.debug(f"stderr: {result.stderr}")
+            return files
 
-                if result.returncode == 0:
-                    logger.info("terraform fmt completed successfully")
-                else:
-                    logger.warning(f"terraform fmt returned non-zero exit code: {result.returncode}")
-                    logger.debug(f"stderr: {result.stderr}")
-
-            except subprocess.TimeoutExpired:
-                logger.warning("terraform fmt timed out, using original files")
-                return files
-
-            # Read formatted files back
-            for filename in files.keys():
-                if filename.endswith('.tf'):
-                    file_path = temp_path / filename
-                    if file_path.exists():
-                        formatted_content = file_path.read_text()
-                        formatted_files[filename] = formatted_content
-                        logger.debug(f"Read formatted {filename}")
-                    else:
-                        # If file doesn't exist, use original
-                        formatted_files[filename] = files[filename]
-
-            return formatted_files
+        chunks = result.stdout.split(_FMT_FILE_SEPARATOR)
+        if len(chunks) != len(tf_names):
+            logger.warning("terraform fmt output could not be split per file, using original files")
+            return files
+
+        logger.info("terraform fmt completed successfully")
+        formatted_files = dict(files)
+        for filename, chunk in zip(tf_names, chunks):
+            formatted_files[filename] = chunk.rstrip("\n") + "\n"
+        return formatted_files
 
     def _commit_files(
         self,
         repo,
-        branch_name: str,
+        branch_ref,
+        base_sha: str,
         files: Dict[str, str],
         directory: str,
         commit_message: str
     ):
         """
-        Commit multiple files to a branch.
+        Commit multiple files to a branch as a single commit.
+
+        Uses the Git Data API: one blob per file (uploaded concurrently), then
+        one tree, one commit and a ref update, instead of probing and writing
+        each file through the Contents API.
 
         Args:
             repo: GitHub repository object
-            branch_name: Branch to commit to
+            branch_ref: Git reference of the branch to commit to
+            base_sha: SHA of the commit the branch was created from
             files: Dictionary mapping filenames to contents
             directory: Directory path for the files
             commit_message: Commit message
         """
-        for filename, content in files.items():
+        from github import GithubException, InputGitTreeElement
+
+        def create_blob(item):
+            filename, content = item
             file_path = f"{directory}/{filename}"
-            try:
-                # Try to get existing file (in case we're updating)
-                try:
-                    existing_file = repo.get_contents(file_path, ref=branch_name)
-                    repo.update_file(
-                        path=file_path,
-                        message=commit_message,
-                        content=content,
-                        sha=existing_file.sha,
-                        branch=branch_name
-                    )
-                    logger.debug(f"Updated file: {file_path}")
-                except GithubException as e:
-                    if e.status == 404:
-                        # File doesn't exist, create it
-                        repo.create_file(
-                            path=file_path,
-                            message=commit_message,
-                            content=content,
-                            branch=branch_name
-                        )
-                        logger.debug(f"Created file: {file_path}")
-                    else:
-                        raise
-            except Exception as e:
-                logger.error(f"Failed to commit {file_path}: {e}")
+            blob_sha = self._create_blob(repo, content)
+            logger.debug(f"Created blob for {file_path}: {blob_sha}")
+            return InputGitTreeElement(
+                path=file_path,
+                mode="100644",
+                type="blob",
+                sha=blob_sha
+            )
+
+        def create_blobs():
+            with ThreadPoolExecutor(max_workers=BLOB_UPLOAD_WORKERS) as executor:
+                return list(executor.map(create_blob, files.items()))
+
+        elements = create_blobs()
+        base_commit = repo.get_git_commit(base_sha)
+        try:
+            tree = repo.create_git_tree(elements, base_tree=base_commit.tree)
+        except GithubException as e:
+            if e.status != 422:
                 raise
+            # A blob skipped as already uploaded may have been garbage
+            # collected along with the branch it was committed to; upload
+            # every blob again and retry once
+            logger.warning(f"Tree creation failed, re-uploading blobs: {e}")
+            with self._blob_lock:
+                self._uploaded_blobs.clear()
+            elements = create_blobs()
+            tree = repo.create_git_tree(elements, base_tree=base_commit.tree)
+        commit = repo.create_git_commit(commit_message, tree, [base_commit])
+        branch_ref.edit(commit.sha)
+        logger.debug(f"Updated {branch_ref.ref} to {commit.sha}")
+
+    def _create_blob(self, repo, content: str) -> str:
+        """
+        Upload file content as a Git blob.
+
+        The Git blob SHA is computed locally first; content this client has
+        already uploaded is not sent again. Should GitHub have garbage
+        collected such a blob, _commit_files clears the record and uploads
+        again. Otherwise uses the HTTP/2 client
+        when available so concurrent uploads share one connection, or
+        PyGithub.
+
+        Args:
+            repo: GitHub repository object
+            content: File content
+
+        Returns:
+            SHA of the blob
+        """
+        blob_sha = _git_blob_sha(content)
+        with self._blob_lock:
+            if blob_sha in self._uploaded_blobs:
+                self._uploaded_blobs.move_to_end(blob_sha)
+                return blob_sha
+
+        uploaded_sha = self._upload_blob(repo, content)
+
+        with self._blob_lock:
+            self._uploaded_blobs[uploaded_sha] = None
+            while len(self._uploaded_blobs) > BLOB_CACHE_SIZE:
+                self._uploaded_blobs.popitem(last=False)
+        return uploaded_sha
+
+    def _upload_blob(self, repo, content: str) -> str:
+        """
+        Send file content to the Git blobs API.
+
+        The HTTP/2 client makes a single attempt. If it fails (a non-2xx
+        response or a transport error), the blob is uploaded through PyGithub
+        instead, which applies the client's retry policy and token rotation.
+
+        Args:
+            repo: GitHub repository object
+            content: File content
+
+        Returns:
+            SHA of the created blob
+        """
+        if self._http is not None:
+            import httpx
+
+            headers = {}
+            self._auth.authentication(headers)
+            try:
+                response = self._http.post(
+                    f"/repos/{self.org}/{self.repo}/git/blobs",
+                    json={"content": content, "encoding": "utf-8"},
+                    headers=headers
+                )
+                response.raise_for_status()
+                return response.json()["sha"]
+            except httpx.HTTPError as e:
+                logger.warning(f"HTTP/2 blob upload failed, retrying through PyGithub: {e}")
+
+        return repo.create_git_blob(content, "utf-8").sha
 
     def _generate_commit_message(
         self,
@@ -402,15 +718,11 @@ class GitHubClient:
         Returns:
             List of label names
         """
-        labels = ["infrastructure", "terraform"]
-
-        # Add environment label
-        labels.append(f"env:{terraform.environment}")
-
-        # Add resource type label
-        labels.append(f"resource:{terraform.resource_type}")
-
-        return labels
+        return [
+            *_BASE_LABELS,
+            f"env:{terraform.environment}",
+            f"resource:{terraform.resource_type}",
+        ]
 
     def generate_pr_description(
         self,
@@ -420,8 +732,9 @@ class GitHubClient:
         """
         Generate PR description explaining the infrastructure changes.
 
-        Uses Claude to create a detailed, human-readable description of what
-        infrastructure is being provisioned and why.
+        Renders the template description by default. When
+        INFRALLM_LLM_PR_DESC=1 is set, Claude is used instead to write a
+        more detailed description, falling back to the template on error.
 
         Args:
             terraform: Generated Terraform object
@@ -430,6 +743,16 @@ class GitHubClient:
         Returns:
             Markdown-formatted PR description
         """
+        if not self.llm_pr_description:
+            return self._generate_template_pr_description(terraform, requirements)
+
+        # Check for an API key before building the prompt, so the fallback
+        # path does no prompt work at all
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            logger.warning("ANTHROPIC_API_KEY not found, using template PR description")
+            return self._generate_template_pr_description(terraform, requirements)
+
         logger.info("Generating PR description with Claude")
 
         # Build context for Claude
@@ -464,15 +787,9 @@ Make it professional and suitable for a platform engineering team.
 """
 
         try:
-            # Get API key from environment
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-            if not api_key:
-                logger.warning("ANTHROPIC_API_KEY not found, using template PR description")
-                return self._generate_template_pr_description(terraform, requirements)
-
-            client = anthropic.Anthropic(api_key=api_key)
+            client = get_anthropic_client(api_key)
 
-            response = client.messages.create(
+            with client.messages.stream(
                 model="claude-sonnet-4-5",
                 max_tokens=2048,
                 temperature=0.3,  # Slightly creative but still focused
@@ -482,9 +799,9 @@ Make it professional and suitable for a platform engineering team.
                         "content": prompt
                     }
                 ]
-            )
+            ) as stream:
+                pr_description = "".join(stream.text_stream)
 
-            pr_description = response.content[0].text
             logger.info("Successfully generated PR description with Claude")
 
             # Add footer
@@ -503,7 +820,7 @@ Make it professional and suitable for a platform engineering team.
         requirements: Dict[str, Any]
     ) -> str:
         """
-        Generate a template PR description (fallback when Claude is unavailable).
+        Generate a template PR description (default, and fallback when Claude is unavailable).
 
         Args:
             terraform: Generated Terraform object
@@ -512,43 +829,11 @@ Make it professional and suitable for a platform engineering team.
         Returns:
             Markdown-formatted PR description
         """
-        parameters = requirements.get("parameters", {})
-        tags = requirements.get("tags", {})
-
-        # Format parameters
-        params_list = "\n".join([f"- **{k}**: {v}" for k, v in parameters.items()])
-
-        # Format tags
-        tags_list = "\n".join([f"- {k}: {v}" for k, v in tags.items()])
-
-        description = f"""## Infrastructure Provisioning Request
-
-### Summary
-Provisioning **{terraform.resource_type.upper()}** resource `{terraform.resource_name}` in **{terraform.environment}** environment.
-
-### Resources Created
-{params_list}
-
-### Tags Applied
-{tags_list}
-
-### Files Generated
-{chr(10).join([f'- `{filename}`' for filename in terraform.files.keys()])}
-
-### Security Compliance
-- Encryption at rest enabled
-- Following organizational security policies
-- Required tags applied
-
-### Review Checklist
-- [ ] Resource sizing is appropriate
-- [ ] Environment is correct
-- [ ] Tags are complete
-- [ ] Security settings reviewed
-- [ ] Cost impact acceptable
-
----
-
-Generated by [InfraLLM](https://github.com/your-org/infrallm)
-"""
-        return description
+        return _PR_DESCRIPTION_TEMPLATE.render(
+            resource_type=terraform.resource_type,
+            resource_name=terraform.resource_name,
+            environment=terraform.environment,
+            parameters=requirements.get("parameters", {}),
+            tags=requirements.get("tags", {}),
+            files=terraform.files.keys()
+        )
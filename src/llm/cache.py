@@ -0,0 +1,135 @@
+"""
+On-disk cache of parsed infrastructure requests.
+
+Identical requests (CI re-runs, retries after a failed PR) would otherwise
+each pay for a Claude call. Parses are stored as JSON files keyed by a hash
+of the policies and system prompt fingerprints, the model and the request,
+so editing policies.yaml, changing the prompt or switching models
+invalidates every entry without any explicit cleanup. Entries also expire
+after a day, since re-asking Claude may give a better parse.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import orjson
+
+from src.config.paths import user_cache_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the user cache directory holding cached parses; override
+# the full path with INFRALLM_CACHE_DIR
+CACHE_SUBDIR = "exact"
+
+# Seconds a cached parse stays valid; override with INFRALLM_CACHE_TTL
+DEFAULT_CACHE_TTL = 86400
+
+
+def normalize_request(request: str) -> str:
+    """
+    Normalize a request for cache lookups.
+
+    Requests that differ only in surrounding or repeated whitespace map to
+    the same key; wording and case are kept, since they can change the
+    parse (tag values, names).
+
+    Args:
+        request: Natural language infrastructure request
+
+    Returns:
+        Request with whitespace runs collapsed to single spaces
+    """
+    return " ".join(request.split())
+
+
+def parse_cache_key(
+    policies_fingerprint: str,
+    prompt_fingerprint: str,
+    model: str,
+    request: str
+) -> str:
+    """
+    Build the cache key for a request under a given set of policies.
+
+    Args:
+        policies_fingerprint: Fingerprint of the policies in effect
+        prompt_fingerprint: Fingerprint of the system prompt in effect
+        model: Anthropic model the request is parsed with
+        request: Natural language infrastructure request
+
+    Returns:
+        Hex digest identifying the (policies, prompt, model, request) tuple
+    """
+    material = (
+        f"{policies_fingerprint}\0{prompt_fingerprint}\0{model}\0"
+        f"{normalize_request(request)}"
+    )
+    return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+
+def _get_cache_dir() -> Path:
+    """Get the directory holding cached parses."""
+    override = os.getenv("INFRALLM_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return user_cache_dir() / CACHE_SUBDIR
+
+
+def _get_cache_ttl() -> float:
+    """Get the number of seconds a cached parse stays valid."""
+    try:
+        return float(os.getenv("INFRALLM_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def read_cached_parse(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a cached parse.
+
+    Args:
+        key: Cache key from parse_cache_key()
+
+    Returns:
+        Parsed request dictionary, or None if not cached, expired or
+        unreadable
+    """
+    try:
+        with open(_get_cache_dir() / f"{key}.json", "rb") as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime > _get_cache_ttl():
+                return None
+            cached = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    return cached if isinstance(cached, dict) else None
+
+
+def write_cached_parse(key: str, result: Dict[str, Any]) -> None:
+    """
+    Persist a validated parse.
+
+    The file is written under a temporary name and renamed into place so
+    concurrent readers never see a partial entry. Failures are ignored;
+    the cache is purely an optimization.
+
+    Args:
+        key: Cache key from parse_cache_key()
+        result: Validated request dictionary
+    """
+    cache_dir = _get_cache_dir()
+    path = cache_dir / f"{key}.json"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps(result))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Could not write parse cache entry: {e}")
@@ -6,11 +6,14 @@ infrastructure requests into structured JSON format with policy validation.
 """
 
 import os
-import json
+import re
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple, get_args
 
-import anthropic
 from pydantic import ValidationError as PydanticValidationError
 
 from src.llm.exceptions import (
@@ -19,27 +22,168 @@ from src.llm.exceptions import (
     ValidationError,
     ParsingError
 )
+from src.llm.cache import normalize_request, parse_cache_key, read_cached_parse, write_cached_parse
 from src.llm.models import InfrastructureRequest
-from src.llm.prompts import build_system_prompt
+from src.llm.prompts import build_system_blocks, policies_fingerprint, prompt_fingerprint
 from src.llm.validator import validate_request
 from src.config.loader import load_policies
 
+if TYPE_CHECKING:
+    import anthropic
+
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Attempts the Anthropic SDK makes on 429, 5xx and connection errors; it
+# backs off exponentially between attempts and honors Retry-After
+ANTHROPIC_MAX_RETRIES = 5
+
+# Connections kept open to the Anthropic API per client; with HTTP/2 the
+# concurrent calls of a batch are multiplexed over them
+ANTHROPIC_MAX_CONNECTIONS = 32
+
+# Model used to parse infrastructure requests (Claude Sonnet 4.5)
+CLAUDE_MODEL = "claude-sonnet-4-5"
+
+# Faster model for short, low-stakes requests (Claude Haiku 4.5)
+CLAUDE_FAST_MODEL = "claude-haiku-4-5"
+
+# Requests at least this long always go to CLAUDE_MODEL
+FAST_MODEL_MAX_REQUEST_CHARS = 120
+
+# Keywords that mark a request as needing CLAUDE_MODEL: production
+# environments, databases and clusters, and anything bespoke
+_COMPLEX_REQUEST_RE = re.compile(
+    r"\b(prod|production|rds|database|postgres|postgresql|mysql|kubernetes|k8s|eks|custom)\b",
+    re.IGNORECASE
+)
+
+# Upper bound on concurrent API calls made by ClaudeClient.parse_many
+MAX_CONCURRENT_PARSES = 16
+
+# Number of successfully parsed requests each client remembers
+PARSE_CACHE_SIZE = 256
+
+# Allowed resource types, checked while the response is still streaming
+_RESOURCE_TYPES = frozenset(get_args(InfrastructureRequest.model_fields["resource_type"].annotation))
+
+# Matches a complete "resource_type": "<value>" pair in partial JSON
+_RESOURCE_TYPE_RE = re.compile(r'"resource_type"\s*:\s*"([^"]*)"')
+
+# Characters at the start of a response searched for resource_type; it is
+# written near the top, and searching further would rescan the whole text
+RESOURCE_TYPE_SCAN_CHARS = 512
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str) -> "anthropic.Anthropic":
+    """
+    Get the shared Anthropic client for an API key.
+
+    The client holds an HTTP connection pool, so reusing it keeps
+    connections to the API alive between calls.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Anthropic client instance
+    """
+    # Imported on first use; the SDK is slow to import and the CLI doesn't
+    # need it for every command
+    import anthropic
+
+    return anthropic.Anthropic(
+        api_key=api_key,
+        max_retries=ANTHROPIC_MAX_RETRIES,
+        http_client=_create_http2_client(anthropic.DefaultHttpxClient)
+    )
+
+
+def _create_http2_client(client_cls: Any) -> Any:
+    """
+    Create an HTTP/2 transport for an Anthropic client.
+
+    Requires the `http2` extra (h2); returns None when it isn't installed,
+    in which case the SDK's default HTTP/1.1 transport is used.
+
+    Args:
+        client_cls: anthropic.DefaultHttpxClient or DefaultAsyncHttpxClient,
+            which keep the SDK's default timeouts and redirect handling
+
+    Returns:
+        httpx client instance, or None
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return None
+
+    import httpx
+
+    return client_cls(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=ANTHROPIC_MAX_CONNECTIONS,
+            max_keepalive_connections=ANTHROPIC_MAX_CONNECTIONS
+        )
+    )
+
+
+def _read_response_stream(text_stream: Iterable[str]) -> Tuple[str, Optional[str]]:
+    """
+    Accumulate streamed response text, rejecting it as early as possible.
+
+    resource_type is one of the first fields Claude writes, so an illegal
+    value is usually known after a few tokens; reading stops there instead
+    of waiting for (and paying for) the rest of the completion. Only the
+    first RESOURCE_TYPE_SCAN_CHARS characters are searched; anything later
+    is left to full validation.
+
+    Args:
+        text_stream: Text deltas from a Messages API stream
+
+    Returns:
+        Tuple of (text read so far, error message if the response was
+        rejected early or None if the stream was read to the end)
+    """
+    chunks = []
+    # Start of the response, searched until resource_type is found or the
+    # scan limit is reached
+    head = ""
+    checking = True
+    for text in text_stream:
+        chunks.append(text)
+        if checking:
+            head += text
+            match = _RESOURCE_TYPE_RE.search(head)
+            if match:
+                resource_type = match.group(1)
+                if resource_type not in _RESOURCE_TYPES:
+                    return "".join(chunks), (
+                        f"resource_type '{resource_type}' is not one of: "
+                        f"{', '.join(sorted(_RESOURCE_TYPES))}"
+                    )
+                checking = False
+            elif len(head) >= RESOURCE_TYPE_SCAN_CHARS:
+                checking = False
+    return "".join(chunks), None
+
 
 class ClaudeClient:
     """
     Client for interacting with Claude API to parse infrastructure requests.
     """
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         """
         Initialize Claude API client.
 
         Args:
             api_key: Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY env var.
+            use_cache: Reuse and store parses of identical requests, in memory
+                and on disk (see src.llm.cache)
 
         Raises:
             ConfigurationError: If API key is not provided and not in environment
@@ -51,6 +195,23 @@ class ClaudeClient:
                 "Set it in your .env file or export it as an environment variable."
             )
 
+        # Organizational policies, their fingerprint and the system prompt
+        # blocks built from them and their fingerprint; rebuilt together
+        # when policies are reloaded
+        self._policies: Optional[Dict[str, Any]] = None
+        self.policies_fingerprint: Optional[str] = None
+        self._system_blocks: Optional[List[Dict[str, Any]]] = None
+        self.prompt_fingerprint: Optional[str] = None
+
+        # Normalized request -> schema-validated parse, least recently used
+        # first; entries are re-checked against current policies on reuse
+        self._parse_cache: "OrderedDict[str, InfrastructureRequest]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        self.use_cache = use_cache
+
+        # Send simple requests to the faster model unless disabled
+        self.model_routing = os.getenv("INFRALLM_MODEL_ROUTING", "1") != "0"
+
     def parse_infrastructure_request(self, request: str) -> Dict[str, Any]:
         """
         Parse natural language infrastructure request into structured format.
@@ -93,99 +254,440 @@ class ClaudeClient:
             'prod-payments-db'
         """
         # Step 1: Pre-flight validation
-        if not request or not request.strip():
-            raise ValidationError(["Infrastructure request cannot be empty"])
-
-        logger.info(f"Parsing infrastructure request: {request[:100]}...")
+        self._check_request(request)
 
         # Step 2: Load organizational policies
         try:
-            policies = load_policies()
+            policies = self._get_policies()
         except ConfigurationError as e:
             logger.error(f"Failed to load policies: {e}")
             raise
 
-        # Step 3: Build system prompt with policies
-        system_prompt = build_system_prompt(policies)
-        logger.debug(f"System prompt length: {len(system_prompt)} characters")
+        # A request parsed before skips the API call entirely
+        cached = self._get_cached_parse(request, policies)
+        if cached is not None:
+            return cached
+
+        # Step 3: Build system prompt with policies (once per client)
+        system_blocks = self._get_system_blocks()
+        logger.debug(f"System prompt length: {len(system_blocks[0]['text'])} characters")
 
         # Step 4: Call Claude API
+        import anthropic
+
         try:
-            client = anthropic.Anthropic(api_key=self.api_key)
+            client = get_anthropic_client(self.api_key)
 
             logger.debug("Calling Claude API...")
-            response = client.messages.create(
-                model="claude-sonnet-4-5",  # Using Claude Sonnet 4.5 (most capable)
+            with client.messages.stream(
+                model=self._model_for(request),
                 max_tokens=4096,
                 temperature=0,  # Deterministic output
-                system=system_prompt,
+                system=system_blocks,
                 messages=[
                     {
                         "role": "user",
                         "content": request
                     }
                 ]
-            )
+            ) as stream:
+                # Accumulate text as it arrives; leaving the block before
+                # the stream ends closes it, so a rejected response stops
+                # generating tokens
+                raw_response, early_error = _read_response_stream(stream.text_stream)
+                if early_error is None:
+                    self._log_usage(stream.get_final_message().usage)
 
-            # Extract text from response
-            raw_response = response.content[0].text
             logger.debug(f"Claude response: {raw_response[:200]}...")
 
+        except anthropic.RateLimitError as e:
+            raise self._rate_limit_error(e)
         except anthropic.APIError as e:
-            logger.error(f"Claude API error: {e}")
-            raise APIError(
-                f"Failed to call Claude API: {str(e)}\n"
-                "Please check your API key and network connection."
-            )
+            raise self._api_error(e)
         except Exception as e:
             logger.error(f"Unexpected error calling Claude API: {e}")
             raise APIError(f"Unexpected error calling Claude API: {str(e)}")
 
-        # Step 5: Parse JSON response
-        try:
-            # Strip markdown code blocks if present (e.g., ```json ... ```)
-            cleaned_response = raw_response.strip()
-            if cleaned_response.startswith("```"):
-                # Remove opening ```json or ```
-                lines = cleaned_response.split('\n')
-                if lines[0].startswith("```"):
-                    lines = lines[1:]
-                # Remove closing ```
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                cleaned_response = '\n'.join(lines)
-
-            parsed_data = json.loads(cleaned_response)
-            logger.debug(f"Successfully parsed JSON response")
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from Claude: {e}")
-            logger.error(f"Raw response: {raw_response}")
+        if early_error is not None:
+            logger.error(f"Rejected streamed Claude response: {early_error}")
             raise ParsingError(
-                f"Claude returned invalid JSON: {str(e)}\n"
-                f"Raw response: {raw_response[:500]}"
+                f"Claude response does not match expected schema:\n{early_error}"
+            )
+
+        # Steps 5-7: Parse and validate the response
+        validated_request = self._process_response(raw_response, policies)
+        self._cache_parse(request, validated_request)
+
+        # Step 8: Return as dictionary
+        return validated_request.model_dump()
+
+    async def parse_many(self, requests: List[str]) -> List[Any]:
+        """
+        Parse several infrastructure requests concurrently.
+
+        Each request is an independent API round-trip, so the calls are
+        issued together and awaited with asyncio.gather; at most
+        MAX_CONCURRENT_PARSES are in flight at once to stay within
+        Anthropic rate limits.
+
+        Args:
+            requests: Natural language infrastructure requests
+
+        Returns:
+            One entry per request, in the same order: the parsed request
+            dictionary (see parse_infrastructure_request), or the
+            InfraLLMError raised while parsing it
+
+        Raises:
+            ConfigurationError: If policies are missing or invalid
+        """
+        import anthropic
+
+        # Load policies and build the shared system prompt once up front
+        self._get_system_blocks()
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+
+        # The async client's connection pool is bound to the running event
+        # loop, so it is scoped to this call rather than cached
+        async with anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            max_retries=ANTHROPIC_MAX_RETRIES,
+            http_client=_create_http2_client(anthropic.DefaultAsyncHttpxClient)
+        ) as aclient:
+
+            async def parse_one(request: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._parse_one(aclient, request)
+
+            return await asyncio.gather(
+                *(parse_one(request) for request in requests),
+                return_exceptions=True
+            )
+
+    async def _parse_one(
+        self,
+        aclient: "anthropic.AsyncAnthropic",
+        request: str
+    ) -> Dict[str, Any]:
+        """
+        Parse a single request with the async client.
+
+        Args:
+            aclient: Async Anthropic client shared by the batch
+            request: Natural language description of infrastructure needs
+
+        Returns:
+            Validated request dictionary
+
+        Raises:
+            APIError: If Claude API call fails
+            ParsingError: If response cannot be parsed as valid JSON
+            ValidationError: If request violates organizational policies
+        """
+        import anthropic
+
+        self._check_request(request)
+        policies = self._get_policies()
+
+        cached = self._get_cached_parse(request, policies)
+        if cached is not None:
+            return cached
+
+        system_blocks = self._get_system_blocks()
+
+        try:
+            message = await aclient.messages.create(
+                model=self._model_for(request),
+                max_tokens=4096,
+                temperature=0,  # Deterministic output
+                system=system_blocks,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": request
+                    }
+                ]
             )
+        except anthropic.RateLimitError as e:
+            raise self._rate_limit_error(e)
+        except anthropic.APIError as e:
+            raise self._api_error(e)
+        except Exception as e:
+            logger.error(f"Unexpected error calling Claude API: {e}")
+            raise APIError(f"Unexpected error calling Claude API: {str(e)}")
+
+        self._log_usage(message.usage)
+        raw_response = "".join(
+            block.text for block in message.content if block.type == "text"
+        )
+        logger.debug(f"Claude response: {raw_response[:200]}...")
+
+        validated_request = self._process_response(raw_response, policies)
+        self._cache_parse(request, validated_request)
+        return validated_request.model_dump()
+
+    def _model_for(self, request: str) -> str:
+        """
+        Choose the model to parse a request with.
+
+        Short requests that don't mention production, databases, clusters
+        or custom setups are handled well by the faster model; everything
+        else goes to the more capable one. Either way the response goes
+        through the same schema and policy validation.
 
-        # Step 6: Validate with Pydantic model
+        Args:
+            request: Natural language description of infrastructure needs
+
+        Returns:
+            Anthropic model name
+        """
+        if (
+            self.model_routing
+            and len(request) < FAST_MODEL_MAX_REQUEST_CHARS
+            and not _COMPLEX_REQUEST_RE.search(request)
+        ):
+            return CLAUDE_FAST_MODEL
+        return CLAUDE_MODEL
+
+    def _check_request(self, request: str) -> None:
+        """
+        Pre-flight validation of a request before calling the API.
+
+        Args:
+            request: Natural language description of infrastructure needs
+
+        Raises:
+            ValidationError: If the request is empty
+        """
+        if not request or not request.strip():
+            raise ValidationError(["Infrastructure request cannot be empty"])
+
+        logger.info(f"Parsing infrastructure request: {request[:100]}...")
+
+    def _process_response(
+        self,
+        raw_response: str,
+        policies: Dict[str, Any]
+    ) -> InfrastructureRequest:
+        """
+        Parse and validate Claude's raw response text.
+
+        Args:
+            raw_response: Text returned by Claude
+            policies: Organizational policies to validate against
+
+        Returns:
+            Validated infrastructure request
+
+        Raises:
+            ParsingError: If response cannot be parsed as valid JSON
+            ValidationError: If request violates organizational policies
+        """
+        # Strip markdown code blocks if present (e.g., ```json ... ```)
+        # by slicing between the fences instead of splitting into lines
+        cleaned_response = raw_response.strip()
+        if cleaned_response.startswith("```"):
+            # Drop the opening ```json or ``` line
+            start = cleaned_response.find("\n") + 1
+            # Drop the closing ``` if there is one after the opening line
+            end = cleaned_response.rfind("```")
+            if start == 0:
+                cleaned_response = ""
+            elif end >= start:
+                cleaned_response = cleaned_response[start:end]
+            else:
+                cleaned_response = cleaned_response[start:]
+
+        # Steps 5-6: Parse JSON and validate with Pydantic model
         try:
-            validated_request = InfrastructureRequest(**parsed_data)
+            # model_validate_json feeds the text straight to pydantic-core's
+            # JSON parser, building the model in one pass instead of decoding
+            # to a dict first and validating that
+            validated_request = InfrastructureRequest.model_validate_json(cleaned_response)
             logger.info(
                 f"Validated request: {validated_request.resource_type} "
                 f"'{validated_request.resource_name}' in {validated_request.environment}"
             )
         except PydanticValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.error(f"Invalid JSON from Claude: {e}")
+                logger.error(f"Raw response: {raw_response}")
+                raise ParsingError(
+                    f"Claude returned invalid JSON: {e.errors()[0]['msg']}\n"
+                    f"Raw response: {raw_response[:500]}"
+                )
             logger.error(f"Pydantic validation failed: {e}")
             raise ParsingError(
                 f"Claude response does not match expected schema:\n{str(e)}"
             )
 
         # Step 7: Validate against organizational policies
+        self._check_policies(validated_request, policies)
+
+        logger.info("Request successfully parsed and validated")
+
+        return validated_request
+
+    def _check_policies(
+        self,
+        validated_request: InfrastructureRequest,
+        policies: Dict[str, Any]
+    ) -> None:
+        """
+        Validate a parsed request against organizational policies.
+
+        Args:
+            validated_request: Schema-validated infrastructure request
+            policies: Organizational policies to validate against
+
+        Raises:
+            ValidationError: If request violates organizational policies
+        """
         policy_violations = validate_request(validated_request, policies)
 
         if policy_violations:
             logger.warning(f"Policy violations found: {policy_violations}")
             raise ValidationError(policy_violations)
 
-        logger.info("Request successfully parsed and validated")
+    def _get_cached_parse(
+        self,
+        request: str,
+        policies: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an earlier successful parse of the same request.
 
-        # Step 8: Return as dictionary
+        The in-memory cache is checked first, then the on-disk cache.
+        Policies may have changed since the request was parsed, so either
+        kind of entry is validated against the current policies before
+        reuse. A disk entry that no longer matches the schema is treated
+        as a miss.
+
+        Args:
+            request: Natural language infrastructure request
+            policies: Current organizational policies
+
+        Returns:
+            Validated request dictionary, or None on a cache miss
+
+        Raises:
+            ValidationError: If the cached parse violates current policies
+        """
+        if not self.use_cache:
+            return None
+
+        key = normalize_request(request)
+        with self._parse_cache_lock:
+            validated_request = self._parse_cache.get(key)
+            if validated_request is not None:
+                self._parse_cache.move_to_end(key)
+
+        if validated_request is not None:
+            logger.info("Reusing cached parse of identical request")
+            self._check_policies(validated_request, policies)
+            return validated_request.model_dump()
+
+        cached = read_cached_parse(self._parse_cache_key(request))
+        if cached is None:
+            return None
+        try:
+            validated_request = InfrastructureRequest.model_validate(cached)
+        except PydanticValidationError as e:
+            logger.debug(f"Ignoring invalid disk cache entry: {e}")
+            return None
+
+        logger.info("Reusing parse of identical request from disk cache")
+        self._check_policies(validated_request, policies)
         return validated_request.model_dump()
+
+    def _cache_parse(self, request: str, validated_request: InfrastructureRequest) -> None:
+        """
+        Remember a successful parse for identical future requests.
+
+        Args:
+            request: Natural language infrastructure request
+            validated_request: Its validated parse (immutable, safe to share)
+        """
+        if not self.use_cache:
+            return
+
+        key = normalize_request(request)
+        with self._parse_cache_lock:
+            self._parse_cache[key] = validated_request
+            self._parse_cache.move_to_end(key)
+            while len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        write_cached_parse(self._parse_cache_key(request), validated_request.model_dump())
+
+    def _parse_cache_key(self, request: str) -> str:
+        """Build the on-disk cache key for a request under current policies."""
+        self._get_system_blocks()
+        return parse_cache_key(
+            self.policies_fingerprint,
+            self.prompt_fingerprint,
+            self._model_for(request),
+            request
+        )
+
+    def _log_usage(self, usage: Any) -> None:
+        """Log token usage, including prompt cache reads and writes."""
+        logger.debug(
+            f"Claude usage: {usage.input_tokens} input tokens, "
+            f"{usage.cache_read_input_tokens or 0} read from prompt cache, "
+            f"{usage.cache_creation_input_tokens or 0} written to prompt cache"
+        )
+
+    def _rate_limit_error(self, error: Exception) -> APIError:
+        """Translate an Anthropic rate limit error once retries are exhausted."""
+        logger.error(f"Claude API rate limit exceeded after retries: {error}")
+        return APIError(
+            f"Claude API rate limit exceeded: {str(error)}\n"
+            "Please retry later or reduce concurrent requests."
+        )
+
+    def _api_error(self, error: Exception) -> APIError:
+        """Translate an Anthropic API error."""
+        logger.error(f"Claude API error: {error}")
+        return APIError(
+            f"Failed to call Claude API: {str(error)}\n"
+            "Please check your API key and network connection."
+        )
+
+    def _get_policies(self) -> Dict[str, Any]:
+        """
+        Get organizational policies.
+
+        load_policies() returns the same object until policies are reloaded,
+        so an identity check is enough to notice a reload; the fingerprint
+        and system prompt blocks are then rebuilt in lockstep.
+
+        Returns:
+            Dictionary containing organizational policies
+
+        Raises:
+            ConfigurationError: If policies file is missing or invalid
+        """
+        policies = load_policies()
+        if policies is not self._policies:
+            self._policies = policies
+            self.policies_fingerprint = policies_fingerprint(policies)
+            self._system_blocks = None
+        return self._policies
+
+    def _get_system_blocks(self) -> List[Dict[str, Any]]:
+        """
+        Get the system prompt blocks, building them when policies change.
+
+        Returns:
+            System content blocks with the prompt marked for caching
+
+        Raises:
+            ConfigurationError: If policies file is missing or invalid
+        """
+        policies = self._get_policies()
+        if self._system_blocks is None:
+            self._system_blocks = build_system_blocks(policies)
+            self.prompt_fingerprint = prompt_fingerprint(self._system_blocks)
+        return self._system_blocks
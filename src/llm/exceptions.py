@@ -5,7 +5,7 @@ This module defines the exception hierarchy used throughout the application
 for clear error handling and user-friendly error messages.
 """
 
-from typing import List
+from typing import Iterable
 
 
 class InfraLLMError(Exception):
@@ -43,21 +43,26 @@ class ValidationError(InfraLLMError):
     Raised when infrastructure requirements violate organizational policies.
 
     Attributes:
-        violations: List of policy violation messages
+        violations: Tuple of policy violation messages
     """
 
-    def __init__(self, violations: List[str]):
+    def __init__(self, violations: Iterable[str]):
         """
         Initialize ValidationError with list of violations.
 
+        The summary message is only built when the error is printed, so
+        raising in bulk validation doesn't pay for formatting it.
+
         Args:
-            violations: List of human-readable violation messages
+            violations: Human-readable violation messages
         """
-        self.violations = violations
-        violation_count = len(violations)
-        super().__init__(
-            f"Policy validation failed: {violation_count} violation{'s' if violation_count != 1 else ''}"
-        )
+        self.violations = tuple(violations)
+        # Passed through so the error still pickles (e.g. across workers)
+        super().__init__(self.violations)
+
+    def __str__(self) -> str:
+        violation_count = len(self.violations)
+        return f"Policy validation failed: {violation_count} violation{'s' if violation_count != 1 else ''}"
 
 
 class ParsingError(InfraLLMError):
@@ -5,8 +5,21 @@ This module defines the data models used to validate Claude's output
 and ensure it conforms to the expected schema.
 """
 
-from typing import Dict, Any, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+
+# Resource names: lowercase letters, numbers and hyphens, 3-63 characters.
+# Checked by pydantic-core itself, without a Python validator callback.
+ResourceName = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=3,
+        max_length=63,
+        pattern=r"^[a-z0-9-]+$"
+    )
+]
 
 
 class InfrastructureRequest(BaseModel):
@@ -28,15 +41,15 @@ class InfrastructureRequest(BaseModel):
         description="Type of infrastructure resource to provision"
     )
 
-    resource_name: str = Field(
-        description="Resource name following naming convention: {environment}-{application}-{resource}",
-        min_length=3,
-        max_length=63
+    resource_name: ResourceName = Field(
+        description="Resource name following naming convention: {environment}-{application}-{resource}"
     )
 
     parameters: Dict[str, Any] = Field(
-        description="Resource-specific configuration parameters",
-        default_factory=dict
+        description="Resource-specific configuration parameters (at least one)",
+        default_factory=dict,
+        min_length=1,
+        validate_default=True
     )
 
     environment: Literal["dev", "staging", "prod"] = Field(
@@ -44,91 +57,18 @@ class InfrastructureRequest(BaseModel):
     )
 
     tags: Dict[str, str] = Field(
-        description="Organizational tags for resource tagging",
-        default_factory=dict
+        description="Organizational tags for resource tagging (at least one)",
+        default_factory=dict,
+        min_length=1,
+        validate_default=True
     )
 
-    @field_validator('resource_name')
-    @classmethod
-    def validate_resource_name_not_empty(cls, v: str) -> str:
-        """
-        Validate that resource_name is not empty or whitespace.
-
-        Args:
-            v: Resource name value
-
-        Returns:
-            Validated resource name
-
-        Raises:
-            ValueError: If resource name is empty or only whitespace
-        """
-        if not v or not v.strip():
-            raise ValueError("resource_name cannot be empty or whitespace")
-        return v.strip()
-
-    @field_validator('resource_name')
-    @classmethod
-    def validate_resource_name_format(cls, v: str) -> str:
-        """
-        Validate that resource_name uses lowercase and hyphens.
-
-        Args:
-            v: Resource name value
-
-        Returns:
-            Validated resource name
-
-        Raises:
-            ValueError: If resource name contains invalid characters
-        """
-        if not all(c.islower() or c.isdigit() or c == '-' for c in v):
-            raise ValueError(
-                "resource_name must contain only lowercase letters, numbers, and hyphens"
-            )
-        return v
-
-    @field_validator('parameters')
-    @classmethod
-    def validate_parameters_not_empty(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Validate that parameters dictionary is not empty.
-
-        Args:
-            v: Parameters dictionary
-
-        Returns:
-            Validated parameters
-
-        Raises:
-            ValueError: If parameters is empty
-        """
-        if not v:
-            raise ValueError("parameters cannot be empty - at least one parameter is required")
-        return v
-
-    @field_validator('tags')
-    @classmethod
-    def validate_tags_not_empty(cls, v: Dict[str, str]) -> Dict[str, str]:
-        """
-        Validate that tags dictionary is not empty.
-
-        Args:
-            v: Tags dictionary
-
-        Returns:
-            Validated tags
-
-        Raises:
-            ValueError: If tags is empty
-        """
-        if not v:
-            raise ValueError("tags cannot be empty - required organizational tags must be present")
-        return v
-
-    class Config:
-        """Pydantic model configuration."""
+    model_config = ConfigDict(
         # Allow extra fields for forward compatibility
-        extra = "allow"
+        extra="allow",
         # Use enum values instead of enum members
-        use_enum_values = True
+        use_enum_values=True,
+        # Validated requests are read-only; policy checks and Terraform
+        # generation see exactly what was validated
+        frozen=True
+    )
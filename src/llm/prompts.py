@@ -5,102 +5,70 @@ This module builds the system prompt that instructs Claude how to parse
 natural language infrastructure requests according to organizational policies.
 """
 
+import hashlib
 import json
-from typing import Dict, Any
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, List
 
 
-def build_system_prompt(policies: Dict[str, Any]) -> str:
-    """
-    Build the system prompt for Claude with organizational policies.
+logger = logging.getLogger(__name__)
 
-    Args:
-        policies: Organizational policies loaded from policies.yaml
+# Number of distinct policy sets whose rendered policy block is kept
+PROMPT_CACHE_SIZE = 8
 
-    Returns:
-        Complete system prompt string with role definition, policies, schema, and examples
+# Below roughly this many characters (~1024 tokens) a system prompt is
+# shorter than Anthropic's minimum cacheable prefix and is billed in full
+# on every call
+MIN_CACHEABLE_PROMPT_CHARS = 4000
 
-    Example:
-        >>> from src.config.loader import load_policies
-        >>> policies = load_policies()
-        >>> prompt = build_system_prompt(policies)
-        >>> print(len(prompt))  # Should be several thousand characters
-    """
-    naming_pattern = policies["naming"]["pattern"]
-    required_tags = policies["tags"]["required"]
-    tag_defaults = policies["tags"].get("defaults", {})
-    security = policies["security"]
-    resources = policies["resources"]
+# Policies fingerprint -> rendered policy block, oldest first
+_prompt_cache: "OrderedDict[str, str]" = OrderedDict()
 
-    prompt = f"""You are an infrastructure provisioning assistant for a large enterprise organization.
-
-Your role is to parse natural language infrastructure requests and convert them into structured JSON format that will be used to generate Terraform code.
 
-## Organizational Policies
+def _normalize_whitespace(text: str) -> str:
+    """Strip trailing spaces from every line and end with exactly one newline."""
+    return "\n".join(line.rstrip() for line in text.splitlines()) + "\n"
 
-You MUST enforce these organizational standards in your output:
-
-### Naming Convention
-- All resource names MUST follow this pattern: {naming_pattern}
-- Use lowercase letters, numbers, and hyphens only
-- Example: prod-payments-db, staging-api-cache
-
-### Required Tags
-All resources MUST include these tags:
-{chr(10).join(f'- {tag}' for tag in required_tags)}
-
-Default tag values:
-{chr(10).join(f'- {k}: {v}' for k, v in tag_defaults.items())}
-
-### Security Policies
-- Encryption required: {security.get('encryption_required', True)}
-- Private subnets only: {security.get('private_subnets_only', True)}
-- Backup required: {security.get('backup_required', True)}
-
-### Resource-Specific Policies
 
-RDS (Relational Database):
-- Allowed engines: {', '.join(resources.get('rds', {}).get('allowed_engines', ['postgres', 'mysql']))}
-- Minimum backup retention: {resources.get('rds', {}).get('min_backup_days', 7)} days
-- Encryption: {resources.get('rds', {}).get('encryption', True)}
+# Role, output schema, examples and general rules. Nothing here depends on
+# policies, so this leading block stays byte-identical across policy edits.
+ROLE_AND_EXAMPLES = _normalize_whitespace("""You are an infrastructure provisioning assistant for a large enterprise organization.
 
-S3 (Object Storage):
-- Versioning: {resources.get('s3', {}).get('versioning', True)}
-- Encryption: {resources.get('s3', {}).get('encryption', 'AES256')}
+Your role is to parse natural language infrastructure requests and convert them into structured JSON format that will be used to generate Terraform code.
 
-EKS (Kubernetes):
-- Minimum nodes: {resources.get('eks', {}).get('min_nodes', 2)}
-- Private endpoint: {resources.get('eks', {}).get('private_endpoint', True)}
+You MUST enforce the organizational policies listed in the "Organizational Policies" section at the end of these instructions.
 
 ## Output Format
 
 You MUST respond with ONLY valid JSON. No explanations, no markdown, just the JSON object.
 
 Schema:
-{{
+{
   "resource_type": "rds | s3 | eks | vpc",
   "resource_name": "string (following naming convention)",
-  "parameters": {{
+  "parameters": {
     "resource-specific parameters as key-value pairs"
-  }},
+  },
   "environment": "dev | staging | prod",
-  "tags": {{
+  "tags": {
     "Environment": "string",
     "CostCenter": "string",
     "Owner": "string",
     "ManagedBy": "terraform",
     "other tags as needed": "string"
-  }}
-}}
+  }
+}
 
 ## Examples
 
 Input: "I need a production Postgres database for the payments API with 200GB storage"
 
 Output:
-{{
+{
   "resource_type": "rds",
   "resource_name": "prod-payments-db",
-  "parameters": {{
+  "parameters": {
     "engine": "postgres",
     "engine_version": "15.3",
     "instance_class": "db.r6i.xlarge",
@@ -108,74 +76,74 @@ Output:
     "backup_retention_period": 7,
     "multi_az": true,
     "storage_encrypted": true
-  }},
+  },
   "environment": "prod",
-  "tags": {{
+  "tags": {
     "Environment": "prod",
     "Application": "payments",
     "CostCenter": "engineering",
     "Owner": "payments-team",
     "ManagedBy": "terraform"
-  }}
-}}
+  }
+}
 
 Input: "Create a staging S3 bucket for log aggregation with lifecycle policy"
 
 Output:
-{{
+{
   "resource_type": "s3",
   "resource_name": "staging-logs-bucket",
-  "parameters": {{
+  "parameters": {
     "versioning": true,
     "encryption": "AES256",
     "lifecycle_rules": [
-      {{
+      {
         "id": "expire-old-logs",
         "enabled": true,
         "expiration_days": 90
-      }}
+      }
     ],
     "public_access_block": true
-  }},
+  },
   "environment": "staging",
-  "tags": {{
+  "tags": {
     "Environment": "staging",
     "Application": "logs",
     "CostCenter": "platform",
     "Owner": "platform-team",
     "ManagedBy": "terraform"
-  }}
-}}
+  }
+}
 
 Input: "Set up a production Kubernetes cluster for the API service with 5 nodes"
 
 Output:
-{{
+{
   "resource_type": "eks",
   "resource_name": "prod-api-cluster",
-  "parameters": {{
+  "parameters": {
     "kubernetes_version": "1.28",
     "node_groups": [
-      {{
+      {
         "name": "general",
         "instance_types": ["t3.large"],
         "desired_size": 5,
         "min_size": 3,
         "max_size": 10
-      }}
+      }
     ],
     "private_endpoint": true,
     "public_endpoint": false
-  }},
+  },
   "environment": "prod",
-  "tags": {{
+  "tags": {
     "Environment": "prod",
     "Application": "api",
     "CostCenter": "engineering",
     "Owner": "api-team",
     "ManagedBy": "terraform"
-  }}
-}}
+  }
+}
 
 ## Handling Ambiguity
 
@@ -195,10 +163,193 @@ If the request is ambiguous or missing critical information:
 4. ALWAYS apply security defaults (encryption, private subnets, backups)
 5. NEVER use resource types not listed in the schema
 6. NEVER omit required fields
-7. For RDS, ONLY use allowed engines: {', '.join(resources.get('rds', {}).get('allowed_engines', ['postgres', 'mysql']))}
-8. For RDS, backup_retention_period MUST be >= {resources.get('rds', {}).get('min_backup_days', 7)} days
 
 Remember: Your output will be directly parsed as JSON and used to generate Terraform code. Accuracy and adherence to policies is critical.
+""")
+
+
+def policies_fingerprint(policies: Dict[str, Any]) -> str:
+    """
+    Hash policies into a stable key, independent of dict ordering.
+
+    Args:
+        policies: Organizational policies loaded from policies.yaml
+
+    Returns:
+        Hex digest identifying the policy content
+    """
+    canonical = json.dumps(policies, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def prompt_fingerprint(system_blocks: List[Dict[str, Any]]) -> str:
+    """
+    Hash the text of the system prompt blocks.
+
+    Changes to the prompt wording change the fingerprint even when the
+    policies are unchanged.
+
+    Args:
+        system_blocks: Content blocks from build_system_blocks()
+
+    Returns:
+        Hex digest identifying the system prompt
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for block in system_blocks:
+        digest.update(block["text"].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_system_prompt(policies: Dict[str, Any]) -> str:
+    """
+    Build the system prompt for Claude with organizational policies.
+
+    The prompt is ROLE_AND_EXAMPLES followed by the policy block. Policy
+    blocks are cached by policies_fingerprint(), so repeated calls with the
+    same policies reuse the already rendered text.
+
+    Args:
+        policies: Organizational policies loaded from policies.yaml
+
+    Returns:
+        Complete system prompt string with role definition, schema, examples, and policies
+
+    Example:
+        >>> from src.config.loader import load_policies
+        >>> policies = load_policies()
+        >>> prompt = build_system_prompt(policies)
+        >>> print(len(prompt))  # Should be several thousand characters
+    """
+    return ROLE_AND_EXAMPLES + "\n" + build_policy_block(policies)
+
+
+def build_policy_block(policies: Dict[str, Any]) -> str:
+    """
+    Build the policy-dependent part of the system prompt.
+
+    Args:
+        policies: Organizational policies loaded from policies.yaml
+
+    Returns:
+        Policy block text, cached by policies_fingerprint()
+    """
+    key = policies_fingerprint(policies)
+    block = _prompt_cache.get(key)
+    if block is None:
+        block = _render_policy_block(policies)
+        _prompt_cache[key] = block
+        while len(_prompt_cache) > PROMPT_CACHE_SIZE:
+            _prompt_cache.popitem(last=False)
+    return block
+
+
+def _render_policy_block(policies: Dict[str, Any]) -> str:
+    """
+    Render the policy block text from policies.
+
+    Args:
+        policies: Organizational policies loaded from policies.yaml
+
+    Returns:
+        Policy block string
+    """
+    naming_pattern = policies["naming"]["pattern"]
+    required_tags = policies["tags"]["required"]
+    tag_defaults = policies["tags"].get("defaults", {})
+    security = policies["security"]
+    resources = policies["resources"]
+
+    # Everything interpolated below is rendered in a canonical order so the
+    # block is byte-identical for equivalent policies; the provider's
+    # prompt cache matches on exact bytes.
+    required_tags_list = "\n".join(f"- {tag}" for tag in sorted(required_tags))
+    tag_defaults_json = json.dumps(tag_defaults, sort_keys=True, indent=2, separators=(",", ": "))
+    rds_policy = resources.get('rds', {})
+    rds_engines = ", ".join(sorted(rds_policy.get('allowed_engines', ['postgres', 'mysql'])))
+    rds_min_backup_days = rds_policy.get('min_backup_days', 7)
+
+    block = f"""## Organizational Policies
+
+You MUST enforce these organizational standards in your output:
+
+### Naming Convention
+- All resource names MUST follow this pattern: {naming_pattern}
+- Use lowercase letters, numbers, and hyphens only
+- Example: prod-payments-db, staging-api-cache
+
+### Required Tags
+All resources MUST include these tags:
+{required_tags_list}
+
+Default tag values:
+```json
+{tag_defaults_json}
+```
+
+### Security Policies
+- Encryption required: {security.get('encryption_required', True)}
+- Private subnets only: {security.get('private_subnets_only', True)}
+- Backup required: {security.get('backup_required', True)}
+
+### Resource-Specific Policies
+
+RDS (Relational Database):
+- Allowed engines: {rds_engines}
+- Minimum backup retention: {rds_min_backup_days} days
+- Encryption: {rds_policy.get('encryption', True)}
+
+S3 (Object Storage):
+- Versioning: {resources.get('s3', {}).get('versioning', True)}
+- Encryption: {resources.get('s3', {}).get('encryption', 'AES256')}
+
+EKS (Kubernetes):
+- Minimum nodes: {resources.get('eks', {}).get('min_nodes', 2)}
+- Private endpoint: {resources.get('eks', {}).get('private_endpoint', True)}
+
+### Policy Rules
+
+1. For RDS, ONLY use allowed engines: {rds_engines}
+2. For RDS, backup_retention_period MUST be >= {rds_min_backup_days} days
 """
 
-    return prompt
+    return _normalize_whitespace(block)
+
+
+def build_system_blocks(policies: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build the system prompt as Messages API content blocks.
+
+    The policy-independent ROLE_AND_EXAMPLES block comes first and the
+    policy block second, each with its own cache breakpoint, so editing
+    policies.yaml leaves the leading block's cached prefix intact. Only the
+    user message changes between calls.
+
+    Args:
+        policies: Organizational policies loaded from policies.yaml
+
+    Returns:
+        List of system content blocks for messages.create/stream
+    """
+    policy_block = build_policy_block(policies)
+
+    prompt_chars = len(ROLE_AND_EXAMPLES) + len(policy_block)
+    if prompt_chars < MIN_CACHEABLE_PROMPT_CHARS:
+        logger.warning(
+            f"System prompt is only {prompt_chars} characters; it may be below "
+            f"the minimum cacheable prefix and will not be prompt-cached"
+        )
+
+    return [
+        {
+            "type": "text",
+            "text": ROLE_AND_EXAMPLES,
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": policy_block,
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
@@ -6,11 +6,51 @@ policies to ensure compliance before generating Terraform code.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from src.llm.models import InfrastructureRequest
 
 
+@dataclass(frozen=True)
+class Rule:
+    """
+    A single resource constraint, with its policy values bound in.
+
+    Attributes:
+        value: Extracts the checked value from request parameters
+        check: Returns True if the value satisfies the policy
+        message: Builds the violation message for a failing value
+    """
+
+    value: Callable[[Dict[str, Any]], Any]
+    check: Callable[[Any], bool]
+    message: Callable[[Any], str]
+
+
+@dataclass(frozen=True)
+class PreparedPolicies:
+    """
+    Policy values used by validate_request, extracted once per policies dict.
+
+    Attributes:
+        naming_pattern: Naming convention pattern (e.g. "{environment}-{application}-{resource}")
+        required_tags: Tag names every resource must carry
+        resource_rules: Resource-specific rules keyed by resource type
+    """
+
+    naming_pattern: str
+    required_tags: Tuple[str, ...]
+    resource_rules: Dict[str, Tuple[Rule, ...]]
+
+
+# Most recently prepared policies dict and its PreparedPolicies.
+# load_policies() returns the same dict until policies are reloaded, so an
+# identity check is enough to reuse the prepared values.
+_last_prepared: Optional[Tuple[Dict[str, Any], PreparedPolicies]] = None
+
+
 def validate_naming_pattern(
     resource_name: str,
     pattern: str,
@@ -35,22 +75,42 @@ def validate_naming_pattern(
         >>> validate_naming_pattern("db-prod", "{environment}-{application}-{resource}", "prod", "rds")
         'Naming violation: Expected format {environment}-{application}-{resource}, got db-prod'
     """
-    # Pattern should start with the environment
+    # Fast path: environment prefix followed by at least two non-empty
+    # lowercase segments (environment-application-resource)
+    if _naming_regex(environment).match(resource_name):
+        return None
+
     if not resource_name.startswith(f"{environment}-"):
         return (
             f"Naming violation: Resource name must start with environment '{environment}', "
             f"got '{resource_name}'"
         )
 
-    # Check the pattern has at least 3 parts (env-app-resource)
-    parts = resource_name.split("-")
-    if len(parts) < 3:
-        return (
-            f"Naming violation: Expected format '{pattern}' with at least 3 parts "
-            f"(environment-application-resource), got '{resource_name}' with {len(parts)} parts"
-        )
+    expected = (
+        f"Naming violation: Expected format '{pattern}' with at least 3 non-empty parts "
+        f"(environment-application-resource), got '{resource_name}'"
+    )
+    # Segments after the environment prefix, which may itself contain '-'
+    segments = resource_name[len(environment) + 1:].split("-")
+    if "" in segments:
+        return f"{expected}, which has an empty part"
+    if len(segments) < 2:
+        return f"{expected} with {len(segments) + 1} parts"
+    return f"{expected}; parts may only contain lowercase letters and digits"
+
 
-    return None
+@lru_cache(maxsize=64)
+def _naming_regex(environment: str) -> "re.Pattern[str]":
+    """
+    Compile the naming convention check for an environment.
+
+    Args:
+        environment: The target environment
+
+    Returns:
+        Compiled pattern matching '{environment}-{application}-{resource}' names
+    """
+    return re.compile(rf"^{re.escape(environment)}-[a-z0-9]+(?:-[a-z0-9]+)+$")
 
 
 def validate_required_tags(
@@ -74,12 +134,20 @@ def validate_required_tags(
         >>> print(errors)
         ['Missing required tag: CostCenter']
     """
+    missing = set(required_tags).difference(tags)
+    empty = {
+        tag for tag in set(required_tags) - missing
+        if not tags[tag] or not str(tags[tag]).strip()
+    }
+    if not missing and not empty:
+        return []
+
+    # Report in policy order so output is stable between runs
     violations = []
-
     for required_tag in required_tags:
-        if required_tag not in tags:
+        if required_tag in missing:
             violations.append(f"Missing required tag: {required_tag}")
-        elif not tags[required_tag] or not str(tags[required_tag]).strip():
+        elif required_tag in empty:
             violations.append(f"Required tag '{required_tag}' cannot be empty")
 
     return violations
@@ -96,119 +164,179 @@ def validate_rds_constraints(
         parameters: RDS parameters from infrastructure request
         policies: RDS policies from policies.yaml
 
+    Returns:
+        List of policy violations (empty if valid)
+    """
+    return check_rules(parameters, build_rds_rules(policies.get("rds", {})))
+
+
+def validate_s3_constraints(
+    parameters: Dict[str, Any],
+    policies: Dict[str, Any]
+) -> List[str]:
+    """
+    Validate S3-specific constraints.
+
+    Args:
+        parameters: S3 parameters from infrastructure request
+        policies: S3 policies from policies.yaml
+
+    Returns:
+        List of policy violations (empty if valid)
+    """
+    return check_rules(parameters, build_s3_rules(policies.get("s3", {})))
+
+
+def validate_eks_constraints(
+    parameters: Dict[str, Any],
+    policies: Dict[str, Any]
+) -> List[str]:
+    """
+    Validate EKS-specific constraints.
+
+    Args:
+        parameters: EKS parameters from infrastructure request
+        policies: EKS policies from policies.yaml
+
+    Returns:
+        List of policy violations (empty if valid)
+    """
+    return check_rules(parameters, build_eks_rules(policies.get("eks", {})))
+
+
+def check_rules(parameters: Dict[str, Any], rules: Tuple[Rule, ...]) -> List[str]:
+    """
+    Evaluate resource rules against request parameters in one pass.
+
+    Args:
+        parameters: Resource parameters from infrastructure request
+        rules: Rules built by one of the build_*_rules functions
+
     Returns:
         List of policy violations (empty if valid)
     """
     violations = []
-    rds_policies = policies.get("rds", {})
+    for rule in rules:
+        value = rule.value(parameters)
+        if not rule.check(value):
+            violations.append(rule.message(value))
+    return violations
+
+
+def build_rds_rules(rds_policies: Dict[str, Any]) -> Tuple[Rule, ...]:
+    """
+    Build the RDS rules for the given policies.
 
+    Args:
+        rds_policies: The "rds" section of resource policies
+
+    Returns:
+        Tuple of rules in reporting order
+    """
     # Validate engine
     allowed_engines = rds_policies.get("allowed_engines", ["postgres", "mysql"])
-    engine = parameters.get("engine", "").lower()
-
-    if engine not in allowed_engines:
-        violations.append(
-            f"RDS: Engine '{engine}' not allowed. "
-            f"Allowed engines: {', '.join(allowed_engines)}"
+    allowed_engine_set = frozenset(allowed_engines)
+    allowed_engine_list = ", ".join(allowed_engines)
+    rules = [
+        Rule(
+            value=lambda parameters: parameters.get("engine", "").lower(),
+            check=allowed_engine_set.__contains__,
+            message=lambda engine: (
+                f"RDS: Engine '{engine}' not allowed. "
+                f"Allowed engines: {allowed_engine_list}"
+            )
         )
+    ]
 
     # Validate backup retention
     min_backup_days = rds_policies.get("min_backup_days", 7)
-    backup_retention = parameters.get("backup_retention_period", 0)
-
-    if backup_retention < min_backup_days:
-        violations.append(
+    rules.append(Rule(
+        value=lambda parameters: parameters.get("backup_retention_period", 0),
+        check=lambda backup_retention: not backup_retention < min_backup_days,
+        message=lambda backup_retention: (
             f"RDS: Backup retention period ({backup_retention} days) is less than "
             f"required minimum ({min_backup_days} days)"
         )
+    ))
 
     # Validate encryption
     if rds_policies.get("encryption", True):
-        storage_encrypted = parameters.get("storage_encrypted", False)
-        if not storage_encrypted:
-            violations.append(
-                "RDS: Storage encryption is required by organizational policy"
-            )
+        rules.append(Rule(
+            value=lambda parameters: parameters.get("storage_encrypted", False),
+            check=bool,
+            message=lambda _: "RDS: Storage encryption is required by organizational policy"
+        ))
 
-    return violations
+    return tuple(rules)
 
 
-def validate_s3_constraints(
-    parameters: Dict[str, Any],
-    policies: Dict[str, Any]
-) -> List[str]:
+def build_s3_rules(s3_policies: Dict[str, Any]) -> Tuple[Rule, ...]:
     """
-    Validate S3-specific constraints.
+    Build the S3 rules for the given policies.
 
     Args:
-        parameters: S3 parameters from infrastructure request
-        policies: S3 policies from policies.yaml
+        s3_policies: The "s3" section of resource policies
 
     Returns:
-        List of policy violations (empty if valid)
+        Tuple of rules in reporting order
     """
-    violations = []
-    s3_policies = policies.get("s3", {})
+    rules = []
 
     # Validate versioning
     if s3_policies.get("versioning", True):
-        versioning = parameters.get("versioning", False)
-        if not versioning:
-            violations.append(
-                "S3: Versioning is required by organizational policy"
-            )
+        rules.append(Rule(
+            value=lambda parameters: parameters.get("versioning", False),
+            check=bool,
+            message=lambda _: "S3: Versioning is required by organizational policy"
+        ))
 
     # Validate encryption
     required_encryption = s3_policies.get("encryption", "AES256")
-    encryption = parameters.get("encryption", "")
-
-    if encryption != required_encryption:
-        violations.append(
+    rules.append(Rule(
+        value=lambda parameters: parameters.get("encryption", ""),
+        check=lambda encryption: encryption == required_encryption,
+        message=lambda encryption: (
             f"S3: Encryption must be '{required_encryption}', got '{encryption}'"
         )
+    ))
 
-    return violations
+    return tuple(rules)
 
 
-def validate_eks_constraints(
-    parameters: Dict[str, Any],
-    policies: Dict[str, Any]
-) -> List[str]:
+def build_eks_rules(eks_policies: Dict[str, Any]) -> Tuple[Rule, ...]:
     """
-    Validate EKS-specific constraints.
+    Build the EKS rules for the given policies.
 
     Args:
-        parameters: EKS parameters from infrastructure request
-        policies: EKS policies from policies.yaml
+        eks_policies: The "eks" section of resource policies
 
     Returns:
-        List of policy violations (empty if valid)
+        Tuple of rules in reporting order
     """
-    violations = []
-    eks_policies = policies.get("eks", {})
-
-    # Validate minimum nodes
+    # Validate minimum nodes across all node groups
     min_nodes = eks_policies.get("min_nodes", 2)
-
-    # Check node groups for total desired size
-    node_groups = parameters.get("node_groups", [])
-    total_nodes = sum(ng.get("desired_size", 0) for ng in node_groups)
-
-    if total_nodes < min_nodes:
-        violations.append(
-            f"EKS: Total desired nodes ({total_nodes}) is less than "
-            f"required minimum ({min_nodes} nodes)"
+    rules = [
+        Rule(
+            value=lambda parameters: sum(
+                ng.get("desired_size", 0) for ng in parameters.get("node_groups", [])
+            ),
+            check=lambda total_nodes: not total_nodes < min_nodes,
+            message=lambda total_nodes: (
+                f"EKS: Total desired nodes ({total_nodes}) is less than "
+                f"required minimum ({min_nodes} nodes)"
+            )
         )
+    ]
 
     # Validate private endpoint
     if eks_policies.get("private_endpoint", True):
-        private_endpoint = parameters.get("private_endpoint", False)
-        if not private_endpoint:
-            violations.append(
-                "EKS: Private endpoint is required by organizational policy"
-            )
+        rules.append(Rule(
+            value=lambda parameters: parameters.get("private_endpoint", False),
+            check=bool,
+            message=lambda _: "EKS: Private endpoint is required by organizational policy"
+        ))
 
-    return violations
+    return tuple(rules)
 
 
 def validate_request(
@@ -238,13 +366,13 @@ def validate_request(
         >>> if violations:
         ...     print("Violations found:", violations)
     """
+    prepared = prepare_policies(policies)
     violations = []
 
     # Validate naming pattern
-    naming_pattern = policies.get("naming", {}).get("pattern", "")
     naming_error = validate_naming_pattern(
         request.resource_name,
-        naming_pattern,
+        prepared.naming_pattern,
         request.environment,
         request.resource_type
     )
@@ -252,23 +380,50 @@ def validate_request(
         violations.append(naming_error)
 
     # Validate required tags
-    required_tags = policies.get("tags", {}).get("required", [])
-    tag_violations = validate_required_tags(request.tags, required_tags)
-    violations.extend(tag_violations)
+    violations.extend(validate_required_tags(request.tags, prepared.required_tags))
 
     # Validate resource-specific constraints
-    resource_policies = policies.get("resources", {})
+    resource_rules = prepared.resource_rules.get(request.resource_type)
+    if resource_rules:
+        violations.extend(check_rules(request.parameters, resource_rules))
+
+    return violations
 
-    if request.resource_type == "rds":
-        rds_violations = validate_rds_constraints(request.parameters, resource_policies)
-        violations.extend(rds_violations)
 
-    elif request.resource_type == "s3":
-        s3_violations = validate_s3_constraints(request.parameters, resource_policies)
-        violations.extend(s3_violations)
+def prepare_policies(policies: Dict[str, Any]) -> PreparedPolicies:
+    """
+    Extract the policy values validate_request needs.
 
-    elif request.resource_type == "eks":
-        eks_violations = validate_eks_constraints(request.parameters, resource_policies)
-        violations.extend(eks_violations)
+    The result for the most recent policies dict is reused, so validating
+    many requests against the same policies walks the nested dicts and
+    builds the resource rules once.
 
-    return violations
+    Args:
+        policies: Organizational policies from policies.yaml
+
+    Returns:
+        PreparedPolicies for these policies
+    """
+    global _last_prepared
+    if _last_prepared is not None and _last_prepared[0] is policies:
+        return _last_prepared[1]
+
+    resources = policies.get("resources", {})
+    prepared = PreparedPolicies(
+        naming_pattern=policies.get("naming", {}).get("pattern", ""),
+        required_tags=tuple(policies.get("tags", {}).get("required", [])),
+        resource_rules={
+            resource_type: build_rules(resources.get(resource_type, {}))
+            for resource_type, build_rules in _RULE_BUILDERS.items()
+        }
+    )
+    _last_prepared = (policies, prepared)
+    return prepared
+
+
+# Resource-specific rule builders, keyed by resource type
+_RULE_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Tuple[Rule, ...]]] = {
+    "rds": build_rds_rules,
+    "s3": build_s3_rules,
+    "eks": build_eks_rules,
+}
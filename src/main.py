@@ -4,204 +4,242 @@ InfraLLM - AI-powered infrastructure provisioning CLI.
 Main entry point for the CLI application.
 """
 
-import os
-import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Iterable, List, Set, Tuple
 
-console = Console()
+import click
 
 
-@click.group()
-@click.version_option(version="0.1.0", prog_name="InfraLLM")
-def cli():
+@lru_cache(maxsize=1)
+def _get_console():
     """
-    InfraLLM - AI-powered self-service infrastructure provisioning.
+    Create the rich Console shared by all commands.
 
-    Use natural language to generate production-ready Terraform code
-    with organizational standards and automated PR creation.
+    rich is imported here rather than at module level so that `--help`,
+    `--version` and shell completion don't pay for loading it.
 
-    \b
-    Quick Start:
-      1. infrallm configure              # Set up API keys and GitHub
-      2. infrallm provision "dev S3 bucket for logs"
-      3. Review and merge the created PR
+    When stdout isn't a terminal (CI logs, pipes) rich emits no colour, so
+    automatic highlighting, which runs a set of regexes over every printed
+    line, is switched off. Markup is still parsed so that tags are
+    stripped rather than printed literally.
 
-    \b
-    Examples:
-      infrallm provision "production Postgres database for payments API"
-      infrallm dry-run "staging EKS cluster with 5 nodes"
-      infrallm validate terraform/prod/database.tf
-
-    \b
-    Documentation: https://github.com/your-org/infrallm
+    Returns:
+        rich Console instance
     """
-    pass
+    import sys
+    from rich.console import Console
 
+    return Console(highlight=sys.stdout.isatty())
 
-@cli.command()
-@click.argument("request", type=str)
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def provision(request: str, verbose: bool):
+
+def _require_installed(*modules: str) -> None:
     """
-    Generate Terraform code from natural language and create a GitHub PR.
+    Abort with an install hint if any of the given modules is missing.
 
-    This command:
-    - Parses your request using Claude AI
-    - Generates production-ready Terraform code
-    - Formats code with terraform fmt
-    - Creates a GitHub pull request with detailed description
+    Checked before importing the Claude client so a broken environment
+    gets a clear message instead of an ImportError traceback.
 
-    \b
-    Examples:
-      infrallm provision "production Postgres database for payments API with 200GB storage"
-      infrallm provision "staging S3 bucket for application logs with 60-day retention"
-      infrallm provision "dev EKS cluster for API service with 5 nodes"
+    Args:
+        *modules: Top-level module names to look for
 
-    \b
-    The generated PR includes:
-      - All Terraform files (main.tf, variables.tf, outputs.tf, etc.)
-      - AI-generated description explaining the infrastructure
-      - Security compliance checklist
-      - Appropriate labels for filtering
+    Raises:
+        click.Abort: If any module cannot be found
     """
-    from src.llm.client import ClaudeClient
-    from src.llm.exceptions import (
-        ConfigurationError,
-        APIError,
-        ValidationError as PolicyValidationError,
-        ParsingError
-    )
-
-    console.print(Panel.fit(
-        f"[bold cyan]Provisioning Infrastructure[/bold cyan]\n\n{request}",
-        border_style="cyan"
-    ))
-
-    try:
-        # Initialize Claude client
-        client = ClaudeClient()
+    missing = [module for module in modules if find_spec(module) is None]
+    if missing:
+        console = _get_console()
+        console.print(f"\n[bold red]Missing Dependency:[/bold red] {', '.join(missing)}")
+        console.print("\n[yellow]Fix:[/yellow] Reinstall InfraLLM with its dependencies")
+        console.print("[dim]Example: pip install -e .[/dim]")
+        raise click.Abort()
 
-        # Parse infrastructure request
-        with console.status("[bold blue]Parsing infrastructure request with Claude..."):
-            requirements = client.parse_infrastructure_request(request)
 
-        # Display parsed requirements
-        console.print("\n[bold green]✓ Successfully Parsed Requirements[/bold green]\n")
+def _print_json(console, data) -> None:
+    """
+    Print data as indented JSON.
 
-        console.print(f"  [cyan]Resource Type:[/cyan] {requirements['resource_type'].upper()}")
-        console.print(f"  [cyan]Resource Name:[/cyan] {requirements['resource_name']}")
-        console.print(f"  [cyan]Environment:[/cyan] {requirements['environment']}")
+    Serialized with orjson rather than rich's print_json, which goes
+    through json.dumps and re-parses the text before printing it.
 
-        # Show key parameters
-        console.print(f"\n  [cyan]Parameters:[/cyan]")
-        for key, value in list(requirements['parameters'].items())[:5]:
-            console.print(f"    • {key}: {value}")
-        if len(requirements['parameters']) > 5:
-            console.print(f"    • ... and {len(requirements['parameters']) - 5} more")
+    Args:
+        console: rich Console to print to
+        data: JSON-serializable data
+    """
+    import orjson
 
-        # Show tags
-        console.print(f"\n  [cyan]Tags:[/cyan]")
-        for key, value in requirements['tags'].items():
-            console.print(f"    • {key}: {value}")
+    console.print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(), markup=False)
 
-        if verbose:
-            console.print("\n[bold]Full JSON Output:[/bold]")
-            console.print_json(data=requirements)
 
-        # Generate Terraform code
-        from src.terraform.generator import TerraformGenerator
-        from src.terraform.exceptions import TerraformGenerationError
+# Files longer than this are previewed without a line-number gutter
+_PREVIEW_LINE_NUMBERS_MAX_CHARS = 4096
 
-        console.print("\n[bold blue]Generating Terraform Code...[/bold blue]")
 
-        try:
-            generator = TerraformGenerator()
-            with console.status("[bold blue]Rendering templates..."):
-                terraform = generator.generate(requirements)
+@lru_cache(maxsize=1)
+def _get_hcl_highlighting():
+    """
+    Load the Pygments HCL lexer and the monokai theme once.
 
-            console.print("[bold green]✓ Successfully Generated Terraform Code[/bold green]\n")
+    Passing these objects to Syntax skips the lexer registry lookup and
+    theme construction Syntax would otherwise do for every file. Importing
+    rich.syntax also pulls in Pygments, so dry-run calls this on a
+    background thread while it waits for Claude.
 
-            console.print(f"  [cyan]Files Generated:[/cyan]")
-            for filename in terraform.files.keys():
-                console.print(f"    • {filename}")
+    Returns:
+        Tuple of (HCL lexer, monokai SyntaxTheme)
+    """
+    from pygments.lexers import get_lexer_by_name
+    from rich.syntax import Syntax
 
-            console.print(f"\n  [cyan]Output Directory:[/cyan] {terraform.get_directory_name()}")
+    return get_lexer_by_name("hcl"), Syntax.get_theme("monokai")
 
-            if verbose:
-                console.print("\n[bold]Generated Terraform Preview:[/bold]")
-                console.print(terraform.format_for_display())
 
-        except TerraformGenerationError as e:
-            console.print(f"\n[bold red]Terraform Generation Error:[/bold red] {str(e)}")
-            console.print(f"\n[yellow]Tip:[/yellow] Check that templates exist for resource type '{requirements['resource_type']}'")
-            raise click.Abort()
+class _Clients:
+    """
+    Clients used to provision requests, each created on first use.
 
-        # Phase 4: Create GitHub PR with terraform files
-        from src.git.github import GitHubClient
-        from src.git.exceptions import (
-            ConfigurationError as GitHubConfigError,
-            RepositoryNotFoundError,
-            BranchCreationError,
-            CommitError,
-            PullRequestError,
-            GitHubError
-        )
+    A single command builds each one at most once; `serve` keeps them for
+    every request it handles. Construction happens inside _run_provision's
+    error handling, so missing credentials are reported like any other
+    failure. Commands call close() when they are done with the clients.
+    """
 
-        console.print("\n[bold blue]Creating GitHub Pull Request...[/bold blue]")
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize with no clients created yet.
+
+        Args:
+            use_cache: Reuse earlier parses of identical requests
+        """
+        self.use_cache = use_cache
+        self._claude = None
+        self._generator = None
+        self._github = None
+        # Background warm-up threads, kept apart so that waiting for the
+        # generator never waits on GitHub round trips
+        self._generator_warm_up = None
+        self._github_warm_up = None
+
+    def warm_up(self) -> None:
+        """
+        Start creating the generator and GitHub client in the background.
+
+        Called before the Claude request so template loading and the
+        GitHub repository and base branch lookups overlap with it. Each
+        runs on its own thread. Errors are ignored here; generator() and
+        github() raise them again where they are reported.
+        """
+        if self._generator_warm_up is None:
+            import threading
+            self._generator_warm_up = threading.Thread(target=self._warm_up_generator, daemon=True)
+            self._github_warm_up = threading.Thread(target=self._warm_up_github, daemon=True)
+            self._generator_warm_up.start()
+            self._github_warm_up.start()
+
+    def _warm_up_generator(self) -> None:
+        """Create the generator, ignoring errors."""
+        try:
+            self.generator()
+        except Exception:
+            pass
 
+    def _warm_up_github(self) -> None:
+        """Create the GitHub client and prefetch its lookups, ignoring errors."""
         try:
-            github_client = GitHubClient()
+            self.github().prefetch()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _wait_for(thread) -> None:
+        """Wait for a background warm-up thread, unless it is this one."""
+        import threading
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def close(self) -> None:
+        """Close the GitHub client, if one was created."""
+        self._wait_for(self._github_warm_up)
+        if self._github is not None:
+            self._github.close()
+            self._github = None
+
+    def claude(self):
+        """Get the ClaudeClient, creating it on first use."""
+        if self._claude is None:
+            from src.llm.client import ClaudeClient
+            self._claude = ClaudeClient(use_cache=self.use_cache)
+        return self._claude
+
+    def generator(self):
+        """Get the TerraformGenerator, creating it on first use."""
+        self._wait_for(self._generator_warm_up)
+        if self._generator is None:
+            from src.terraform.generator import TerraformGenerator
+            self._generator = TerraformGenerator()
+        return self._generator
+
+    def github(self):
+        """Get the GitHubClient, creating it on first use."""
+        self._wait_for(self._github_warm_up)
+        if self._github is None:
+            from src.git.github import GitHubClient
+            self._github = GitHubClient()
+        return self._github
+
+
+# Innermost stack frames shown in --verbose tracebacks
+_TRACEBACK_FRAMES = 12
+
+
+def _format_traceback(error: BaseException) -> str:
+    """
+    Format an exception's traceback for printing to the console.
 
-            with console.status("[bold blue]Formatting Terraform code and creating PR..."):
-                pr_result = github_client.create_pr(
-                    terraform=terraform,
-                    requirements=requirements
-                )
+    Only the innermost _TRACEBACK_FRAMES frames are kept, since that's where
+    the error was raised; the outer frames are always click and the
+    command itself. Square brackets are escaped so rich doesn't read
+    parts of the traceback as markup.
 
-            console.print("\n[bold green]✓ Successfully Created Pull Request[/bold green]\n")
+    Args:
+        error: Exception to format
 
-            console.print(f"  [cyan]PR URL:[/cyan] {pr_result['pr_url']}")
-            console.print(f"  [cyan]Branch:[/cyan] {pr_result['branch_name']}")
-            console.print(f"  [cyan]PR Number:[/cyan] #{pr_result['pr_number']}")
+    Returns:
+        Formatted traceback, escaped for rich markup
+    """
+    import traceback
+    from rich.markup import escape
 
-            console.print(f"\n[green]Next steps:[/green]")
-            console.print(f"  1. Review the PR at {pr_result['pr_url']}")
-            console.print(f"  2. Verify the Terraform code")
-            console.print(f"  3. Merge when ready to provision infrastructure")
+    return escape("".join(
+        traceback.TracebackException.from_exception(error, limit=-_TRACEBACK_FRAMES).format()
+    ))
 
-        except GitHubConfigError as e:
-            console.print(f"\n[bold red]GitHub Configuration Error:[/bold red] {str(e)}")
-            console.print("\n[yellow]Fix:[/yellow] Set GitHub credentials in your .env file:")
-            console.print("[dim]  GITHUB_TOKEN=your_token_here[/dim]")
-            console.print("[dim]  GITHUB_ORG=your-organization[/dim]")
-            console.print("[dim]  GITHUB_REPO=infrastructure[/dim]")
-            raise click.Abort()
 
-        except RepositoryNotFoundError as e:
-            console.print(f"\n[bold red]Repository Not Found:[/bold red] {str(e)}")
-            console.print("\n[yellow]Tip:[/yellow] Verify your GITHUB_ORG and GITHUB_REPO settings")
-            raise click.Abort()
+@contextmanager
+def _reporting_errors(console, verbose: bool):
+    """
+    Report errors from parsing, validating and provisioning a request.
 
-        except (BranchCreationError, CommitError, PullRequestError) as e:
-            console.print(f"\n[bold red]GitHub Error:[/bold red] {str(e)}")
-            console.print("\n[yellow]Troubleshooting:[/yellow]")
-            console.print("  1. Verify your GitHub token has write permissions")
-            console.print("  2. Check if the repository allows PR creation")
-            console.print("  3. Ensure no branch name conflicts")
-            if verbose:
-                import traceback
-                console.print("\n[dim]" + traceback.format_exc() + "[/dim]")
-            raise click.Abort()
+    Each known error is printed with a hint for fixing it and turned into
+    click.Abort; provision and dry-run share these handlers.
 
-        except GitHubError as e:
-            console.print(f"\n[bold red]Unexpected GitHub Error:[/bold red] {str(e)}")
-            if verbose:
-                import traceback
-                console.print("\n[dim]" + traceback.format_exc() + "[/dim]")
-            raise click.Abort()
+    Args:
+        console: rich Console to print to
+        verbose: Print tracebacks for parsing and unexpected errors
+
+    Raises:
+        click.Abort: If the wrapped block raised (after it has been printed)
+    """
+    from src.llm.exceptions import (
+        ConfigurationError,
+        APIError,
+        ValidationError as PolicyValidationError,
+        ParsingError
+    )
 
+    try:
+        yield
     except ConfigurationError as e:
         console.print(f"\n[bold red]Configuration Error:[/bold red] {str(e)}")
         console.print("\n[yellow]Fix:[/yellow] Ensure ANTHROPIC_API_KEY is set in your .env file")
@@ -220,8 +258,7 @@ def provision(request: str, verbose: bool):
         console.print(f"\n[bold red]Parsing Error:[/bold red] {str(e)}")
         console.print("\n[yellow]Tip:[/yellow] Try rephrasing your request with more specific details")
         if verbose:
-            import traceback
-            console.print("\n[dim]" + traceback.format_exc() + "[/dim]")
+            console.print("\n[dim]" + _format_traceback(e) + "[/dim]")
         raise click.Abort()
 
     except APIError as e:
@@ -232,19 +269,561 @@ def provision(request: str, verbose: bool):
         console.print("  3. Visit https://status.anthropic.com for service status")
         raise click.Abort()
 
+    except click.Abort:
+        # Already reported inside the wrapped block
+        raise
+
     except Exception as e:
         console.print(f"\n[bold red]Unexpected Error:[/bold red] {str(e)}")
         if verbose:
-            import traceback
-            console.print("\n[dim]Full traceback:[/dim]")
-            console.print(traceback.format_exc())
+            console.print("\n[dim]Traceback:[/dim]")
+            console.print(_format_traceback(e))
+        raise click.Abort()
+
+
+def _run_provision(console, clients: "_Clients", request: str, verbose: bool) -> None:
+    """
+    Parse a request, generate its Terraform code and open a pull request.
+
+    Progress and errors are printed to the console.
+
+    Args:
+        console: rich Console to print to
+        clients: Clients to parse, render and open the PR with
+        request: Natural language infrastructure request
+        verbose: Print full JSON, Terraform previews and tracebacks
+
+    Raises:
+        click.Abort: If any step fails (after the error has been printed)
+    """
+    from itertools import islice
+
+    with _reporting_errors(console, verbose):
+        # One status spinner, relabelled for each phase, so rich runs a
+        # single live display for the whole request
+        with console.status("[bold blue]Parsing infrastructure request with Claude...") as status:
+            claude = clients.claude()
+            clients.warm_up()
+
+            # Parse infrastructure request
+            requirements = claude.parse_infrastructure_request(request)
+
+            # Display parsed requirements
+            console.print("\n[bold green]✓ Successfully Parsed Requirements[/bold green]\n")
+
+            # The summary is assembled first and printed in one call, so rich
+            # renders and writes it once rather than once per line
+            summary = [
+                f"  [cyan]Resource Type:[/cyan] {requirements['resource_type'].upper()}",
+                f"  [cyan]Resource Name:[/cyan] {requirements['resource_name']}",
+                f"  [cyan]Environment:[/cyan] {requirements['environment']}",
+            ]
+
+            # Show key parameters
+            parameters = requirements['parameters']
+            summary.append(f"\n  [cyan]Parameters:[/cyan]")
+            for key, value in islice(parameters.items(), 5):
+                summary.append(f"    • {key}: {value}")
+            if len(parameters) > 5:
+                summary.append(f"    • ... and {len(parameters) - 5} more")
+
+            # Show tags
+            summary.append(f"\n  [cyan]Tags:[/cyan]")
+            for key, value in requirements['tags'].items():
+                summary.append(f"    • {key}: {value}")
+
+            console.print("\n".join(summary))
+
+            if verbose:
+                console.print("\n[bold]Full JSON Output:[/bold]")
+                _print_json(console, requirements)
+
+            # Generate Terraform code
+            from src.terraform.exceptions import TerraformGenerationError
+
+            console.print("\n[bold blue]Generating Terraform Code...[/bold blue]")
+
+            try:
+                status.update("[bold blue]Rendering templates...")
+                terraform = clients.generator().generate(requirements)
+
+                console.print("[bold green]✓ Successfully Generated Terraform Code[/bold green]\n")
+
+                console.print("\n".join(
+                    [f"  [cyan]Files Generated:[/cyan]"]
+                    + [f"    • {filename}" for filename in terraform.files.keys()]
+                ))
+
+                console.print(f"\n  [cyan]Output Directory:[/cyan] {terraform.get_directory_name()}")
+
+                if verbose:
+                    console.print("\n[bold]Generated Terraform Preview:[/bold]")
+                    console.print(terraform.format_for_display())
+
+            except TerraformGenerationError as e:
+                console.print(f"\n[bold red]Terraform Generation Error:[/bold red] {str(e)}")
+                console.print(f"\n[yellow]Tip:[/yellow] Check that templates exist for resource type '{requirements['resource_type']}'")
+                raise click.Abort()
+
+            # Phase 4: Create GitHub PR with terraform files
+            from src.git.exceptions import (
+                ConfigurationError as GitHubConfigError,
+                RepositoryNotFoundError,
+                BranchCreationError,
+                CommitError,
+                PullRequestError,
+                GitHubError
+            )
+
+            console.print("\n[bold blue]Creating GitHub Pull Request...[/bold blue]")
+
+            try:
+                status.update("[bold blue]Formatting Terraform code and creating PR...")
+                pr_result = clients.github().create_pr(
+                    terraform=terraform,
+                    requirements=requirements
+                )
+
+                console.print("\n[bold green]✓ Successfully Created Pull Request[/bold green]\n")
+
+                console.print(f"  [cyan]PR URL:[/cyan] {pr_result['pr_url']}")
+                console.print(f"  [cyan]Branch:[/cyan] {pr_result['branch_name']}")
+                console.print(f"  [cyan]PR Number:[/cyan] #{pr_result['pr_number']}")
+
+                console.print(f"\n[green]Next steps:[/green]")
+                console.print(f"  1. Review the PR at {pr_result['pr_url']}")
+                console.print(f"  2. Verify the Terraform code")
+                console.print(f"  3. Merge when ready to provision infrastructure")
+
+            except GitHubConfigError as e:
+                console.print(f"\n[bold red]GitHub Configuration Error:[/bold red] {str(e)}")
+                console.print("\n[yellow]Fix:[/yellow] Set GitHub credentials in your .env file:")
+                console.print("[dim]  GITHUB_TOKEN=your_token_here[/dim]")
+                console.print("[dim]  GITHUB_ORG=your-organization[/dim]")
+                console.print("[dim]  GITHUB_REPO=infrastructure[/dim]")
+                raise click.Abort()
+
+            except RepositoryNotFoundError as e:
+                console.print(f"\n[bold red]Repository Not Found:[/bold red] {str(e)}")
+                console.print("\n[yellow]Tip:[/yellow] Verify your GITHUB_ORG and GITHUB_REPO settings")
+                raise click.Abort()
+
+            except (BranchCreationError, CommitError, PullRequestError) as e:
+                console.print(f"\n[bold red]GitHub Error:[/bold red] {str(e)}")
+                console.print("\n[yellow]Troubleshooting:[/yellow]")
+                console.print("  1. Verify your GitHub token has write permissions")
+                console.print("  2. Check if the repository allows PR creation")
+                console.print("  3. Ensure no branch name conflicts")
+                if verbose:
+                    console.print("\n[dim]" + _format_traceback(e) + "[/dim]")
+                raise click.Abort()
+
+            except GitHubError as e:
+                console.print(f"\n[bold red]Unexpected GitHub Error:[/bold red] {str(e)}")
+                if verbose:
+                    console.print("\n[dim]" + _format_traceback(e) + "[/dim]")
+                raise click.Abort()
+
+
+def _provision_many(console, clients: "_Clients", requests: List[str], verbose: bool) -> None:
+    """
+    Provision several requests, parsing them with Claude concurrently.
+
+    Each request that parses and passes policy validation then gets its
+    Terraform code generated and its own GitHub pull request. Results are
+    shown in a table; a failed request doesn't stop the others.
+
+    Args:
+        console: rich Console to print to
+        clients: Clients to parse, render and open the PRs with
+        requests: Natural language infrastructure requests
+        verbose: Print tracebacks for unexpected errors
+
+    Raises:
+        click.Abort: If the Claude client cannot be configured
+        SystemExit: With status 1 if any request failed
+    """
+    import asyncio
+    from rich.table import Table
+    from src.llm.exceptions import (
+        ConfigurationError,
+        InfraLLMError,
+        ValidationError as PolicyValidationError
+    )
+    from src.terraform.exceptions import TerraformGenerationError
+    from src.git.exceptions import GitHubError
+
+    try:
+        with console.status(f"[bold blue]Parsing {len(requests)} requests with Claude..."):
+            results = asyncio.run(clients.claude().parse_many(requests))
+
+    except ConfigurationError as e:
+        console.print(f"\n[bold red]Configuration Error:[/bold red] {str(e)}")
+        console.print("\n[yellow]Fix:[/yellow] Ensure ANTHROPIC_API_KEY is set in your .env file")
         raise click.Abort()
 
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("Request")
+    table.add_column("Result")
+
+    failures = 0
+
+    for i, (request, result) in enumerate(zip(requests, results), 1):
+        if isinstance(result, PolicyValidationError):
+            failures += 1
+            table.add_row(str(i), request, "[red]Policy violations: " + "; ".join(result.violations))
+            continue
+        if isinstance(result, BaseException):
+            failures += 1
+            table.add_row(str(i), request, f"[red]{type(result).__name__}: {result}")
+            if verbose and not isinstance(result, InfraLLMError):
+                console.print("\n[dim]" + _format_traceback(result) + "[/dim]")
+            continue
+
+        try:
+            # Clients are created on first use so a batch that fails to
+            # parse entirely never needs GitHub credentials
+            with console.status(f"[bold blue]Creating PR for {result['resource_name']}..."):
+                terraform = clients.generator().generate(result)
+                pr_result = clients.github().create_pr(terraform=terraform, requirements=result)
+
+            table.add_row(str(i), request, f"[green]{pr_result['pr_url']}")
+
+        except (TerraformGenerationError, GitHubError) as e:
+            failures += 1
+            table.add_row(str(i), request, f"[red]{type(e).__name__}: {e}")
+            if verbose:
+                console.print("\n[dim]" + _format_traceback(e) + "[/dim]")
+
+    console.print()
+    console.print(table)
+
+    console.print()
+    if failures:
+        console.print(f"[bold yellow]{len(requests) - failures} of {len(requests)} request(s) provisioned[/bold yellow]")
+        raise SystemExit(1)
+    console.print(f"[bold green]✓ All {len(requests)} request(s) provisioned[/bold green]")
+
+
+@lru_cache(maxsize=1)
+def _env_line_pattern():
+    """
+    Compile the pattern matching one ``KEY=value`` line of a .env file.
+
+    Returns:
+        Compiled multiline pattern with ``key``, ``double``, ``single``
+        and ``bare`` groups
+    """
+    import re
+
+    return re.compile(
+        r"""^[ \t]*(?:export[ \t]+)?(?P<key>[A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+        r"""(?:"(?P<double>(?:[^"\\]|\\.)*)"|'(?P<single>[^']*)'|(?P<bare>[^\r\n]*?))"""
+        r"""[ \t]*\r?$""",
+        re.MULTILINE,
+    )
+
+
+def _read_env_file(path) -> dict:
+    """
+    Read the variables defined in a .env file.
+
+    The file is matched in a single pass. Comment lines are skipped,
+    and quotes around a value are removed.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Dictionary mapping variable names to values
+    """
+    import re
+
+    values = {}
+    for match in _env_line_pattern().finditer(path.read_text()):
+        if match.group("double") is not None:
+            value = re.sub(
+                r"\\(.)",
+                lambda m: "\n" if m.group(1) == "n" else m.group(1),
+                match.group("double"),
+            )
+        elif match.group("single") is not None:
+            value = match.group("single")
+        else:
+            value = match.group("bare")
+        values[match.group("key")] = value
+
+    return values
+
+
+# Literal checks made by `validate`, as check name -> substrings, any of
+# which counts as a match
+_POLICY_CHECKS = {
+    "s3": (b"s3_bucket",),
+    "encryption": (b"encryption",),
+    "public_access_block": (b"public_access_block",),
+    "versioning": (b"versioning",),
+    "rds": (b"db_instance",),
+    "rds_encryption": (b"storage_encrypted = true", b"storage_encrypted=true"),
+    "backup_retention": (b"backup_retention_period",),
+    "environment": (b"prod", b"staging", b"dev"),
+    "managed_by": (b"ManagedBy",),
+}
+
+
+@lru_cache(maxsize=64)
+def _required_tag_pattern(tag: str):
+    """
+    Compile the check for a required tag assignment, allowing for the
+    whitespace terraform fmt adds when it aligns attributes.
+
+    Args:
+        tag: Tag name required by the policies
+
+    Returns:
+        Compiled bytes pattern matching '<tag> =' as a whole word
+    """
+    import re
+
+    return re.compile(rf"(?<!\w){re.escape(tag)}\s*=".encode())
+
+
+def _run_policy_checks(data: bytes, required_tags: Iterable[str]) -> Set[str]:
+    """
+    Find which of the `validate` checks match in a Terraform file.
+
+    Substring checks are plain `in` tests, which are much faster on large
+    files than a combined regular expression. Required tags (reported as
+    tag_0, tag_1, ...) use a regex so aligned assignments are found.
+
+    Args:
+        data: Terraform source as bytes
+        required_tags: Tag names required by the policies
+
+    Returns:
+        Names of the checks that matched
+    """
+    hits = {
+        name for name, needles in _POLICY_CHECKS.items()
+        if any(needle in data for needle in needles)
+    }
+    hits.update(
+        f"tag_{index}" for index, tag in enumerate(required_tags)
+        # The substring test rules out missing tags without the regex
+        if tag.encode() in data and _required_tag_pattern(tag).search(data)
+    )
+    if "managed_by" in hits and b"terraform" in data.lower():
+        hits.add("terraform")
+    return hits
+
+
+def _check_anthropic_key(api_key: str) -> str:
+    """
+    Check that an Anthropic client can be created with an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Message describing the result
+    """
+    try:
+        import anthropic
+        anthropic.Anthropic(api_key=api_key)
+        # Simple test - just creating the client is enough
+        return "✓ Anthropic API key format looks valid"
+    except Exception as e:
+        return f"[yellow]⚠ Warning: Could not verify Anthropic API key: {str(e)}[/yellow]"
+
+
+def _check_github_user(token: str) -> Tuple[str, bool]:
+    """
+    Check that a GitHub token authenticates.
+
+    Args:
+        token: GitHub token
+
+    Returns:
+        Tuple of (message describing the result, whether it authenticated)
+    """
+    try:
+        from github import Github
+        user = Github(token).get_user()
+        return f"✓ GitHub authenticated as: {user.login}", True
+    except Exception as e:
+        return f"[yellow]⚠ Warning: Could not verify GitHub connection: {str(e)}[/yellow]", False
+
+
+def _check_github_repo(token: str, org: str, repo_name: str) -> List[str]:
+    """
+    Check that a GitHub token can access a repository.
+
+    Args:
+        token: GitHub token
+        org: GitHub organization or username
+        repo_name: Repository name
+
+    Returns:
+        Messages describing the result
+    """
+    try:
+        from github import Github
+        repo = Github(token).get_repo(f"{org}/{repo_name}")
+        return [f"✓ Repository accessible: {repo.full_name}"]
+    except Exception as e:
+        return [
+            f"[yellow]⚠ Warning: Repository '{org}/{repo_name}' not accessible: {str(e)}[/yellow]",
+            "[yellow]  Make sure the repository exists and your token has access[/yellow]",
+        ]
+
+
+@click.group()
+@click.version_option(version="0.1.0", prog_name="InfraLLM")
+def cli():
+    """
+    InfraLLM - AI-powered self-service infrastructure provisioning.
+
+    Use natural language to generate production-ready Terraform code
+    with organizational standards and automated PR creation.
+
+    \b
+    Quick Start:
+      1. infrallm configure              # Set up API keys and GitHub
+      2. infrallm provision "dev S3 bucket for logs"
+      3. Review and merge the created PR
+
+    \b
+    Examples:
+      infrallm provision "production Postgres database for payments API"
+      infrallm dry-run "staging EKS cluster with 5 nodes"
+      infrallm provision-batch requests.txt
+      infrallm validate terraform/prod/database.tf
+
+    \b
+    Documentation: https://github.com/your-org/infrallm
+    """
+    pass
+
+
+@cli.command()
+@click.argument("request", type=str, required=False)
+@click.option(
+    "--request", "-r", "extra_requests", multiple=True,
+    help="Another request to provision; may be repeated"
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.option("--no-cache", is_flag=True, help="Always call Claude, ignoring cached parses")
+def provision(request: str, extra_requests: Tuple[str, ...], verbose: bool, no_cache: bool):
+    """
+    Generate Terraform code from natural language and create a GitHub PR.
+
+    Further requests can be given with --request; they are then parsed by
+    Claude concurrently and each gets its own PR, as with provision-batch.
+
+    This command:
+    - Parses your request using Claude AI
+    - Generates production-ready Terraform code
+    - Formats code with terraform fmt
+    - Creates a GitHub pull request with detailed description
+
+    \b
+    Examples:
+      infrallm provision "production Postgres database for payments API with 200GB storage"
+      infrallm provision "staging S3 bucket for application logs with 60-day retention"
+      infrallm provision "dev EKS cluster for API service with 5 nodes"
+      infrallm provision "dev S3 bucket for logs" -r "dev EKS cluster for the api"
+
+    \b
+    The generated PR includes:
+      - All Terraform files (main.tf, variables.tf, outputs.tf, etc.)
+      - AI-generated description explaining the infrastructure
+      - Security compliance checklist
+      - Appropriate labels for filtering
+    """
+    from rich.panel import Panel
+
+    requests = ([request] if request else []) + list(extra_requests)
+    if not requests:
+        raise click.UsageError("Missing argument 'REQUEST'.")
+
+    console = _get_console()
+
+    console.print(Panel.fit(
+        "[bold cyan]Provisioning Infrastructure[/bold cyan]\n\n" + "\n".join(requests),
+        border_style="cyan"
+    ))
+
+    _require_installed("anthropic", "pydantic")
+
+    with closing(_Clients(use_cache=not no_cache)) as clients:
+        if len(requests) > 1:
+            _provision_many(console, clients, requests, verbose)
+        else:
+            _run_provision(console, clients, requests[0], verbose)
+
+
+@cli.command()
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.option("--no-cache", is_flag=True, help="Always call Claude, ignoring cached parses")
+def serve(verbose: bool, no_cache: bool):
+    """
+    Provision requests read from stdin, one per line, in one process.
+
+    Imports, the Claude and GitHub clients and the template environment
+    are set up once and reused, so every request after the first skips
+    CLI startup. Each request goes through the same steps as provision.
+
+    \b
+    Examples:
+      infrallm serve
+      tail -f requests.txt | infrallm serve --verbose
+
+    \b
+    Blank lines and lines starting with # are ignored. A failed request
+    is reported and the next line is read; end input with Ctrl-D.
+    """
+    import sys
+    from rich.panel import Panel
+
+    console = _get_console()
+
+    console.print(Panel.fit(
+        "[bold cyan]InfraLLM Server[/bold cyan]\n\n"
+        "Enter one infrastructure request per line (Ctrl-D to exit)",
+        border_style="cyan"
+    ))
+
+    _require_installed("anthropic", "pydantic")
+
+    handled = 0
+    failures = 0
+
+    with closing(_Clients(use_cache=not no_cache)) as clients:
+        for line in sys.stdin:
+            request = line.strip()
+            if not request or request.startswith("#"):
+                continue
+
+            handled += 1
+            console.print(f"\n[bold cyan]Provisioning:[/bold cyan] {request}")
+            try:
+                _run_provision(console, clients, request, verbose)
+            except click.Abort:
+                failures += 1
+
+    console.print()
+    if failures:
+        console.print(f"[bold yellow]{handled - failures} of {handled} request(s) provisioned[/bold yellow]")
+        raise SystemExit(1)
+    console.print(f"[bold green]✓ {handled} request(s) provisioned[/bold green]")
+
 
 @cli.command()
 @click.argument("request", type=str)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def dry_run(request: str, verbose: bool):
+@click.option("--no-cache", is_flag=True, help="Always call Claude, ignoring cached parses")
+def dry_run(request: str, verbose: bool, no_cache: bool):
     """
     Preview generated Terraform code without creating a PR.
 
@@ -263,22 +842,27 @@ def dry_run(request: str, verbose: bool):
       - Displays syntax-highlighted preview
       - Does NOT create any PR or modify files
     """
-    from src.llm.client import ClaudeClient
-    from src.llm.exceptions import (
-        ConfigurationError,
-        APIError,
-        ValidationError as PolicyValidationError,
-        ParsingError
-    )
+    import threading
+    from rich.panel import Panel
+
+    console = _get_console()
 
     console.print(Panel.fit(
         f"[bold yellow]Dry Run Mode[/bold yellow]\n\n{request}",
         border_style="yellow"
     ))
 
-    try:
+    _require_installed("anthropic", "pydantic")
+
+    with _reporting_errors(console, verbose):
         # Initialize Claude client
-        client = ClaudeClient()
+        from src.llm.client import ClaudeClient
+
+        client = ClaudeClient(use_cache=not no_cache)
+
+        # Load the highlighter for the preview while Claude is working
+        highlighter_warmup = threading.Thread(target=_get_hcl_highlighting, daemon=True)
+        highlighter_warmup.start()
 
         # Parse infrastructure request
         with console.status("[bold blue]Parsing infrastructure request with Claude..."):
@@ -297,11 +881,13 @@ def dry_run(request: str, verbose: bool):
 
         # Always show full JSON in dry-run mode
         console.print("\n[bold]Full Configuration:[/bold]")
-        console.print_json(data=requirements)
+        _print_json(console, requirements)
 
         # Generate Terraform code for preview
         from src.terraform.generator import TerraformGenerator
         from src.terraform.exceptions import TerraformGenerationError
+        highlighter_warmup.join()
+        hcl_lexer, hcl_theme = _get_hcl_highlighting()
         from rich.syntax import Syntax
 
         console.print("\n[bold blue]Generating Terraform Code Preview...[/bold blue]")
@@ -313,12 +899,21 @@ def dry_run(request: str, verbose: bool):
 
             console.print("\n[bold green]✓ Generated Terraform Code (Preview Only)[/bold green]\n")
 
-            # Display each file with syntax highlighting
+            # Display each file with syntax highlighting. Each file is
+            # rendered and flushed on its own, so only one file's segments
+            # are held at a time and piped output shows up file by file
+            # instead of when the stdout buffer fills. Large files skip the
+            # line-number gutter, which is padded and styled per line.
             for filename, content in terraform.files.items():
                 console.print(f"\n[bold cyan]━━━ {filename} ━━━[/bold cyan]")
-                syntax = Syntax(content, "hcl", theme="monokai", line_numbers=True)
-                console.print(syntax)
+                console.print(Syntax(
+                    content,
+                    hcl_lexer,
+                    theme=hcl_theme,
+                    line_numbers=len(content) <= _PREVIEW_LINE_NUMBERS_MAX_CHARS,
+                ))
                 console.print()
+                console.file.flush()
 
             console.print(f"\n[dim]Directory: {terraform.get_directory_name()}[/dim]")
             console.print("[dim]This is a dry-run - no files were created or PRs opened[/dim]")
@@ -327,34 +922,50 @@ def dry_run(request: str, verbose: bool):
             console.print(f"\n[bold red]Terraform Generation Error:[/bold red] {str(e)}")
             raise click.Abort()
 
-    except ConfigurationError as e:
-        console.print(f"\n[bold red]Configuration Error:[/bold red] {str(e)}")
-        console.print("\n[yellow]Fix:[/yellow] Ensure ANTHROPIC_API_KEY is set in your .env file")
-        raise click.Abort()
 
-    except PolicyValidationError as e:
-        console.print(f"\n[bold red]Policy Validation Failed:[/bold red]")
-        console.print(f"\nYour request violates {len(e.violations)} organizational policy/policies:\n")
-        for i, violation in enumerate(e.violations, 1):
-            console.print(f"  {i}. {violation}")
-        raise click.Abort()
+@cli.command()
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+def provision_batch(file_path: str, verbose: bool):
+    """
+    Provision several requests from a file, one request per line.
 
-    except ParsingError as e:
-        console.print(f"\n[bold red]Parsing Error:[/bold red] {str(e)}")
-        console.print("\n[yellow]Tip:[/yellow] Try rephrasing your request with more details")
-        raise click.Abort()
+    All requests are parsed by Claude concurrently; each request that
+    parses and passes policy validation then gets its Terraform code
+    generated and its own GitHub pull request.
 
-    except APIError as e:
-        console.print(f"\n[bold red]API Error:[/bold red] {str(e)}")
-        raise click.Abort()
+    \b
+    Examples:
+      infrallm provision-batch requests.txt
+      infrallm provision-batch requests.txt --verbose
 
-    except Exception as e:
-        console.print(f"\n[bold red]Unexpected Error:[/bold red] {str(e)}")
-        if verbose:
-            import traceback
-            console.print("\n[dim]" + traceback.format_exc() + "[/dim]")
+    \b
+    Blank lines and lines starting with # are ignored. A failed request
+    is reported and skipped; the rest of the batch still runs.
+    """
+    from pathlib import Path
+    from rich.panel import Panel
+
+    console = _get_console()
+
+    lines = [
+        line.strip() for line in Path(file_path).read_text().splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    if not lines:
+        console.print(f"[bold red]Error:[/bold red] No requests found in {file_path}")
         raise click.Abort()
 
+    console.print(Panel.fit(
+        f"[bold cyan]Provisioning Batch[/bold cyan]\n\n{len(lines)} request(s) from {file_path}",
+        border_style="cyan"
+    ))
+
+    _require_installed("anthropic", "pydantic")
+
+    with closing(_Clients()) as clients:
+        _provision_many(console, clients, lines, verbose)
+
 
 @cli.command()
 def configure():
@@ -381,6 +992,9 @@ def configure():
     """
     from pathlib import Path
     import os
+    from rich.panel import Panel
+
+    console = _get_console()
 
     console.print(Panel.fit(
         "[bold green]InfraLLM Configuration Wizard[/bold green]\n\n"
@@ -395,11 +1009,7 @@ def configure():
         # Load existing configuration if .env exists
         if env_path.exists():
             console.print("\n[yellow]Found existing .env file. Current values will be shown as defaults.[/yellow]")
-            with open(env_path) as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#') and '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        existing_config[key] = value
+            existing_config = _read_env_file(env_path)
 
         console.print("\n[bold cyan]Step 1: Anthropic API Configuration[/bold cyan]")
         console.print("Get your API key from: https://console.anthropic.com/settings/keys\n")
@@ -452,32 +1062,24 @@ def configure():
         # Verify configuration
         console.print("\n[bold yellow]Verifying Configuration...[/bold yellow]")
 
-        # Test Anthropic API
-        try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=anthropic_key)
-            # Simple test - just creating the client is enough
-            console.print("✓ Anthropic API key format looks valid")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Warning: Could not verify Anthropic API key: {str(e)}[/yellow]")
-
-        # Test GitHub connection
-        try:
-            from github import Github
-            gh = Github(github_token)
-            user = gh.get_user()
-            console.print(f"✓ GitHub authenticated as: {user.login}")
+        # The checks are independent, so run them at the same time and
+        # report them in a fixed order once they're all done
+        from concurrent.futures import ThreadPoolExecutor
 
-            # Try to access the repository
-            try:
-                repo = gh.get_repo(f"{github_org}/{github_repo}")
-                console.print(f"✓ Repository accessible: {repo.full_name}")
-            except Exception as e:
-                console.print(f"[yellow]⚠ Warning: Repository '{github_org}/{github_repo}' not accessible: {str(e)}[/yellow]")
-                console.print("[yellow]  Make sure the repository exists and your token has access[/yellow]")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            anthropic_check = executor.submit(_check_anthropic_key, anthropic_key)
+            github_user_check = executor.submit(_check_github_user, github_token)
+            github_repo_check = executor.submit(
+                _check_github_repo, github_token, github_org, github_repo
+            )
 
-        except Exception as e:
-            console.print(f"[yellow]⚠ Warning: Could not verify GitHub connection: {str(e)}[/yellow]")
+        console.print(anthropic_check.result())
+
+        user_message, user_ok = github_user_check.result()
+        console.print(user_message)
+        if user_ok:
+            for message in github_repo_check.result():
+                console.print(message)
 
         # Write configuration
         console.print("\n[bold cyan]Writing Configuration...[/bold cyan]")
@@ -497,8 +1099,17 @@ GITHUB_REPO={github_repo}
 DEFAULT_ENVIRONMENT={default_env}
 """
 
-        env_path.write_text(env_content)
-        console.print(f"✓ Configuration saved to {env_path.absolute()}")
+        if env_path.exists() and env_path.read_text() == env_content:
+            console.print(f"✓ Configuration unchanged in {env_path.absolute()}")
+        else:
+            # Write a temporary file and rename it over .env, so an
+            # interrupted write never leaves a truncated .env behind
+            tmp_path = env_path.with_name(env_path.name + ".tmp")
+            tmp_path.write_text(env_content)
+            if env_path.exists():
+                os.chmod(tmp_path, env_path.stat().st_mode & 0o777)
+            os.replace(tmp_path, env_path)
+            console.print(f"✓ Configuration saved to {env_path.absolute()}")
 
         # Security reminder
         console.print("\n[bold yellow]Security Reminder:[/bold yellow]")
@@ -516,8 +1127,7 @@ DEFAULT_ENVIRONMENT={default_env}
         raise
     except Exception as e:
         console.print(f"\n[bold red]Error during configuration:[/bold red] {str(e)}")
-        import traceback
-        console.print(f"\n[dim]{traceback.format_exc()}[/dim]")
+        console.print(f"\n[dim]{_format_traceback(e)}[/dim]")
         raise click.Abort()
 
 
@@ -547,9 +1157,11 @@ def validate(file_path: str, verbose: bool):
     \b
     Use --verbose to see all passed checks in addition to violations.
     """
-    from pathlib import Path
     from src.config.loader import load_policies
     from rich.table import Table
+    from rich.panel import Panel
+
+    console = _get_console()
 
     console.print(Panel.fit(
         f"[bold blue]Validating Terraform Code[/bold blue]\n\n{file_path}",
@@ -560,11 +1172,16 @@ def validate(file_path: str, verbose: bool):
         # Load policies
         policies = load_policies()
 
-        # Read Terraform file
-        file_content = Path(file_path).read_text()
+        required_tags = policies.get('tags', {}).get('required', [])
+
+        # Checks run on the raw bytes, so the file is never decoded
+        with open(file_path, 'rb') as f:
+            data = f.read()
 
         console.print(f"\n[bold]File:[/bold] {file_path}")
-        console.print(f"[bold]Size:[/bold] {len(file_content)} bytes\n")
+        console.print(f"[bold]Size:[/bold] {len(data)} bytes\n")
+
+        hits = _run_policy_checks(data, required_tags)
 
         # Validation checks
         violations = []
@@ -573,10 +1190,9 @@ def validate(file_path: str, verbose: bool):
 
         # Check 1: Required tags
         console.print("[bold cyan]Checking Required Tags...[/bold cyan]")
-        required_tags = policies.get('tags', {}).get('required', [])
 
-        for tag in required_tags:
-            if f'{tag} =' in file_content or f'{tag}=' in file_content:
+        for index, tag in enumerate(required_tags):
+            if f'tag_{index}' in hits:
                 passes.append(f"✓ Required tag present: {tag}")
             else:
                 violations.append(f"✗ Missing required tag: {tag}")
@@ -584,31 +1200,31 @@ def validate(file_path: str, verbose: bool):
         # Check 2: Encryption settings
         console.print("[bold cyan]Checking Security Settings...[/bold cyan]")
 
-        if 's3_bucket' in file_content or 'aws_s3_bucket' in file_content:
+        if 's3' in hits:
             # S3-specific checks
-            if 'server_side_encryption' in file_content or 'encryption' in file_content:
+            if 'encryption' in hits:
                 passes.append("✓ S3: Encryption configuration found")
             else:
                 violations.append("✗ S3: No encryption configuration found")
 
-            if 'public_access_block' in file_content:
+            if 'public_access_block' in hits:
                 passes.append("✓ S3: Public access block configured")
             else:
                 warnings.append("⚠ S3: Public access block not found")
 
-            if 'versioning' in file_content:
+            if 'versioning' in hits:
                 passes.append("✓ S3: Versioning configured")
             else:
                 warnings.append("⚠ S3: Versioning not configured")
 
-        if 'db_instance' in file_content or 'aws_db_instance' in file_content:
+        if 'rds' in hits:
             # RDS-specific checks
-            if 'storage_encrypted = true' in file_content or 'storage_encrypted=true' in file_content:
+            if 'rds_encryption' in hits:
                 passes.append("✓ RDS: Storage encryption enabled")
             else:
                 violations.append("✗ RDS: Storage encryption not enabled")
 
-            if 'backup_retention_period' in file_content:
+            if 'backup_retention' in hits:
                 passes.append("✓ RDS: Backup retention configured")
             else:
                 violations.append("✗ RDS: Backup retention not configured")
@@ -621,7 +1237,7 @@ def validate(file_path: str, verbose: bool):
             console.print(f"[dim]Expected pattern: {naming_pattern}[/dim]")
             # This is a basic check - just verify the pattern components are mentioned
             if '{environment}' in naming_pattern:
-                if any(env in file_content for env in ['prod', 'staging', 'dev']):
+                if 'environment' in hits:
                     passes.append("✓ Naming: Environment identifier found")
                 else:
                     warnings.append("⚠ Naming: No environment identifier found")
@@ -629,8 +1245,8 @@ def validate(file_path: str, verbose: bool):
         # Check 4: ManagedBy tag
         console.print("[bold cyan]Checking Management Tags...[/bold cyan]")
 
-        if 'ManagedBy' in file_content:
-            if 'terraform' in file_content.lower():
+        if 'managed_by' in hits:
+            if 'terraform' in hits:
                 passes.append("✓ ManagedBy tag indicates Terraform management")
             else:
                 warnings.append("⚠ ManagedBy tag present but value unclear")
@@ -696,8 +1312,7 @@ def validate(file_path: str, verbose: bool):
     except Exception as e:
         console.print(f"\n[bold red]Validation Error:[/bold red] {str(e)}")
         if verbose:
-            import traceback
-            console.print(f"\n[dim]{traceback.format_exc()}[/dim]")
+            console.print(f"\n[dim]{_format_traceback(e)}[/dim]")
         raise click.Abort()
 
 
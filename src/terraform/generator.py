@@ -6,12 +6,15 @@ using Jinja2 templates.
 """
 
 import os
-from datetime import datetime
+import logging
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 
 import jinja2
-from jinja2 import Template, Environment, FileSystemLoader, TemplateError
+from jinja2 import Template, Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateError
 
 from src.terraform.models import GeneratedTerraform
 from src.terraform.exceptions import TerraformGenerationError
@@ -22,6 +25,166 @@ from src.terraform.validator import (
     validate_vpc_parameters
 )
 from src.config.loader import load_policies
+from src.config.paths import user_cache_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the user cache directory holding compiled template
+# bytecode; override the full path with INFRALLM_JINJA_CACHE_DIR
+JINJA_CACHE_SUBDIR = "jinja"
+
+# Supported resource types and the validator for each one's parameters
+_PARAMETER_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    's3': validate_s3_parameters,
+    'eks': validate_eks_parameters,
+    'rds': validate_rds_parameters,
+    'vpc': validate_vpc_parameters
+}
+
+
+def terraform_map(mapping: Dict[str, Any], indent: int = 4) -> str:
+    """
+    Render map entries with `=` aligned the way terraform fmt aligns them.
+
+    Each entry is emitted on its own line, preceded by a newline, so the
+    filter can be placed directly after an opening brace.
+
+    Args:
+        mapping: Keys and string values to render
+        indent: Number of spaces before each key
+
+    Returns:
+        Rendered entries, or an empty string for an empty mapping
+    """
+    if not mapping:
+        return ""
+    width = max(len(str(key)) for key in mapping)
+    padding = " " * indent
+    return "".join(
+        f'\n{padding}{str(key).ljust(width)} = "{value}"'
+        for key, value in mapping.items()
+    )
+
+
+def terraform_bool(value: Any) -> str:
+    """Render a value as a Terraform boolean literal."""
+    return 'true' if value else 'false'
+
+
+def sanitize_identifier(name: str) -> str:
+    """
+    Turn a resource name into a valid Terraform identifier.
+
+    Terraform identifiers don't allow hyphens, so they become underscores.
+    A single-character str.replace is a C-level scan, faster than
+    str.translate for this one substitution.
+
+    Args:
+        name: Resource name, possibly containing hyphens
+
+    Returns:
+        Name with hyphens replaced by underscores
+    """
+    return name.replace('-', '_')
+
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that creates its directory on the first write."""
+
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not write template bytecode cache: {e}")
+            return
+        super().dump_bytecode(bucket)
+
+
+def _get_bytecode_cache() -> FileSystemBytecodeCache:
+    """
+    Get the on-disk cache of compiled templates.
+
+    Lets a fresh process load compiled templates instead of parsing and
+    compiling every template again. Each entry is checked against a
+    checksum of its template source, so edited templates are recompiled.
+    The cache lives in the user cache directory, which is only created
+    once a template is compiled.
+
+    Returns:
+        Bytecode cache
+    """
+    override = os.getenv("INFRALLM_JINJA_CACHE_DIR")
+    if override:
+        cache_dir = Path(override).expanduser()
+    else:
+        cache_dir = user_cache_dir() / JINJA_CACHE_SUBDIR
+    return _LazyBytecodeCache(str(cache_dir))
+
+
+# Serializes first-time environment creation; lru_cache alone would let
+# two threads each build an environment for the same directory
+_environment_lock = threading.Lock()
+
+# (templates directory, resource type) -> loaded templates, shared by every
+# generator so one constructed per request still reuses them
+_loaded_templates: Dict[Tuple[str, str], Dict[str, Template]] = {}
+
+
+def _list_directory(directory: Path) -> Set[str]:
+    """
+    List the names of the files in a directory with one directory read.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Names of the regular files in the directory, empty if it doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _get_environment(templates_dir: str) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    Every TerraformGenerator for the same directory shares one environment,
+    and with it the compiled templates. Templates ship with the package and
+    don't change while a process runs, so they are kept without
+    re-checking the template files on every lookup.
+
+    Args:
+        templates_dir: Directory containing the templates
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    with _environment_lock:
+        return _create_environment(templates_dir)
+
+
+@lru_cache(maxsize=None)
+def _create_environment(templates_dir: str) -> Environment:
+    """Create the Jinja2 environment for a template directory; see _get_environment()."""
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_get_bytecode_cache()
+    )
+
+    # Add custom filters
+    env.filters['terraform_bool'] = terraform_bool
+    env.filters['sanitize_identifier'] = sanitize_identifier
+    env.filters['terraform_map'] = terraform_map
+    return env
 
 
 class TerraformGenerator:
@@ -73,16 +236,7 @@ class TerraformGenerator:
         self.templates_dir = templates_dir
 
         # Set up Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True
-        )
-
-        # Add custom filters
-        self.env.filters['terraform_bool'] = lambda x: 'true' if x else 'false'
-        self.env.filters['sanitize_identifier'] = lambda x: x.replace('-', '_')
+        self.env = _get_environment(str(templates_dir))
 
     def generate(self, requirements: Dict[str, Any]) -> GeneratedTerraform:
         """
@@ -125,28 +279,20 @@ class TerraformGenerator:
         resource_type = requirements['resource_type']
 
         # Step 2: Validate resource type is supported
-        supported_types = ['s3', 'eks', 'rds', 'vpc']
-        if resource_type not in supported_types:
+        validation_func = _PARAMETER_VALIDATORS.get(resource_type)
+        if validation_func is None:
             raise TerraformGenerationError(
                 f"Unsupported resource type '{resource_type}'. "
-                f"Supported types: {', '.join(supported_types)}"
+                f"Supported types: {', '.join(_PARAMETER_VALIDATORS)}"
             )
 
         # Step 3: Validate parameters for this resource type
-        validation_func = {
-            's3': validate_s3_parameters,
-            'eks': validate_eks_parameters,
-            'rds': validate_rds_parameters,
-            'vpc': validate_vpc_parameters
-        }.get(resource_type)
-
-        if validation_func:
-            param_errors = validation_func(requirements.get('parameters', {}))
-            if param_errors:
-                raise TerraformGenerationError(
-                    f"Invalid parameters for {resource_type}:\n" +
-                    "\n".join(f"  - {err}" for err in param_errors)
-                )
+        param_errors = validation_func(requirements.get('parameters', {}))
+        if param_errors:
+            raise TerraformGenerationError(
+                f"Invalid parameters for {resource_type}:\n" +
+                "\n".join(f"  - {err}" for err in param_errors)
+            )
 
         # Step 4: Load templates
         try:
@@ -189,6 +335,9 @@ class TerraformGenerator:
             resource_name=requirements['resource_name'],
             environment=requirements['environment'],
             files=files,
+            # Templates are kept in terraform fmt layout and map entries are
+            # aligned at render time, so the output needs no reformatting
+            formatted=True,
             metadata={
                 'timestamp': context['generated_at'],
                 'policy_version': '1.0',
@@ -202,7 +351,9 @@ class TerraformGenerator:
         Load Jinja2 templates for the specified resource type.
 
         Loads both resource-specific templates (main.tf.j2, variables.tf.j2, outputs.tf.j2)
-        and common templates (provider.tf.j2, backend.tf.j2).
+        and common templates (provider.tf.j2, backend.tf.j2). Templates are
+        loaded once per template directory and resource type, across all
+        generators; later calls skip the file checks and environment lookups.
 
         Args:
             resource_type: Type of resource (s3, eks, rds, vpc)
@@ -214,15 +365,20 @@ class TerraformGenerator:
             FileNotFoundError: If required templates are missing
             TemplateError: If template loading fails
         """
+        cache_key = (str(self.templates_dir), resource_type)
+        templates = _loaded_templates.get(cache_key)
+        if templates is not None:
+            return templates
+
         templates = {}
 
         # Load resource-specific templates
-        resource_dir = Path(self.templates_dir) / resource_type
+        resource_dir = self.templates_dir / resource_type
+        available = _list_directory(resource_dir)
         for template_file in ['main.tf.j2', 'variables.tf.j2', 'outputs.tf.j2']:
-            template_path = resource_dir / template_file
-            if not template_path.exists():
+            if template_file not in available:
                 raise FileNotFoundError(
-                    f"Required template not found: {template_path}"
+                    f"Required template not found: {resource_dir / template_file}"
                 )
 
             # Load template using Jinja2 environment
@@ -230,17 +386,18 @@ class TerraformGenerator:
             templates[template_file.replace('.j2', '')] = self.env.get_template(template_name)
 
         # Load common templates
-        common_dir = Path(self.templates_dir) / '_common'
+        common_dir = self.templates_dir / '_common'
+        available = _list_directory(common_dir)
         for template_file in ['provider.tf.j2', 'backend.tf.j2']:
-            template_path = common_dir / template_file
-            if not template_path.exists():
+            if template_file not in available:
                 raise FileNotFoundError(
-                    f"Required common template not found: {template_path}"
+                    f"Required common template not found: {common_dir / template_file}"
                 )
 
             template_name = f"_common/{template_file}"
             templates[template_file.replace('.j2', '')] = self.env.get_template(template_name)
 
+        _loaded_templates[cache_key] = templates
         return templates
 
     def _prepare_context(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
@@ -252,6 +409,7 @@ class TerraformGenerator:
         - VPC variable references (for EKS, RDS)
         - Generation timestamp
         - Sanitized resource name for Terraform identifiers
+        - Tag entries pre-rendered as HCL (tags_hcl)
 
         Args:
             requirements: Raw requirements from Claude API
@@ -259,29 +417,30 @@ class TerraformGenerator:
         Returns:
             Enhanced context dictionary ready for template rendering
         """
-        context = requirements.copy()
-
         # Add organization name from config
         try:
             policies = load_policies()
-            org_name = policies.get('organization', {}).get('name', 'your-organization')
-            context['organization'] = org_name.lower().replace(' ', '-')
+            organization = policies.get('organization', {}).get('name', 'your-organization')
+            organization = organization.lower().replace(' ', '-')
         except Exception:
             # Fallback if policies can't be loaded
-            context['organization'] = 'your-organization'
-
-        # Add VPC references for resources that need them
-        if requirements['resource_type'] in ['eks', 'rds']:
-            context['needs_vpc'] = True
-        else:
-            context['needs_vpc'] = False
-
-        # Add timestamp
-        context['generated_at'] = datetime.utcnow().isoformat()
-
-        # Add sanitized resource name for Terraform identifiers
-        # Terraform identifiers don't allow hyphens, so convert to underscores
-        context['tf_resource_name'] = requirements['resource_name'].replace('-', '_')
+            organization = 'your-organization'
+
+        # The computed values are laid over the requirements in a single
+        # dict. A ChainMap would be flattened into a new dict by every
+        # Template.render() call anyway.
+        context = {
+            **requirements,
+            'organization': organization,
+            # Add VPC references for resources that need them
+            'needs_vpc': requirements['resource_type'] in ('eks', 'rds'),
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            # Add sanitized resource name for Terraform identifiers
+            'tf_resource_name': sanitize_identifier(requirements['resource_name']),
+            # Tag entries rendered once here rather than by every template
+            # that lists them
+            'tags_hcl': terraform_map(requirements['tags']),
+        }
 
         return context
 
@@ -300,8 +459,9 @@ class TerraformGenerator:
             TemplateError: If rendering fails
         """
         try:
-            rendered = template.render(**context)
-            return rendered
+            # Passing the mapping itself skips building a kwargs dict that
+            # render() would only copy again
+            return template.render(context)
         except TemplateError as e:
             # Re-raise Jinja2 errors with context
             raise TemplateError(f"Error rendering template: {str(e)}")
@@ -21,6 +21,7 @@ class GeneratedTerraform:
         environment: Target environment (dev, staging, prod)
         files: Dictionary mapping filenames to their contents
         metadata: Additional metadata (generation timestamp, versions, etc.)
+        formatted: True if files are already in terraform fmt canonical form
 
     Example:
         >>> terraform = GeneratedTerraform(
@@ -43,6 +44,7 @@ class GeneratedTerraform:
     environment: str
     files: Dict[str, str]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    formatted: bool = False
 
     def get_file(self, filename: str) -> str:
         """
@@ -75,13 +77,16 @@ class GeneratedTerraform:
             >>> print(paths)
             [PosixPath('output/main.tf'), PosixPath('output/variables.tf'), ...]
         """
-        directory = Path(directory)
+        if not isinstance(directory, Path):
+            directory = Path(directory)
         directory.mkdir(parents=True, exist_ok=True)
 
         created_paths = []
         for filename, content in self.files.items():
             file_path = directory / filename
-            file_path.write_text(content)
+            # Encoded once, explicitly, so files are UTF-8 whatever the
+            # locale and go out in a single binary write
+            file_path.write_bytes(content.encode('utf-8'))
             created_paths.append(file_path)
 
         return created_paths
@@ -93,18 +98,19 @@ class GeneratedTerraform:
         Returns:
             Formatted string suitable for terminal display
         """
-        lines = []
-        lines.append(f"Resource: {self.resource_type}")
-        lines.append(f"Name: {self.resource_name}")
-        lines.append(f"Environment: {self.environment}")
-        lines.append(f"Files: {', '.join(self.files.keys())}")
-        lines.append("")
+        lines = [
+            f"Resource: {self.resource_type}",
+            f"Name: {self.resource_name}",
+            f"Environment: {self.environment}",
+            f"Files: {', '.join(self.files)}",
+            "",
+        ]
 
         for filename, content in self.files.items():
-            lines.append(f"=== {filename} ===")
-            lines.append(content)
-            lines.append("")
+            lines.extend((f"=== {filename} ===", content, ""))
 
+        # File contents are only referenced by the list; join copies each
+        # of them exactly once
         return "\n".join(lines)
 
     def get_directory_name(self) -> str:
@@ -5,9 +5,35 @@ This module validates that infrastructure requirements have all necessary
 parameters for template rendering, catching errors before template generation.
 """
 
+import operator
 from typing import Dict, Any, List
 
 
+# Required parameters per resource type. Missing ones are found with one
+# set difference and reported in sorted order.
+_S3_REQUIRED = frozenset({'versioning', 'encryption', 'public_access_block'})
+_RDS_REQUIRED = frozenset({
+    'engine',
+    'engine_version',
+    'instance_class',
+    'allocated_storage',
+    'backup_retention_period',
+    'storage_encrypted'
+})
+_VPC_REQUIRED = frozenset({'cidr_block', 'enable_dns_hostnames', 'enable_dns_support'})
+
+# Required fields of each EKS node group, and the subset used for scaling
+_NODE_GROUP_REQUIRED = frozenset({'name', 'instance_types', 'desired_size', 'min_size', 'max_size'})
+_NODE_GROUP_SIZE_FIELDS = frozenset({'desired_size', 'min_size', 'max_size'})
+
+# Bounds on a node group's desired_size, as (bound field, comparison that
+# puts desired_size out of bounds, wording for the error)
+_NODE_GROUP_SIZE_CHECKS = (
+    ('min_size', operator.lt, 'less than'),
+    ('max_size', operator.gt, 'greater than'),
+)
+
+
 def validate_s3_parameters(params: Dict[str, Any]) -> List[str]:
     """
     Validate S3 parameters have all required fields for template rendering.
@@ -24,12 +50,10 @@ def validate_s3_parameters(params: Dict[str, Any]) -> List[str]:
         >>> print(errors)
         ['Missing required S3 parameter: public_access_block']
     """
-    errors = []
-    required = ['versioning', 'encryption', 'public_access_block']
-
-    for field in required:
-        if field not in params:
-            errors.append(f"Missing required S3 parameter: {field}")
+    errors = [
+        f"Missing required S3 parameter: {field}"
+        for field in sorted(_S3_REQUIRED.difference(params))
+    ]
 
     # Validate encryption value
     if 'encryption' in params:
@@ -70,28 +94,27 @@ def validate_eks_parameters(params: Dict[str, Any]) -> List[str]:
     else:
         # Validate each node group
         for i, ng in enumerate(params['node_groups']):
-            required_ng_fields = ['name', 'instance_types', 'desired_size', 'min_size', 'max_size']
-            for field in required_ng_fields:
-                if field not in ng:
-                    errors.append(f"Node group {i} ('{ng.get('name', 'unnamed')}'): missing required field '{field}'")
+            # The missing fields found here also gate the checks below, so
+            # each field's presence is tested once
+            missing = _NODE_GROUP_REQUIRED.difference(ng)
+            errors.extend(
+                f"Node group {i} ('{ng.get('name', 'unnamed')}'): missing required field '{field}'"
+                for field in sorted(missing)
+            )
 
             # Validate scaling configuration
-            if all(field in ng for field in ['desired_size', 'min_size', 'max_size']):
-                if ng['desired_size'] < ng['min_size']:
-                    errors.append(
-                        f"Node group {i} ('{ng.get('name', 'unnamed')}'): "
-                        f"desired_size ({ng['desired_size']}) cannot be less than "
-                        f"min_size ({ng['min_size']})"
-                    )
-                if ng['desired_size'] > ng['max_size']:
-                    errors.append(
-                        f"Node group {i} ('{ng.get('name', 'unnamed')}'): "
-                        f"desired_size ({ng['desired_size']}) cannot be greater than "
-                        f"max_size ({ng['max_size']})"
-                    )
+            if missing.isdisjoint(_NODE_GROUP_SIZE_FIELDS):
+                desired_size = ng['desired_size']
+                for bound_field, fails, wording in _NODE_GROUP_SIZE_CHECKS:
+                    if fails(desired_size, ng[bound_field]):
+                        errors.append(
+                            f"Node group {i} ('{ng.get('name', 'unnamed')}'): "
+                            f"desired_size ({desired_size}) cannot be {wording} "
+                            f"{bound_field} ({ng[bound_field]})"
+                        )
 
             # Validate instance_types is a list
-            if 'instance_types' in ng and not isinstance(ng['instance_types'], list):
+            if 'instance_types' not in missing and not isinstance(ng['instance_types'], list):
                 errors.append(
                     f"Node group {i} ('{ng.get('name', 'unnamed')}'): "
                     f"instance_types must be a list"
@@ -121,22 +144,11 @@ def validate_rds_parameters(params: Dict[str, Any]) -> List[str]:
     Returns:
         List of error messages (empty if valid)
     """
-    errors = []
-    required = [
-        'engine',
-        'engine_version',
-        'instance_class',
-        'allocated_storage',
-        'backup_retention_period',
-        'storage_encrypted'
+    return [
+        f"Missing required RDS parameter: {field}"
+        for field in sorted(_RDS_REQUIRED.difference(params))
     ]
 
-    for field in required:
-        if field not in params:
-            errors.append(f"Missing required RDS parameter: {field}")
-
-    return errors
-
 
 def validate_vpc_parameters(params: Dict[str, Any]) -> List[str]:
     """
@@ -151,11 +163,7 @@ def validate_vpc_parameters(params: Dict[str, Any]) -> List[str]:
     Returns:
         List of error messages (empty if valid)
     """
-    errors = []
-    required = ['cidr_block', 'enable_dns_hostnames', 'enable_dns_support']
-
-    for field in required:
-        if field not in params:
-            errors.append(f"Missing required VPC parameter: {field}")
-
-    return errors
+    return [
+        f"Missing required VPC parameter: {field}"
+        for field in sorted(_VPC_REQUIRED.difference(params))
+    ]
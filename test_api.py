@@ -4,6 +4,8 @@ Quick diagnostic script to test Anthropic API connection and available models.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import anthropic
 
 # Load API key
@@ -45,12 +47,11 @@ models_to_try = [
 
 client = anthropic.Anthropic(api_key=api_key)
 
-print("Testing models...")
-print("=" * 60)
 
-for model in models_to_try:
+def try_model(model):
+    """Send a tiny request to a model; return the lines to print and whether to stop."""
+    lines = [f"\nTrying: {model}"]
     try:
-        print(f"\nTrying: {model}")
         response = client.messages.create(
             model=model,
             max_tokens=10,
@@ -58,19 +59,33 @@ for model in models_to_try:
                 {"role": "user", "content": "Hello"}
             ]
         )
-        print(f"✓ SUCCESS! Model '{model}' is available")
-        print(f"  Response: {response.content[0].text}")
-        break  # Stop after first success
+        lines.append(f"✓ SUCCESS! Model '{model}' is available")
+        lines.append(f"  Response: {response.content[0].text}")
+        return lines, True  # Stop after first success
     except anthropic.NotFoundError as e:
-        print(f"  ❌ Not found: {model}")
+        lines.append(f"  ❌ Not found: {model}")
     except anthropic.AuthenticationError as e:
-        print(f"  ❌ Authentication error: {e}")
-        print("  Your API key may not have access to the Messages API")
-        break
+        lines.append(f"  ❌ Authentication error: {e}")
+        lines.append("  Your API key may not have access to the Messages API")
+        return lines, True
     except anthropic.PermissionDeniedError as e:
-        print(f"  ❌ Permission denied: {e}")
+        lines.append(f"  ❌ Permission denied: {e}")
     except Exception as e:
-        print(f"  ❌ Error: {type(e).__name__}: {e}")
+        lines.append(f"  ❌ Error: {type(e).__name__}: {e}")
+    return lines, False
+
+
+print("Testing models...")
+print("=" * 60)
+
+# Probe every model at once, then report in list order up to the first
+# model that works (or an authentication failure)
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = executor.map(try_model, models_to_try)
+    for lines, stop in results:
+        print("\n".join(lines))
+        if stop:
+            break
 
 print("\n" + "=" * 60)
 print("\nSDK Info:")